@@ -0,0 +1,238 @@
+"""Benchmark the latency and throughput of the domain operations the game
+screens rely on, against both an in-memory and an on-disk SQLite database.
+
+Each operation is timed call by call, and the results are summarised as the
+mean, median, 95th percentile and worst latency along with the number of
+calls per second. The results can be saved as JSON and compared against a
+previous run, reporting each operation whose median or 95th percentile
+latency has grown by more than a threshold:
+
+    python -m benchmarks.bench_domain --output before.json
+    ... make changes ...
+    python -m benchmarks.bench_domain --output after.json --compare before.json
+
+The command exits with status 1 when a regression is found.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import models
+from kanoodlegenius2d.domain import transposition
+from kanoodlegenius2d.domain.models import Board, Game, Level, Noodle, Player, Puzzle
+
+BACKENDS = ('memory', 'disk')
+
+# The number of times each operation is run per backend.
+REPEATS = 50
+
+# The increase in median or 95th percentile latency, in milliseconds, that
+# counts as a regression. Players notice a delay of 10ms on the kiosks, which
+# are several times slower than a typical development machine.
+THRESHOLD_MS = 2.0
+
+
+def run(backend, repeats=REPEATS):
+    """Run every benchmark against a fresh database.
+
+    Args:
+        backend: Either 'memory' or 'disk'.
+        repeats: The number of times to run each operation.
+    Returns:
+        A dictionary of the summary of each operation's timings, keyed by operation name.
+    """
+    directory = tempfile.mkdtemp()
+    models.database.init(':memory:' if backend == 'memory' else os.path.join(directory, 'bench.db'))
+    models.database.connect()
+    data.setup()
+    transposition.clear()
+
+    try:
+        timings = {}
+        timings['Game.start'] = _time_start(repeats)
+        timings['Board.place'], timings['Board.undo'], timings['Board.redo'] = _time_moves(repeats)
+        (timings['Board.place (deferred)'], timings['Board.undo (deferred)'],
+         timings['Board.redo (deferred)']) = _time_moves(repeats, deferred=True)
+        timings['Board.solve'] = _time_solve(repeats)
+        timings['Player.puzzles_completed'] = _time_puzzles_completed(repeats)
+        timings['Puzzle.next_puzzle'] = _time_next_puzzle(repeats)
+    finally:
+        models.shutdown()
+        shutil.rmtree(directory)
+
+    return {operation: summarise(times) for operation, times in timings.items()}
+
+
+def summarise(times):
+    """Summarise a list of timings.
+
+    Args:
+        times: A list of the time in seconds taken by each call.
+    Returns:
+        A dictionary of the number of calls, their mean, median, 95th
+        percentile and worst latency in milliseconds, and the calls per second.
+    """
+    ordered = sorted(times)
+    total = sum(ordered)
+
+    return {
+        'calls': len(ordered),
+        'mean_ms': total / len(ordered) * 1000,
+        'median_ms': ordered[len(ordered) // 2] * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'max_ms': ordered[-1] * 1000,
+        'per_second': len(ordered) / total if total else 0,
+    }
+
+
+def compare(previous, current, threshold_ms=THRESHOLD_MS):
+    """Find the operations whose latency has grown between two runs.
+
+    Args:
+        previous: The results of the earlier run, as saved by main().
+        current: The results of the later run.
+        threshold_ms: The increase in latency that counts as a regression.
+    Returns:
+        A list of strings describing each regression.
+    """
+    regressions = []
+
+    for backend, operations in current['results'].items():
+        for operation, summary in operations.items():
+            before = previous['results'].get(backend, {}).get(operation)
+            if before is None:
+                continue
+            for measure in ('median_ms', 'p95_ms'):
+                increase = summary[measure] - before[measure]
+                if increase > threshold_ms:
+                    regressions.append('{} {} {}: {:.2f}ms -> {:.2f}ms (+{:.2f}ms)'.format(
+                        backend, operation, measure[:-3], before[measure], summary[measure], increase))
+
+    return regressions
+
+
+def _time(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def _time_start(repeats):
+    return [_time(Game.start, 'bench_start_{}'.format(i))[0] for i in range(repeats)]
+
+
+def _time_moves(repeats, deferred=False):
+    """Place each noodle of the first puzzle's solution, undo them all, redo them all
+    and undo them again, repeatedly, optionally handing the writes to the background writer."""
+    board = Game.start('bench_place_deferred' if deferred else 'bench_place')
+    if deferred:
+        board.defer_writes()
+    noodles = {noodle.designation: noodle for noodle in Noodle.select()}
+    places, undos, redos = [], [], []
+
+    for _ in range(repeats):
+        for placement in board.solve_search()()[0]:
+            noodle = noodles[placement.designation]
+            noodle.part1, noodle.part2, noodle.part3, noodle.part4 = placement.parts
+            places.append(_time(lambda: board.place(noodle, position=placement.position))[0])
+
+        while board.can_undo:
+            undos.append(_time(board.undo)[0])
+
+        while board.can_redo:
+            redos.append(_time(board.redo)[0])
+
+        while board.can_undo:
+            board.undo()
+
+    models.flush()
+
+    return places, undos, redos
+
+
+def _time_solve(repeats):
+    boards = [Game.start('bench_solve_{}'.format(i)) for i in range(repeats)]
+    return [_time(board.solve)[0] for board in boards]
+
+
+def _time_puzzles_completed(repeats):
+    """Time counting the puzzles completed by a player with a board for every puzzle."""
+    board = Game.start('bench_completed')
+    player = board.player
+    puzzle = board.puzzle
+
+    while puzzle is not None:
+        board.solve()
+        puzzle = puzzle.next_puzzle()
+        if puzzle is not None:
+            board = Board.create(player=player, puzzle=puzzle)
+            board.setup()
+
+    player = Player.get(Player.id == player.id)
+
+    return [_time(lambda: player.puzzles_completed)[0] for _ in range(repeats)]
+
+
+def _time_next_puzzle(repeats):
+    puzzles = list(Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number, Puzzle.number))
+    times = []
+
+    while len(times) < repeats:
+        times.extend(_time(puzzle.next_puzzle)[0] for puzzle in puzzles)
+
+    return times[:repeats]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the domain operations of the game.')
+    parser.add_argument('--backend', choices=BACKENDS + ('both',), default='both',
+                        help='The SQLite database to run against (default: both)')
+    parser.add_argument('--repeats', type=int, default=REPEATS,
+                        help='The number of times to run each operation (default: {})'.format(REPEATS))
+    parser.add_argument('--output', help='A file to save the results to, as JSON')
+    parser.add_argument('--compare', help='A file of previous results to compare against')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD_MS,
+                        help='The increase in latency in ms that counts as a regression (default: {})'.format(
+                            THRESHOLD_MS))
+    args = parser.parse_args(argv)
+
+    backends = BACKENDS if args.backend == 'both' else (args.backend,)
+    results = {
+        'created': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeats': args.repeats,
+        'results': {backend: run(backend, args.repeats) for backend in backends},
+    }
+
+    for backend, operations in results['results'].items():
+        print('{}:'.format(backend))
+        for operation, summary in operations.items():
+            print('  {:26s} mean {mean_ms:7.2f}ms  median {median_ms:7.2f}ms  p95 {p95_ms:7.2f}ms  '
+                  'max {max_ms:7.2f}ms  {per_second:9.1f}/s'.format(operation, **summary))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for regression in regressions:
+            print('Regression: {}'.format(regression))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
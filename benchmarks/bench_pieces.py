@@ -0,0 +1,123 @@
+"""Benchmark the solver as the number and size of pieces, and the size of
+the board, grow.
+
+Each instance is built by fitting randomly chosen polyhexes against one
+another until there are enough of them, and taking the board to be the cells
+they cover, so every instance is known to have a solution. The solver is
+timed finding the first one, with and without pruning regions of the board
+that the remaining pieces cannot fill.
+
+Run with:
+
+    python -m benchmarks.bench_pieces
+"""
+
+import random
+import time
+
+from kanoodlegenius2d.domain import orientation
+from kanoodlegenius2d.domain import pieces
+from kanoodlegenius2d.domain import placements
+from kanoodlegenius2d.domain.geometry import Geometry
+from kanoodlegenius2d.domain.solver import Solver
+
+SEED = 3
+INSTANCES = 5
+SIZES = (4, 5, 6)
+COUNTS = (7, 10, 13, 16)
+
+
+def polyhexes(size):
+    """Enumerate every free polyhex of a size - every connected shape of
+    that many cells, counting rotations and reflections as the same shape.
+    """
+    shapes = {((0, 0),)}
+
+    for _ in range(size - 1):
+        grown = set()
+        for cells in shapes:
+            for column, row in cells:
+                for d_column, d_row in orientation.OFFSETS:
+                    cell = (column + d_column, row + d_row)
+                    if cell not in cells:
+                        grown.add(pieces.canonical(cells + (cell,)))
+        shapes = grown
+
+    return sorted(shapes)
+
+
+def instance(piece_set, count, rng):
+    """Fit count randomly chosen and transformed pieces from a set against
+    one another, returning the pieces used and the board they fill.
+    """
+    covered = set()
+    chosen = []
+
+    while len(chosen) < count:
+        piece = rng.choice(piece_set.pieces)
+        cells = pieces.transform(piece.cells, rng.randrange(orientation.TRANSFORMS))
+
+        if covered:
+            # Cover a cell beside those covered, favouring enclosed cells to keep the board compact
+            frontier = sorted({(column + d_column, row + d_row) for column, row in covered
+                               for d_column, d_row in orientation.OFFSETS} - covered)
+            target = max(rng.sample(frontier, min(3, len(frontier))), key=lambda cell: _enclosure(cell, covered))
+            anchor = rng.choice(cells)
+            offset = (target[0] - anchor[0], target[1] - anchor[1])
+        else:
+            offset = (0, 0)
+
+        placed = {(column + offset[0], row + offset[1]) for column, row in cells}
+
+        if not placed & covered:
+            covered |= placed
+            chosen.append(piece._replace(designation='{}{}'.format(piece.designation, len(chosen))))
+
+    return pieces.PieceSet('instance', tuple(chosen)), Geometry(covered)
+
+
+def main():
+    rng = random.Random(SEED)
+
+    for size in SIZES:
+        piece_set = pieces.PieceSet('size {}'.format(size),
+                                    tuple(pieces.from_cells(str(i), '#ffffff', '', cells)
+                                          for i, cells in enumerate(polyhexes(size))))
+        print('{} polyhexes of size {}'.format(len(piece_set.pieces), size))
+
+        for count in COUNTS:
+            build_times, counts = [], []
+            solve_times = {False: [], True: []}
+
+            for _ in range(INSTANCES):
+                used, board = instance(piece_set, count, rng)
+                designations = [piece.designation for piece in used.pieces]
+                counts.append(board.count)
+
+                started = time.perf_counter()
+                table = placements.build(used, board)
+                build_times.append(time.perf_counter() - started)
+
+                for prune, times in solve_times.items():
+                    solver = Solver(used, board, table, prune=prune)
+                    started = time.perf_counter()
+                    solution = solver.solve(0, designations)
+                    times.append(time.perf_counter() - started)
+
+                    if solution is None:
+                        print('  No solution found for an instance of {} pieces'.format(count))
+
+            print('  {:2d} pieces on ~{:3d} holes: build {:6.1f}ms, solve mean {:7.1f}ms (max {:7.1f}ms), '
+                  'pruned mean {:7.1f}ms (max {:7.1f}ms)'.format(
+                      count, sum(counts) // len(counts), sum(build_times) / INSTANCES * 1000,
+                      sum(solve_times[False]) / INSTANCES * 1000, max(solve_times[False]) * 1000,
+                      sum(solve_times[True]) / INSTANCES * 1000, max(solve_times[True]) * 1000))
+
+
+def _enclosure(cell, covered):
+    column, row = cell
+    return sum((column + d_column, row + d_row) in covered for d_column, d_row in orientation.OFFSETS)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the solver across every puzzle in the game.
+
+Run with:
+
+    python -m benchmarks.bench_solver
+"""
+
+import time
+
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import models
+from kanoodlegenius2d.domain import solver
+from kanoodlegenius2d.domain.models import Puzzle
+
+REPEATS = 10
+
+
+def main():
+    models.database.init(':memory:')
+    data.setup()
+
+    timings = []
+
+    for puzzle in Puzzle.select().order_by(Puzzle.id):
+        occupied, designations = puzzle.template()
+        best = None
+
+        for _ in range(REPEATS):
+            started = time.perf_counter()
+            solution = solver.solve(occupied, designations)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+
+        if solution is None:
+            print('Puzzle {}/{}: no solution found'.format(puzzle.number, puzzle.level.number))
+
+        timings.append((best, puzzle))
+
+    timings.sort(key=lambda timing: timing[0])
+    total = sum(t for t, _ in timings)
+    slowest, slowest_puzzle = timings[-1]
+
+    print('Solved {} puzzles in {:.1f}ms'.format(len(timings), total * 1000))
+    print('Mean: {:.2f}ms, median: {:.2f}ms, slowest: {:.2f}ms (puzzle {})'.format(
+        total / len(timings) * 1000, timings[len(timings) // 2][0] * 1000, slowest * 1000, slowest_puzzle.number))
+
+
+if __name__ == '__main__':
+    main()
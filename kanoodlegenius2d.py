@@ -8,6 +8,6 @@ fonts.initialise()
 settings.initialise()
 models.initialise()
 master = MasterScreen()
-master.mainloop()
+master.main_loop()
 
 
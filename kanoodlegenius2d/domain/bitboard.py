@@ -0,0 +1,102 @@
+"""Helper functions for representing hole positions as an integer bitmask.
+
+Bit n of a mask is set when hole n on the board is included, so a whole
+board can be held in a single integer and compared with a single AND.
+"""
+
+from kanoodlegenius2d.domain import geometry
+from kanoodlegenius2d.domain import holes
+
+# A mask with no holes set.
+EMPTY = 0
+
+# A mask with every hole on the board set.
+FULL = (1 << holes.COUNT) - 1
+
+
+def to_mask(positions):
+    """Convert a sequence of hole positions into a bitmask.
+
+    Args:
+        positions: A sequence of hole position integers.
+    Returns:
+        The bitmask with the bit for each position set.
+    """
+    mask = EMPTY
+    for position in positions:
+        mask |= 1 << position
+    return mask
+
+
+def to_positions(mask):
+    """Convert a bitmask into the hole positions it represents.
+
+    Args:
+        mask: The bitmask.
+    Returns:
+        A list of hole position integers in ascending order.
+    """
+    positions = []
+    while mask:
+        low = mask & -mask
+        positions.append(low.bit_length() - 1)
+        mask ^= low
+    return positions
+
+
+def count(mask):
+    """Count the number of holes set in a bitmask.
+
+    Args:
+        mask: The bitmask.
+    Returns:
+        The number of holes set.
+    """
+    return bin(mask).count('1')
+
+
+def neighbours(board):
+    """Build the table of the neighbours of each hole on a board, as bitmasks.
+
+    Args:
+        board: The geometry.Geometry instance of the board.
+    Returns:
+        A tuple of bitmasks, indexed by hole position.
+    """
+    return tuple(to_mask(n for n in board.neighbours[position] if n != geometry.OFF)
+                 for position in range(board.count))
+
+
+def regions(mask, neighbours=None):
+    """Split a bitmask into its connected regions, where two holes are
+    connected if they are neighbours on the board.
+
+    Args:
+        mask: The bitmask.
+        neighbours: Optional sequence of the bitmask of each hole's
+            neighbours on another board (default: the game's board).
+    Returns:
+        A list of bitmasks, one for each connected region, in order of the
+        lowest hole in each region.
+    """
+    neighbours = neighbours or _NEIGHBOURS
+    result = []
+
+    while mask:
+        region = frontier = mask & -mask
+
+        while frontier:
+            grown = EMPTY
+            for position in to_positions(frontier):
+                grown |= neighbours[position]
+            frontier = grown & mask & ~region
+            region |= frontier
+
+        result.append(region)
+        mask &= ~region
+
+    return result
+
+
+# The neighbours of each hole on the board as a bitmask.
+_NEIGHBOURS = neighbours(holes.BOARD)
@@ -4,10 +4,23 @@ from kanoodlegenius2d.domain import orientation
 
 _LOG = logging.getLogger(__name__)
 
+# The noodles (puzzle pieces): designation, colour, image, and the default
+# orientations of each part (excluding the root), relative to one another.
+NOODLES = (
+    ('A', '#00e600', 'light_green_sphere.png', (orientation.E, orientation.NE, orientation.NE, orientation.SE)),
+    ('B', '#ffff00', 'yellow_sphere.png', (orientation.E, orientation.NE, orientation.SE, orientation.NE)),
+    ('C', '#000099', 'dark_blue_sphere.png', (orientation.E, orientation.E, orientation.NE, orientation.NE)),
+    ('D', '#00ccff', 'light_blue_sphere.png', (orientation.E, orientation.E, orientation.NE, orientation.SE)),
+    ('E', '#e60000', 'red_sphere.png', (orientation.NE, orientation.SE, orientation.NE, orientation.SE)),
+    ('F', '#ff00ff', 'pink_sphere.png', (orientation.E, orientation.NE, orientation.SE, orientation.E)),
+    ('G', '#004d00', 'dark_green_sphere.png', (orientation.NE, orientation.SE, orientation.E, orientation.NE)),
+)
+
 
 def setup():
     # To avoid circular dependency
     from kanoodlegenius2d.domain import models
+    from kanoodlegenius2d.domain import pieces
     from kanoodlegenius2d.domain.models import (BaseModel,
                                                 Level,
                                                 Noodle,
@@ -19,41 +32,13 @@ def setup():
             getattr(v, 'create_table')(fail_silently=True)  # Don't error if the tables already exist
 
     # Set up the initial data where is does not already exist
-    Noodle.create(designation='A', colour='#00e600', image='light_green_sphere.png',
-                  part1=orientation.E,
-                  part2=orientation.NE,
-                  part3=orientation.NE,
-                  part4=orientation.SE)
-    Noodle.create(designation='B', colour='#ffff00', image='yellow_sphere.png',
-                  part1=orientation.E,
-                  part2=orientation.NE,
-                  part3=orientation.SE,
-                  part4=orientation.NE)
-    Noodle.create(designation='C', colour='#000099', image='dark_blue_sphere.png',
-                  part1=orientation.E,
-                  part2=orientation.E,
-                  part3=orientation.NE,
-                  part4=orientation.NE)
-    Noodle.create(designation='D', colour='#00ccff', image='light_blue_sphere.png',
-                  part1=orientation.E,
-                  part2=orientation.E,
-                  part3=orientation.NE,
-                  part4=orientation.SE)
-    Noodle.create(designation='E', colour='#e60000', image='red_sphere.png',
-                  part1=orientation.NE,
-                  part2=orientation.SE,
-                  part3=orientation.NE,
-                  part4=orientation.SE)
-    Noodle.create(designation='F', colour='#ff00ff', image='pink_sphere.png',
-                  part1=orientation.E,
-                  part2=orientation.NE,
-                  part3=orientation.SE,
-                  part4=orientation.E)
-    Noodle.create(designation='G', colour='#004d00', image='dark_green_sphere.png',
-                  part1=orientation.NE,
-                  part2=orientation.SE,
-                  part3=orientation.E,
-                  part4=orientation.NE)
+    for piece in pieces.get().pieces:
+        Noodle.create(designation=piece.designation, colour=piece.colour, image=piece.image,
+                      part1=piece.parts[0],
+                      part2=piece.parts[1],
+                      part3=piece.parts[2],
+                      part4=piece.parts[3])
+    Noodle.load_catalogue()
 
     level1 = Level.create(number=1, name='Super Pro')
     level2 = Level.create(number=2, name='Champ')
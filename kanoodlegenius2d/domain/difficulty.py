@@ -0,0 +1,176 @@
+"""Rate the difficulty of puzzles by the effort it takes to solve them.
+
+Each puzzle is searched exhaustively by an instrumented solver, counting the
+board states visited, the dead ends backed out of and the mean number of
+candidate placements at each state. The difficulty score is derived from the
+size of the search:
+
+    score = log2(nodes) + log2(1 + backtracks)
+
+so each doubling of the work done, or of the dead ends met along the way,
+adds 1 to the score. The searches are shared out across a pool of worker
+processes.
+
+Run the module to rate every puzzle in the game, store the ratings in the
+game's database and check that the difficulty of the puzzles increases from
+one to the next. It exits with status 1 when the difficulty falls:
+
+    python -m kanoodlegenius2d.domain.difficulty
+"""
+
+from collections import namedtuple
+import math
+import multiprocessing
+import time
+
+from kanoodlegenius2d.domain import solver
+
+# The effort it took to search for every solution to a puzzle, and the difficulty score derived from it.
+Rating = namedtuple('Rating', 'nodes backtracks branching wall_time score')
+
+
+def rate(occupied, designations):
+    """Rate the difficulty of completing a board.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        A Rating instance.
+    """
+    started = time.perf_counter()
+    stats = solver.search_stats(occupied, designations)
+    wall_time = time.perf_counter() - started
+
+    return Rating(nodes=stats.nodes, backtracks=stats.backtracks, branching=stats.branching, wall_time=wall_time,
+                  score=score(stats.nodes, stats.backtracks))
+
+
+def score(nodes, backtracks):
+    """Derive a difficulty score from the size of a search.
+
+    Args:
+        nodes: The number of board states visited.
+        backtracks: The number of board states that were dead ends.
+    Returns:
+        The score, rounded to 2 decimal places.
+    """
+    return round(math.log2(max(nodes, 1)) + math.log2(1 + backtracks), 2)
+
+
+def rate_all(puzzles, processes=None):
+    """Rate the difficulty of a number of puzzles.
+
+    Args:
+        puzzles: A sequence of Puzzle instances.
+        processes: The number of worker processes to use (default: the
+            number of CPUs). When 1, puzzles are rated in the calling process.
+    Returns:
+        A dictionary of Rating instances keyed by puzzle.
+    """
+    from kanoodlegenius2d.domain.models import Puzzle
+
+    templates = Puzzle.templates(puzzles)
+    tasks = [templates[puzzle] for puzzle in puzzles]
+
+    if processes == 1:
+        return dict(zip(puzzles, map(_rate, tasks)))
+
+    with multiprocessing.Pool(processes) as pool:
+        return dict(zip(puzzles, pool.map(_rate, tasks, chunksize=8)))
+
+
+def save(ratings):
+    """Store ratings alongside their puzzles, replacing any stored before.
+
+    Args:
+        ratings: A dictionary of Rating instances keyed by puzzle.
+    """
+    from kanoodlegenius2d.domain.models import PuzzleRating
+
+    with PuzzleRating._meta.database.atomic():
+        PuzzleRating.delete().where(PuzzleRating.puzzle << list(ratings)).execute()
+        PuzzleRating.insert_many([dict(puzzle=puzzle, **rating._asdict())
+                                  for puzzle, rating in ratings.items()]).execute()
+
+
+def progression(first, ratings):
+    """Follow the progression of puzzles from the first, finding each place
+    where the difficulty falls.
+
+    Args:
+        first: The Puzzle instance the progression starts from.
+        ratings: A dictionary of Rating instances keyed by puzzle.
+    Returns:
+        A list of 2-tuples of each puzzle, and the puzzle that follows it,
+        that is rated easier.
+    """
+    falls = []
+    puzzle = first
+
+    while puzzle is not None:
+        next_puzzle = puzzle.next_puzzle()
+        if next_puzzle is not None and ratings[next_puzzle].score < ratings[puzzle].score:
+            falls.append((puzzle, next_puzzle))
+        puzzle = next_puzzle
+
+    return falls
+
+
+def ranked(puzzles, ratings):
+    """Order puzzles by level and then by difficulty within each level - the
+    order the puzzles of each level would need renumbering into for the
+    difficulty to increase from one puzzle to the next.
+
+    Args:
+        puzzles: A sequence of Puzzle instances.
+        ratings: A dictionary of Rating instances keyed by puzzle.
+    Returns:
+        A list of the Puzzle instances.
+    """
+    return sorted(puzzles, key=lambda puzzle: (puzzle.level.number, ratings[puzzle].score, puzzle.number))
+
+
+def _rate(template):
+    return rate(*template)
+
+
+def main():
+    from kanoodlegenius2d.domain import models
+    from kanoodlegenius2d.domain.models import Level, Puzzle
+
+    # Rate the puzzles of the game's own database, so that the ratings are there for the game to use
+    models.initialise()
+
+    try:
+        puzzles = list(Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number, Puzzle.number))
+
+        started = time.perf_counter()
+        ratings = rate_all(puzzles)
+        save(ratings)
+        elapsed = time.perf_counter() - started
+
+        for puzzle in puzzles:
+            rating = ratings[puzzle]
+            print('Level {} puzzle {}: score {:.2f} ({} nodes, {} backtracks, branching {:.2f}, {:.1f}ms)'.format(
+                puzzle.level.number, puzzle.number, rating.score, rating.nodes, rating.backtracks, rating.branching,
+                rating.wall_time * 1000))
+
+        for level in Level.select().order_by(Level.number):
+            scores = [ratings[puzzle].score for puzzle in puzzles if puzzle.level == level]
+            print('Level {} ({}): mean score {:.2f}'.format(level.number, level.name, sum(scores) / len(scores)))
+
+        falls = progression(puzzles[0], ratings)
+
+        print('Suggested order: {}'.format(' '.join('{}/{}'.format(puzzle.level.number, puzzle.number)
+                                                    for puzzle in ranked(puzzles, ratings))))
+        print('Rated {} puzzles in {:.2f}s. Difficulty falls {} times from one puzzle to the next.'.format(
+            len(puzzles), elapsed, len(falls)))
+    finally:
+        models.shutdown()
+
+    return len(falls)
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if main() else 0)
@@ -0,0 +1,146 @@
+"""Generate new puzzles that have a unique solution.
+
+A puzzle is generated by randomly tiling the board with every noodle and then
+choosing which of those noodles to preconfigure on the puzzle, such that the
+noodles left for the player can only be placed one way.
+
+Run the module to build a pack of puzzles, written as JSON lines:
+
+    python -m kanoodlegenius2d.domain.generator --count 1000 --output pack.jsonl
+
+or as packed binary records (see the packing module):
+
+    python -m kanoodlegenius2d.domain.generator --count 1000 --packed --output pack.bin
+"""
+
+import argparse
+from collections import namedtuple
+import itertools
+import json
+import multiprocessing
+import random
+import sys
+import time
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import packing
+from kanoodlegenius2d.domain import placements
+from kanoodlegenius2d.domain import solver
+
+# A generated puzzle. Both the preconfigured noodles and the solution are
+# tuples of (noodle, position, part1, part2, part3, part4) - the same form
+# as a PuzzleNoodle - where noodle is the noodle's designation.
+GeneratedPuzzle = namedtuple('GeneratedPuzzle', 'noodles solution')
+
+
+def generate(rng, min_noodles=1, max_noodles=5):
+    """Generate a single puzzle with a unique solution.
+
+    Args:
+        rng: The random.Random instance used to generate the puzzle.
+        min_noodles: The fewest noodles to preconfigure on the puzzle.
+        max_noodles: The most noodles to preconfigure on the puzzle.
+    Returns:
+        A GeneratedPuzzle instance, or None if no choice of preconfigured
+        noodles in the permitted range leaves a unique solution.
+    """
+    tiling = solver.solve(bitboard.EMPTY, [designation for designation, _, _, _ in data.NOODLES], rng)
+
+    for size in range(min_noodles, max_noodles + 1):
+        subsets = list(itertools.combinations(tiling, size))
+        rng.shuffle(subsets)
+
+        for preconfigured in subsets:
+            occupied = bitboard.EMPTY
+            for placement in preconfigured:
+                occupied |= placement.mask
+            remaining = [placement.designation for placement in tiling if placement not in preconfigured]
+
+            if len(list(itertools.islice(solver.iter_solutions(occupied, remaining), 2))) == 1:
+                solution = [placement for placement in tiling if placement not in preconfigured]
+                return GeneratedPuzzle(noodles=tuple(_to_fields(p) for p in preconfigured),
+                                       solution=tuple(_to_fields(p) for p in solution))
+
+    return None
+
+
+def generate_many(count, processes=None, seed=None, min_noodles=1, max_noodles=5):
+    """Generate a number of puzzles across a pool of worker processes.
+
+    Args:
+        count: The number of puzzles to generate.
+        processes: The number of worker processes to use (default: the
+            number of CPUs). When 1, puzzles are generated in the calling process.
+        seed: Optional seed, making the puzzles generated repeatable.
+        min_noodles: The fewest noodles to preconfigure on each puzzle.
+        max_noodles: The most noodles to preconfigure on each puzzle.
+    Returns:
+        An iterator of GeneratedPuzzle instances, yielded as they are generated.
+    """
+    if seed is None:
+        seed = random.randrange(sys.maxsize)
+
+    tasks = ((seed + i, min_noodles, max_noodles) for i in range(count))
+
+    if processes == 1:
+        results = map(_generate, tasks)
+        yield from (puzzle for puzzle in results if puzzle is not None)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        for puzzle in pool.imap_unordered(_generate, tasks, chunksize=16):
+            if puzzle is not None:
+                yield puzzle
+
+
+def _generate(task):
+    seed, min_noodles, max_noodles = task
+    return generate(random.Random(seed), min_noodles, max_noodles)
+
+
+def _to_fields(placement):
+    return (placement.designation, placement.position) + placement.parts
+
+
+def _pack(puzzle):
+    noodles, solution = ([placements.find(fields[0], fields[2:], fields[1]) for fields in placed]
+                         for placed in (puzzle.noodles, puzzle.solution))
+    return packing.pack(noodles, solution)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Generate Kanoodle Genius 2D puzzles with a unique solution.')
+    parser.add_argument('--count', type=int, default=100, help='The number of puzzles to generate.')
+    parser.add_argument('--processes', type=int, default=None, help='The number of worker processes.')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for repeatable output.')
+    parser.add_argument('--min-noodles', type=int, default=1, help='The fewest preconfigured noodles.')
+    parser.add_argument('--max-noodles', type=int, default=5, help='The most preconfigured noodles.')
+    parser.add_argument('--packed', action='store_true', help='Write packed binary records, not JSON lines.')
+    parser.add_argument('--output', default='-', help='The output file (default: stdout).')
+    args = parser.parse_args(args)
+
+    if args.output == '-':
+        output = sys.stdout.buffer if args.packed else sys.stdout
+    else:
+        output = open(args.output, 'wb' if args.packed else 'w')
+
+    started = time.perf_counter()
+    generated = 0
+
+    try:
+        for puzzle in generate_many(args.count, args.processes, args.seed, args.min_noodles, args.max_noodles):
+            output.write(_pack(puzzle) if args.packed else json.dumps(puzzle._asdict()) + '\n')
+            generated += 1
+    finally:
+        # Only close a file opened here, leaving stdout open for whatever else writes to it
+        if args.output != '-':
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print('Generated {} puzzles in {:.2f}s ({:.1f} puzzles per second)'.format(
+        generated, elapsed, generated / elapsed if elapsed else 0), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""The geometry of a hex board, defined by its shape.
+
+Each hole on a board is a cell of a hex grid, addressed by axial (column, row)
+coordinates. Stepping from a hole in an orientation adds that orientation's
+offset from orientation.OFFSETS to its coordinates, so finding a neighbour
+is a little arithmetic and a dictionary lookup. The holes are numbered from
+0 in reading order - top row first, left to right - and the neighbour table
+and drawing coordinates of the board are generated from its shape.
+
+A shape can be drawn as a picture, with a character for each hole and each
+row indented by half a hole from the one above or below it:
+
+      . . . .
+     . . . . .
+    . . . . . .
+"""
+
+from kanoodlegenius2d.domain import orientation
+
+# Used in a neighbour table where a neighbour would be off the board.
+OFF = -1
+
+
+class Geometry:
+    """The holes of a hex board and the way they neighbour one another."""
+
+    def __init__(self, cells):
+        """Initialise a new Geometry.
+
+        Args:
+            cells: An iterable of the axial (column, row) coordinates of each hole.
+        Raises:
+            ValueError: If there are no cells.
+        """
+        self.cells = tuple(sorted(set(cells), key=lambda cell: (cell[1], cell[0])))
+
+        if not self.cells:
+            raise ValueError('A board must have at least one hole')
+
+        self._positions = {cell: position for position, cell in enumerate(self.cells)}
+        self.count = len(self.cells)
+        self.neighbours = tuple(tuple(self._positions.get((column + d_column, row + d_row), OFF)
+                                      for d_column, d_row in orientation.OFFSETS)
+                                for column, row in self.cells)
+        # The top left corner of the board, in drawing coordinates
+        self._origin = (min(column + row / 2 for column, row in self.cells), min(row for _, row in self.cells))
+
+    @classmethod
+    def from_picture(cls, picture):
+        """Create a Geometry from a picture of the board's shape.
+
+        Args:
+            picture: A string with a line for each row of the board and a
+                non-space character for each hole. Each hole sits 2 characters
+                to the right of its neighbour in the same row, and 1 character
+                to the left or right of its neighbours in the rows above and below.
+        Returns:
+            The Geometry instance.
+        Raises:
+            ValueError: If the holes in the picture do not line up on a hex grid.
+        """
+        lines = [line for line in picture.splitlines() if line.strip()]
+        holes = [(x, row) for row, line in enumerate(lines) for x, char in enumerate(line) if not char.isspace()]
+        cells = []
+
+        for x, row in holes:
+            # Every hole must line up with the first
+            if (x - row - holes[0][0] + holes[0][1]) % 2:
+                raise ValueError('Hole at line {} character {} is not on the grid'.format(row + 1, x + 1))
+            cells.append(((x - row - (holes[0][0] - holes[0][1]) % 2) // 2, row))
+
+        return cls(cells)
+
+    def position(self, column, row):
+        """Get the hole at axial coordinates.
+
+        Args:
+            column: The axial column.
+            row: The axial row.
+        Returns:
+            The hole position, or None if there is no hole there.
+        """
+        return self._positions.get((column, row))
+
+    def coordinates(self, position):
+        """Get the axial coordinates of a hole.
+
+        Args:
+            position: The hole position.
+        Returns:
+            A 2-tuple of the axial (column, row).
+        """
+        return self.cells[position]
+
+    def layout(self, position):
+        """Get where a hole is drawn, relative to the top left of the board.
+
+        Args:
+            position: The hole position.
+        Returns:
+            A 2-tuple of the (x, y) of the hole, in hole widths across and
+            rows down. Holes in alternate rows are offset by half a hole.
+        """
+        column, row = self.cells[position]
+        return column + row / 2 - self._origin[0], row - self._origin[1]
+
+    def find_positions(self, position, orientations):
+        """Follow a path of orientations across the board from a hole.
+
+        Args:
+            position: The position of the starting hole.
+            orientations: A sequence of orientations, each relative to the previous step.
+        Returns:
+            A list of hole positions beginning with the starting position, stopping
+            at the last position on the board if the path runs off it.
+        """
+        if position not in range(self.count):
+            return []
+
+        positions = [position]
+
+        for o in orientations:
+            position = self.neighbours[position][orientation.CODES[o]]
+            if position == OFF:
+                break
+            positions.append(position)
+
+        return positions
+
+
+# The Kanoodle Genius 2D board.
+KANOODLE = Geometry.from_picture('''
+  . . . .
+ . . . . .
+. . . . . .
+ . . . . .
+. . . . . .
+ . . . . .
+  . . . .
+''')
@@ -1,3 +1,4 @@
+import atexit
 from collections import namedtuple
 import logging
 import os
@@ -8,20 +9,38 @@ from peewee import (BooleanField,
                     CharField,
                     DateTimeField,
                     FixedCharField,
+                    FloatField,
                     ForeignKeyField,
                     IntegerField,
                     IntegrityError,
                     Model,
                     SqliteDatabase)
 
+from kanoodlegenius2d.domain import bitboard
 from kanoodlegenius2d.domain import data
 from kanoodlegenius2d.domain import holes
+from kanoodlegenius2d.domain import moves
 from kanoodlegenius2d.domain import orientation
+from kanoodlegenius2d.domain import packing
+from kanoodlegenius2d.domain import placements
+from kanoodlegenius2d.domain import solver
+from kanoodlegenius2d.domain import symmetry
+from kanoodlegenius2d.domain import transposition
+from kanoodlegenius2d.domain import verification
+from kanoodlegenius2d.domain import writebehind
+from kanoodlegenius2d.domain import zobrist
 
 _LOG = logging.getLogger(__name__)
 
 database = SqliteDatabase(os.path.join(os.path.expanduser('~'), '.kanoodlegenius2d.db'))
 
+# The noodles keyed by designation, for each database they have been read from.
+# See Noodle.load_catalogue().
+_NOODLE_CATALOGUE = {}
+
+# Writes the moves made on boards that defer their writes. See Board.defer_writes().
+_WRITER = writebehind.Writer(database)
+
 
 def initialise():
     """Initialise the database, creating the database tables if they don't already
@@ -33,12 +52,49 @@ def initialise():
     if not Puzzle.table_exists():
         data.setup()
 
+    Noodle.load_catalogue()
+    _PUZZLE_CATALOGUE.load()
+
+    # Added after the original schema, so may be missing from an existing database
+    PuzzleRating.create_table(fail_silently=True)
+
 
 def shutdown():
     """Shutdown the database, performing any cleanup operations and
     closing the active connection.
+
+    Raises:
+        writebehind.WriteFailedException: If moves held in memory cannot be
+            written. The connection is closed regardless.
     """
-    database.close()
+    try:
+        _WRITER.shutdown()
+    finally:
+        _NOODLE_CATALOGUE.clear()
+        _PUZZLE_CATALOGUE.clear()
+        database.close()
+
+
+def flush():
+    """Write the moves held in memory by boards that defer their writes to the
+    database, waiting for them to be written.
+
+    Raises:
+        writebehind.WriteFailedException: If the moves cannot be written. They
+            are still held, and are tried again later.
+    """
+    _WRITER.flush()
+
+
+# However the game was launched, write any moves still held in memory when it exits
+atexit.register(flush)
+
+
+def _source(model):
+    """Identify the database a model is read from - the Database instance and
+    the file it was initialised with - so that a catalogue read from one database
+    is not handed out for another."""
+    return model._meta.database, model._meta.database.database
 
 
 class BaseModel(Model):
@@ -81,7 +137,7 @@ class Game(BaseModel):
         except IntegrityError:
             raise DuplicatePlayerNameException(player_name)
 
-        first_puzzle = Puzzle.get(Puzzle.number == 1)
+        first_puzzle = Puzzle.first()
         board = Board.create(player=player, puzzle=first_puzzle)  # Creates an empty board referencing player/puzzle
         board.setup()  # Sets up the noodles on the board based on the puzzle
 
@@ -96,8 +152,9 @@ class Game(BaseModel):
         Returns:
             The board instance holding the previous state of the game.
         """
-        boards = player.boards.order_by(Board.id)
-        return boards[-1]
+        board = player.boards.order_by(Board.id.desc()).first()
+        board.puzzle = _PUZZLE_CATALOGUE.puzzle(board.puzzle_id).model()
+        return board
 
     @staticmethod
     def by_last_played():
@@ -116,6 +173,10 @@ class Level(BaseModel):
     number = IntegerField()
     name = CharField(max_length=20)
 
+    def save(self, *args, **kwargs):
+        _PUZZLE_CATALOGUE.clear()
+        return super().save(*args, **kwargs)
+
     def __str__(self):
         return '<Level: {} ({})>'.format(self.number, self.name)
 
@@ -123,6 +184,8 @@ class Level(BaseModel):
 class PartAccessorMixin:
     """Provides functionality common to all noodle-like objects."""
 
+    __slots__ = ()
+
     @property
     def parts(self):
         """Convenience property for accessing the parts.
@@ -147,13 +210,10 @@ class PartAccessorMixin:
         if root_position is None:
             root_position = getattr(self, 'position')
 
-        positions = [root_position]
+        positions = holes.find_positions(root_position, self.parts)
 
-        for i in range(1, 5):
-            position = holes.find_position(positions[-1], getattr(self, 'part{}'.format(i)))
-            if position is None:
-                raise PositionUnavailableException('The position for part {} is off the board'.format(i))
-            positions.append(position)
+        if len(positions) < 5:
+            raise PositionUnavailableException('The position for part {} is off the board'.format(len(positions)))
 
         return positions
 
@@ -171,33 +231,84 @@ class Noodle(PartAccessorMixin, BaseModel):
     part3 = FixedCharField(max_length=2)
     part4 = FixedCharField(max_length=2)
 
+    @staticmethod
+    def load_catalogue():
+        """Load the catalogue of noodles from the database, replacing any
+        loaded before.
+
+        The noodles never change once created, so they are read from the
+        database once and then handed out from the catalogue by of() and
+        all(). The catalogue is loaded by initialise(), or otherwise the
+        first time it is used with the database the noodles are read from.
+        Saving a noodle clears it, so that it is reloaded when next used.
+        """
+        _NOODLE_CATALOGUE[_source(Noodle)] = {noodle.designation: noodle for noodle in Noodle.select()}
+
+    @staticmethod
+    def _catalogue():
+        """Return the catalogue of the database the noodles are read from, loading it if need be."""
+        if _source(Noodle) not in _NOODLE_CATALOGUE:
+            Noodle.load_catalogue()
+        return _NOODLE_CATALOGUE[_source(Noodle)]
+
+    @staticmethod
+    def of(designation):
+        """Get a noodle from the catalogue.
+
+        Args:
+            designation: The designation of the noodle.
+        Returns:
+            A copy of the Noodle instance, which can be rotated and flipped
+            without affecting the catalogue. Its colour, image and other
+            fields are shared with the catalogue.
+        Raises:
+            Noodle.DoesNotExist: If there is no noodle with the designation.
+        """
+        try:
+            noodle = Noodle._catalogue()[designation]
+        except KeyError:
+            raise Noodle.DoesNotExist('No noodle with designation {}'.format(designation))
+
+        copy = Noodle(**noodle._data)
+        copy._dirty.clear()
+        return copy
+
+    @staticmethod
+    def all():
+        """Get every noodle from the catalogue.
+
+        Returns:
+            A list of copies of the Noodle instances, in order of designation.
+        """
+        return [Noodle.of(designation) for designation in sorted(Noodle._catalogue())]
+
     @staticmethod
     def light_green():
-        return Noodle.get(Noodle.designation == 'A')
+        return Noodle.of('A')
 
     @staticmethod
     def yellow():
-        return Noodle.get(Noodle.designation == 'B')
+        return Noodle.of('B')
 
     @staticmethod
     def dark_blue():
-        return Noodle.get(Noodle.designation == 'C')
+        return Noodle.of('C')
 
     @staticmethod
     def light_blue():
-        return Noodle.get(Noodle.designation == 'D')
+        return Noodle.of('D')
 
     @staticmethod
     def red():
-        return Noodle.get(Noodle.designation == 'E')
+        return Noodle.of('E')
 
     @staticmethod
     def pink():
-        return Noodle.get(Noodle.designation == 'F')
+        return Noodle.of('F')
 
     @staticmethod
     def dark_green():
-        return Noodle.get(Noodle.designation == 'G')
+        return Noodle.of('G')
 
     def rotate(self, increment=1):
         """Rotate the noodle clockwise by the specified number of increments.
@@ -205,27 +316,25 @@ class Noodle(PartAccessorMixin, BaseModel):
         Args:
             increment: The number of increments to rotate the noodle by.
         """
-        for _ in range(increment):
-            self.part1 = orientation.rotate(self.part1)
-            self.part2 = orientation.rotate(self.part2)
-            self.part3 = orientation.rotate(self.part3)
-            self.part4 = orientation.rotate(self.part4)
+        self.transform(increment % 6)
 
     def flip(self):
         """Flip the noodle 180 degrees on its Y axis."""
+        self.transform(6)
 
-        y_conversions = {
-            orientation.SE: orientation.SW,
-            orientation.NE: orientation.NW,
-            orientation.NW: orientation.NE,
-            orientation.SW: orientation.SE,
-            orientation.E: orientation.W,
-            orientation.W: orientation.E
-        }
-        self.part1 = y_conversions[self.part1]
-        self.part2 = y_conversions[self.part2]
-        self.part3 = y_conversions[self.part3]
-        self.part4 = y_conversions[self.part4]
+    def transform(self, transform):
+        """Apply one of the 12 rotate/flip transforms to the noodle.
+
+        Args:
+            transform: The transform to apply. Transforms 0 - 5 rotate the noodle
+                clockwise by that number of increments. Transforms 6 - 11 flip the
+                noodle and then rotate it by the transform less 6 increments.
+        """
+        self.part1, self.part2, self.part3, self.part4 = orientation.transform(self.parts, transform)
+
+    def save(self, *args, **kwargs):
+        _NOODLE_CATALOGUE.clear()
+        return super().save(*args, **kwargs)
 
     def __str__(self):
         return '<Noodle: {}>'.format(self.colour)
@@ -304,22 +413,109 @@ class Puzzle(BaseModel):
                             part3=noodle.part3,
                             part4=noodle.part4)
 
+    def template(self):
+        """Get the holes occupied by the noodles preconfigured on the puzzle
+        and the noodles that remain to be placed.
+
+        Returns:
+            A 2-tuple of the bitmask of the occupied holes and a tuple of the
+            designations of the noodles that are not part of the puzzle.
+        """
+        return _PUZZLE_CATALOGUE.puzzle(self.id).template()
+
+    @staticmethod
+    def templates(puzzles):
+        """Get the templates of a number of puzzles, loading the noodles
+        preconfigured on all of them in a single query.
+
+        Args:
+            puzzles: A sequence of Puzzle instances.
+        Returns:
+            A dictionary of 2-tuples, as returned by template(), keyed by puzzle.
+        """
+        occupied = {puzzle.id: bitboard.EMPTY for puzzle in puzzles}
+        designations = {puzzle.id: set() for puzzle in puzzles}
+
+        for puzzle_noodle in PuzzleNoodle.select(PuzzleNoodle, Noodle).join(Noodle).where(
+                PuzzleNoodle.puzzle << list(puzzles)):
+            occupied[puzzle_noodle.puzzle_id] |= bitboard.to_mask(puzzle_noodle.get_part_positions())
+            designations[puzzle_noodle.puzzle_id].add(puzzle_noodle.noodle.designation)
+
+        return {puzzle: (occupied[puzzle.id],
+                         tuple(d for d, _, _, _ in data.NOODLES if d not in designations[puzzle.id]))
+                for puzzle in puzzles}
+
+    @property
+    def difficulty(self):
+        """The difficulty score of the puzzle, from the effort it takes to
+        search for its solutions. See the difficulty module.
+
+        Returns:
+            The score, or None if the puzzle has not been rated.
+        """
+        rating = PuzzleRating.select().where(PuzzleRating.puzzle == self).first()
+        return rating.score if rating else None
+
+    def pack(self):
+        """Pack the puzzle and its solution into a compact binary record.
+
+        Returns:
+            The record, as bytes. See the packing module for its layout.
+        Raises:
+            ValueError: If the puzzle's solution does not place the remaining noodles
+                on the board.
+        """
+        noodles = [placements.find(puzzle_noodle.noodle.designation, puzzle_noodle.parts, puzzle_noodle.position)
+                   for puzzle_noodle in PuzzleNoodle.select(PuzzleNoodle, Noodle).join(Noodle).where(
+                       PuzzleNoodle.puzzle == self)]
+        solution = [placements.find(designation, parts, position)
+                    for designation, position, parts in verification.parse_solution(self.solution)]
+
+        if None in noodles or None in solution:
+            raise ValueError('Puzzle {} has a noodle that does not fit on the board'.format(self.number))
+
+        return packing.pack(noodles, solution)
+
     def next_puzzle(self):
         """Get the next puzzle.
 
         Returns:
             The next puzzle, or None if no next puzzle (end of game).
         """
-        try:
-            return Puzzle.get(Puzzle.level == self.level, Puzzle.number == self.number+1)
-        except Puzzle.DoesNotExist:
-            try:
-                next_level = Level.get(Level.number == self.level.number+1)
-            except Level.DoesNotExist:
-                # End of game
-                return None
-            else:
-                return Puzzle.get(Puzzle.level == next_level, Puzzle.number == 1)
+        following = _PUZZLE_CATALOGUE.next(self.id)
+        return following.model() if following is not None else None
+
+    @staticmethod
+    def first():
+        """Get the first puzzle of the game.
+
+        Returns:
+            The first puzzle of the first level, or None if there are no puzzles.
+        """
+        first = _PUZZLE_CATALOGUE.first()
+        return first.model() if first is not None else None
+
+    @staticmethod
+    def total():
+        """Get the number of puzzles in the game.
+
+        Returns:
+            The number of puzzles.
+        """
+        return len(_PUZZLE_CATALOGUE)
+
+    @property
+    def noodle_count(self):
+        """The number of noodles preconfigured on the puzzle.
+
+        Returns:
+            The number of noodles.
+        """
+        return len(_PUZZLE_CATALOGUE.puzzle(self.id).noodles)
+
+    def save(self, *args, **kwargs):
+        _PUZZLE_CATALOGUE.clear()
+        return super().save(*args, **kwargs)
 
     def __str__(self):
         return '<Puzzle: {}>'.format(self.number)
@@ -345,51 +541,67 @@ class Board(BaseModel):
             PositionOccupiedException: If any of the positions targeted by the specified
                 noodle's parts are occupied.
         """
-        if position not in range(35):
-            raise PositionUnavailableException('Position {} is not on the board')
+        if position not in range(holes.COUNT):
+            raise PositionUnavailableException('Position {} is not on the board'.format(position))
 
         if part_pos:
             position = self._find_root_pos(noodle, part_pos, position)
 
-        target_positions = set(noodle.get_part_positions(position))
-
-        if self.noodles:
-            occupied_positions = set()
-
-            for board_noodle in self.noodles:
-                occupied_positions.update(board_noodle.get_part_positions())
-
-            overlap = occupied_positions & target_positions
+        placement = placements.find(noodle.designation, noodle.parts, position)
+        if placement is not None:
+            mask = placement.mask
+        else:
+            # Not a placement of the noodle's own shape, so find the positions of its parts.
+            # Raises an exception identifying any part that is off the board.
+            mask = bitboard.to_mask(noodle.get_part_positions(position))
+
+        overlap = self.occupied & mask
+
+        if overlap:
+            raise PositionUnavailableException('Position(s) {} are occupied'.format(
+                ', '.join([str(o) for o in bitboard.to_positions(overlap)])))
+
+        board_noodle = BoardNoodle(board=self, noodle=noodle, position=position, part1=noodle.part1,
+                                   part2=noodle.part2, part3=noodle.part3, part4=noodle.part4)
+        self._insert(board_noodle)
+        self._move_stack().push(board_noodle)
+        self._occupied |= mask
+        self._placed.add(noodle.designation)
+        self._toggle_hashes(placement)
+        self._touch()
 
-            if overlap:
-                raise PositionUnavailableException('Position(s) {} are occupied'.format(
-                    ', '.join([str(o) for o in overlap])))
-
-        BoardNoodle.create(board=self, noodle=noodle, position=position, part1=noodle.part1,
-                           part2=noodle.part2, part3=noodle.part3, part4=noodle.part4)
+        return position
 
-        self.player.game.last_played = datetime.now()
-        self.player.game.save()
+    def valid_drops(self, noodle, part_pos=0):
+        """Find every hole on the board that a part of a noodle can be placed
+        onto without any of the noodle's parts falling off the board or
+        overlapping another noodle.
 
-        return position
+        Args:
+            noodle: The noodle instance to place.
+            part_pos: The part of the noodle that would be targeted at the hole (0 - 4).
+        Returns:
+            A list of the board hole positions, in ascending order.
+        """
+        return bitboard.to_positions(placements.drops(noodle.designation, noodle.parts, part_pos, self.occupied))
 
     def _find_root_pos(self, noodle, part_pos, hole_index):
         """Find the board hole position for the root part of the noodle."""
-        index = hole_index
         # Traverse backwards along the noodle to the root position
-        for pos in reversed(range(part_pos)):
-            index = holes.find_position(index, orientation.opposite(noodle.parts[pos]))
-            if index is None:
-                raise PositionUnavailableException('Part {} of the noodle is not on the board'.format(pos))
-        return index
+        path = [orientation.opposite(noodle.parts[pos]) for pos in reversed(range(part_pos))]
+        positions = holes.find_positions(hole_index, path)
+        if len(positions) <= part_pos:
+            raise PositionUnavailableException('Part {} of the noodle is not on the board'.format(
+                part_pos - len(positions)))
+        return positions[-1]
 
     def setup(self):
         """Set up the board based on the puzzle it is referencing.
 
         The puzzle acts as a template.
         """
-        for puzzle_noodle in self.puzzle.noodles:
-            noodle = puzzle_noodle.noodle
+        for puzzle_noodle in _PUZZLE_CATALOGUE.puzzle(self.puzzle_id).noodles:
+            noodle = Noodle.of(puzzle_noodle.designation)
             noodle.part1 = puzzle_noodle.part1
             noodle.part2 = puzzle_noodle.part2
             noodle.part3 = puzzle_noodle.part3
@@ -403,53 +615,336 @@ class Board(BaseModel):
             The noodle that was undone (removed from the board)
             or None if there was no operation to undo.
         """
-        puzzle_noodles = [noodle.noodle for noodle in self.puzzle.noodles]
-        for board_noodle in self.noodles.order_by(BoardNoodle.id.desc()):
-            if board_noodle.noodle not in puzzle_noodles:
-                board_noodle.delete_instance()
-                self.player.game.last_played = datetime.now()
-                self.player.game.save()
-                return board_noodle.noodle
+        board_noodle = self._move_stack().undo()
+
+        if board_noodle is not None:
+            self._write(BoardNoodle.delete().where(BoardNoodle.board == self.id,
+                                                   BoardNoodle.noodle == board_noodle.noodle_id).execute)
+            self._occupied = self.occupied & ~self._mask(board_noodle)
+            self._placed.discard(board_noodle.noodle.designation)
+            self._toggle_hashes(self._placement(board_noodle))
+            self._touch()
+            return board_noodle.noodle
+
+    def redo(self):
+        """Redo the last place operation undone, provided nothing has been
+        placed since.
+
+        Returns:
+            The noodle that was redone (put back on the board)
+            or None if there was no operation to redo.
+        """
+        board_noodle = self._move_stack().redo()
+
+        if board_noodle is not None:
+            self._insert(board_noodle)
+            self._occupied = self.occupied | self._mask(board_noodle)
+            self._placed.add(board_noodle.noodle.designation)
+            self._toggle_hashes(self._placement(board_noodle))
+            self._touch()
+            return board_noodle.noodle
+
+    @property
+    def can_undo(self):
+        """Whether there is a place operation to undo."""
+        return self._move_stack().can_undo
+
+    @property
+    def can_redo(self):
+        """Whether there is an undone place operation to redo."""
+        return self._move_stack().can_redo
+
+    def _move_stack(self):
+        """Return the MoveStack of the board.
+
+        The stack needs the noodles preconfigured by the puzzle, which can't be
+        undone, so it is only built once a move is made, undone or redone - not
+        when the board's occupancy is loaded.
+        """
+        if not hasattr(self, '_board_noodles'):
+            self._load_occupancy()
+
+        if self._moves is None:
+            self._moves = moves.MoveStack(
+                self._board_noodles,
+                fixed=[noodle.noodle_id for noodle in _PUZZLE_CATALOGUE.puzzle(self.puzzle_id).noodles])
+
+        return self._moves
+
+    def _insert(self, board_noodle):
+        """Write a noodle placed on the board to the database."""
+        fields = {name: value for name, value in board_noodle._data.items() if name != 'id'}
+        self._write(BoardNoodle.insert(**fields).execute)
+
+    def defer_writes(self):
+        """Hand the writes that record subsequent place and undo operations to
+        a background writer, which writes them to the database in batches.
+
+        The board is updated in memory straight away, so placed_noodles and the
+        board's occupancy reflect each move as it is made, but the database
+        may lag behind until flush() is called. See the writebehind module for
+        what is written when, and what a crash can lose.
+        """
+        self._deferred = True
+
+    def _write(self, write):
+        """Make a write to the database, or hand it to the background writer if
+        the board defers its writes."""
+        if getattr(self, '_deferred', False):
+            _WRITER.submit(write)
+        else:
+            write()
+
+    def _touch(self):
+        """Record that the player's game has just been played."""
+        game = self.player.game
+        game.last_played = datetime.now()
+        self._write(Game.update(last_played=game.last_played).where(Game.id == game.id).execute)
+
+    @property
+    def placed_noodles(self):
+        """The noodles on the board, in the order they were placed.
+
+        Like the occupancy, the noodles are loaded from the database the first
+        time they are accessed and then kept up to date in memory.
+
+        Returns:
+            A list of BoardNoodle instances.
+        """
+        return list(self._move_stack())
 
-    def solve(self):
+    def solve(self, keep_placements=False):
         """Solve the puzzle and complete the board.
 
         This will find the locations of each of the noodles that are not
         preconfigured as part of the puzzle and place each noodle onto
         the board.
+
+        Args:
+            keep_placements: Whether to keep the noodles the player has already
+                placed on the board, and only place the rest, when the noodles
+                placed can be completed to form a solution. If they cannot, or
+                if not specified, the board is solved from the puzzle.
+        Raises:
+            UnsolvableBoardException: If the puzzle has no solution.
         """
-        # Establish whether the player has already placed any noodles on the board
-        noodles_placed = len(self.noodles) - len(self.puzzle.noodles)
+        self.complete(*self.solve_search(keep_placements)())
+
+    def solve_search(self, keep_placements=False):
+        """Prepare the search for a solution to the puzzle, so that it can be
+        run apart from the database - on a worker thread, for example. Passing
+        what the search returns to complete() completes the board, as solve() does.
 
-        for _ in range(noodles_placed):
-            # Remove any noodles the player has already placed on the board (we need to start from a clean state)
-            self.undo()
+        Args:
+            keep_placements: As for solve().
+        Returns:
+            A callable that accepts an optional check callable, called at every
+            board state the search visits, and returns a 2-tuple of the tuple of
+            Placement instances of the noodles to place and whether the noodles
+            already on the board are kept. The callable raises
+            UnsolvableBoardException if the puzzle has no solution.
+        """
+        occupied, remaining = self.occupied, self._remaining()
+        puzzle = _PUZZLE_CATALOGUE.puzzle(self.puzzle_id)
+        template, number = puzzle.template(), puzzle.number
 
-        for noodle_field in self.puzzle.solution.rstrip(';').split(';'):
-            fields = noodle_field.split(',')
-            noodle = Noodle.get(Noodle.id == int(fields[0]))
-            noodle.part1 = fields[2]
-            noodle.part2 = fields[3]
-            noodle.part3 = fields[4]
-            noodle.part4 = fields[5]
+        def search(check=None):
+            if keep_placements:
+                solution = solver.solve(occupied, remaining, check=check)
+                if solution is not None:
+                    return solution, True
 
-            self.place(noodle, position=int(fields[1]))
+            solution = solver.solve(*template, check=check)
 
-        self.auto_completed = True
-        self.save()
+            if solution is None:
+                raise UnsolvableBoardException('Puzzle {} has no solution'.format(number))
+
+            return solution, False
+
+        return search
+
+    def complete(self, solution, keep_placements):
+        """Complete the board with a solution found by the search that
+        solve_search() prepares.
+
+        Args:
+            solution: A sequence of the Placement instances of the noodles to place.
+            keep_placements: Whether the solution keeps the noodles already on the board.
+        """
+        designations = [placement.designation for placement in solution]
+        noodles = {designation: Noodle.of(designation) for designation in designations}
+
+        # Write any moves still held in memory first, so that they are not written over the solution
+        flush()
+
+        with self._meta.database.atomic():
+            if not keep_placements:
+                # Remove any noodles the player has already placed on the board (we need to start from a clean state)
+                BoardNoodle.delete().where(BoardNoodle.board == self,
+                                           BoardNoodle.noodle << list(noodles.values())).execute()
+
+            rows = [dict(board=self, noodle=noodles[placement.designation], position=placement.position,
+                         part1=placement.parts[0], part2=placement.parts[1], part3=placement.parts[2],
+                         part4=placement.parts[3])
+                    for placement in solution]
+            if rows:
+                BoardNoodle.insert_many(rows).execute()
+
+            if keep_placements:
+                for row in rows:
+                    self._move_stack().push(BoardNoodle(**row))
+                for placement in solution:
+                    self._occupied |= placement.mask
+                    self._placed.add(placement.designation)
+                    self._toggle_hashes(placement)
+            else:
+                self._load_occupancy()
+            self.player.game.last_played = datetime.now()
+            self.player.game.save()
+            self.auto_completed = True
+            self.save()
 
     def _unoccupied_holes(self):
         """Return a sequence of the hole numbers on the board that are empty."""
-        occupied = set()
+        return set(bitboard.to_positions(bitboard.FULL & ~self.occupied))
+
+    def hint(self):
+        """Suggest where to place one of the noodles remaining to be placed, such
+        that the noodles already on the board can still be completed to form a
+        solution.
+
+        Returns:
+            A Placement instance holding the designation of the noodle, the
+            transform to apply to it, the position of its root part and the
+            orientations of its parts. None is returned if the board is already
+            complete.
+        Raises:
+            UnsolvableBoardException: If the noodles on the board cannot be completed
+                to form a solution.
+        """
+        return self.hint_search()()
+
+    def hint_search(self):
+        """Prepare the search for a hint, so that it can be run apart from the
+        database - on a worker thread, for example.
+
+        Returns:
+            A callable that accepts an optional check callable, called at every
+            board state the search visits, and returns what hint() returns. The
+            callable raises UnsolvableBoardException as hint() does.
+        """
+        if self.completed:
+            return lambda check=None: None
+
+        # Answer for the canonical image of the board, and map the answer back
+        key, automorphism = symmetry.canonical(self._state_hashes())
+        occupied, remaining = symmetry.map_mask(automorphism, self.occupied), self._remaining()
+
+        def search(check=None):
+            placement = transposition.hint(key, occupied, remaining, check)
+
+            if placement is None:
+                raise UnsolvableBoardException('The noodles on the board cannot be completed')
+
+            return symmetry.map_placement(symmetry.inverse(automorphism), placement)
+
+        return search
+
+    def count_solutions(self):
+        """Count the number of distinct ways the noodles remaining to be placed
+        can complete the board.
+
+        Returns:
+            The number of solutions, which is 0 if the board cannot be completed.
+        """
+        key, automorphism = symmetry.canonical(self._state_hashes())
+        return transposition.count(key, symmetry.map_mask(automorphism, self.occupied), self._remaining())
+
+    def dead_regions(self):
+        """Find the regions of empty holes on the board that none of the noodles
+        remaining to be placed can fill, meaning the puzzle can no longer be
+        solved without undoing.
+
+        Returns:
+            A list of dead regions, each a list of hole positions.
+        """
+        return [bitboard.to_positions(region) for region in solver.dead_regions(self.occupied, self._remaining())]
+
+    def _remaining(self):
+        """Return a list of the designations of the noodles not yet on the board."""
+        if not hasattr(self, '_placed'):
+            self._load_occupancy()
+        return [d for d, _, _, _ in data.NOODLES if d not in self._placed]
+
+    @property
+    def occupied(self):
+        """The holes on the board that are occupied by noodles.
+
+        The occupancy is loaded from the database the first time it is
+        accessed and is then kept up to date in memory as noodles are
+        placed and undone.
+
+        Returns:
+            A bitmask of the occupied hole positions.
+        """
+        if not hasattr(self, '_occupied'):
+            self._load_occupancy()
+        return self._occupied
+
+    @property
+    def state_hash(self):
+        """The Zobrist hash of the noodles on the board, their transforms and
+        the positions of their root parts.
+
+        Like the occupancy, the hash is loaded from the database the first time
+        it is accessed and then updated as noodles are placed and undone.
+
+        Returns:
+            A 64-bit integer.
+        """
+        return self._state_hashes()[0]
+
+    def _state_hashes(self):
+        """Return the hashes of the board as mapped through each of the board's automorphisms."""
+        if not hasattr(self, '_hashes'):
+            self._load_occupancy()
+        return self._hashes
+
+    def _toggle_hashes(self, placement):
+        """XOR a placement in or out of the hashes of the board. A noodle that is not
+        placed in its own shape has no placement, and leaves the hashes as they are."""
+        if placement is None:
+            return
+
+        self._hashes = tuple(hash_ ^ key for hash_, key in zip(self._hashes, symmetry.keys(placement)))
+
+    def _load_occupancy(self):
+        """Load the noodles on the board, the holes they occupy, their
+        designations and the hash of their placements from the database.
+        """
+        self._occupied = bitboard.EMPTY
+        self._placed = set()
+        self._hashes = (zobrist.EMPTY,) * len(symmetry.AUTOMORPHISMS)
+        self._board_noodles = list(self.noodles.select(BoardNoodle, Noodle).join(Noodle).order_by(BoardNoodle.id))
+        self._moves = None
+
+        for board_noodle in self._board_noodles:
+            self._occupied |= self._mask(board_noodle)
+            self._placed.add(board_noodle.noodle.designation)
+            self._toggle_hashes(self._placement(board_noodle))
+
+    def _placement(self, board_noodle):
+        """Return the Placement of a noodle on the board, or None if it is not placed in its own shape."""
+        return placements.find(board_noodle.noodle.designation, board_noodle.parts, board_noodle.position)
+
+    def _mask(self, board_noodle):
+        """Return the bitmask of the holes a noodle on the board occupies."""
+        placement = self._placement(board_noodle)
 
-        for noodle in self.noodles:
-            position = noodle.position
-            occupied.add(position)
-            for part in noodle.parts:
-                position = holes.find_position(position, part)
-                occupied.add(position)
+        if placement is None:
+            return bitboard.to_mask(holes.find_positions(board_noodle.position, board_noodle.parts))
 
-        return set(range(35)) - occupied
+        return placement.mask
 
     @property
     def completed(self):
@@ -458,7 +953,7 @@ class Board(BaseModel):
         Returns:
             True if the puzzle is complete, False otherwise.
         """
-        return self.noodles.count() == 7
+        return self.occupied == bitboard.FULL
 
     def __str__(self):
         return '<Board: {}, Puzzle: {}, Level: {}>'.format(self.id, self.puzzle.id, self.puzzle.level.id)
@@ -495,10 +990,195 @@ class PuzzleNoodle(PartAccessorMixin, BaseModel):
     part3 = FixedCharField(max_length=2)
     part4 = FixedCharField(max_length=2)
 
+    def save(self, *args, **kwargs):
+        _PUZZLE_CATALOGUE.clear()
+        return super().save(*args, **kwargs)
+
     def __str__(self):
         return '<PuzzleNoodle: {}>'.format(self.id)
 
 
+class PuzzleRating(BaseModel):
+    """The effort it takes to search for every solution to a puzzle, and
+    the difficulty score derived from it.
+    """
+    puzzle = ForeignKeyField(Puzzle, related_name='ratings', unique=True, on_delete='CASCADE')
+    # The number of board states visited by the search
+    nodes = IntegerField()
+    # The number of board states that were dead ends
+    backtracks = IntegerField()
+    # The mean number of candidate placements at each board state
+    branching = FloatField()
+    # The time taken by the search in seconds
+    wall_time = FloatField()
+    score = FloatField()
+
+    def __str__(self):
+        return '<PuzzleRating: {}>'.format(self.id)
+
+
+class PuzzleCatalogue:
+    """The levels, puzzles and the noodles preconfigured on each puzzle, held
+    in memory so that moving from one puzzle to the next, setting up a board
+    and looking up a puzzle's level need no database access.
+
+    The catalogue is loaded with two queries - one for the puzzles and their
+    levels and one for the puzzle noodles - by initialise(), or otherwise the
+    first time it is used with the database the puzzles are read from. Saving a
+    level, puzzle or puzzle noodle clears the catalogue, so that it is reloaded
+    when next used.
+    """
+
+    def __init__(self):
+        self._puzzles = None
+        self._order = ()
+        self._source = None
+
+    def load(self):
+        """Load the catalogue from the database, replacing anything loaded before."""
+        levels, puzzles, order = {}, {}, []
+
+        for puzzle in Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number, Puzzle.number):
+            level = levels.get(puzzle.level.id)
+            if level is None:
+                level = levels[puzzle.level.id] = LevelEntry(puzzle.level.id, puzzle.level.number, puzzle.level.name)
+            puzzles[puzzle.id] = PuzzleEntry(puzzle.id, level, puzzle.number, puzzle.solution, len(order))
+            order.append(puzzles[puzzle.id])
+
+        noodles = {puzzle_id: [] for puzzle_id in puzzles}
+        for puzzle_noodle in PuzzleNoodle.select(PuzzleNoodle, Noodle).join(Noodle).order_by(PuzzleNoodle.id):
+            if puzzle_noodle.puzzle_id in noodles:
+                noodles[puzzle_noodle.puzzle_id].append(PuzzleNoodleEntry(
+                    puzzle_noodle.noodle.id, puzzle_noodle.noodle.designation, puzzle_noodle.position,
+                    puzzle_noodle.parts))
+
+        for puzzle_id, entries in noodles.items():
+            puzzles[puzzle_id].noodles = tuple(entries)
+
+        self._puzzles, self._order, self._source = puzzles, tuple(order), _source(Puzzle)
+
+    def clear(self):
+        """Clear the catalogue, so that it is reloaded when next used."""
+        self._puzzles, self._order, self._source = None, (), None
+
+    def puzzle(self, puzzle_id):
+        """Get a puzzle from the catalogue.
+
+        Args:
+            puzzle_id: The id of the puzzle.
+        Returns:
+            The PuzzleEntry instance.
+        Raises:
+            Puzzle.DoesNotExist: If there is no puzzle with the id.
+        """
+        if not self._loaded() or puzzle_id not in self._puzzles:
+            self.load()
+
+        try:
+            return self._puzzles[puzzle_id]
+        except KeyError:
+            raise Puzzle.DoesNotExist('No puzzle with id {}'.format(puzzle_id))
+
+    def first(self):
+        """Get the first puzzle of the first level.
+
+        Returns:
+            The PuzzleEntry instance, or None if there are no puzzles.
+        """
+        if not self._loaded():
+            self.load()
+        return self._order[0] if self._order else None
+
+    def next(self, puzzle_id):
+        """Get the puzzle that follows a puzzle - the next puzzle of the same
+        level, or the first puzzle of the next level.
+
+        Args:
+            puzzle_id: The id of the puzzle.
+        Returns:
+            The PuzzleEntry instance, or None if the puzzle is the last of the game.
+        """
+        index = self.puzzle(puzzle_id).index + 1
+        return self._order[index] if index < len(self._order) else None
+
+    def __len__(self):
+        if not self._loaded():
+            self.load()
+        return len(self._order)
+
+    def _loaded(self):
+        """Whether the catalogue is loaded from the database the puzzles are read from."""
+        return self._puzzles is not None and self._source == _source(Puzzle)
+
+
+class LevelEntry:
+    """A level held in the PuzzleCatalogue."""
+
+    __slots__ = ('id', 'number', 'name')
+
+    def __init__(self, id, number, name):
+        self.id = id
+        self.number = number
+        self.name = name
+
+    def model(self):
+        """Get a Level instance for the level, without querying the database."""
+        level = Level(id=self.id, number=self.number, name=self.name)
+        level._dirty.clear()
+        return level
+
+
+class PuzzleEntry:
+    """A puzzle held in the PuzzleCatalogue, with its position in the order
+    the puzzles are played in and the noodles preconfigured on it.
+    """
+
+    __slots__ = ('id', 'level', 'number', 'solution', 'index', 'noodles', '_template')
+
+    def __init__(self, id, level, number, solution, index):
+        self.id = id
+        self.level = level
+        self.number = number
+        self.solution = solution
+        self.index = index
+        self.noodles = ()
+        self._template = None
+
+    def template(self):
+        """Get the holes occupied by the noodles preconfigured on the puzzle
+        and the noodles that remain to be placed, as Puzzle.template() does.
+        """
+        if self._template is None:
+            occupied = bitboard.EMPTY
+            for noodle in self.noodles:
+                occupied |= bitboard.to_mask(noodle.get_part_positions())
+            designations = {noodle.designation for noodle in self.noodles}
+            self._template = occupied, tuple(d for d, _, _, _ in data.NOODLES if d not in designations)
+        return self._template
+
+    def model(self):
+        """Get a Puzzle instance for the puzzle, with its level, without querying the database."""
+        puzzle = Puzzle(id=self.id, number=self.number, solution=self.solution)
+        puzzle.level = self.level.model()
+        puzzle._dirty.clear()
+        return puzzle
+
+
+class PuzzleNoodleEntry(PartAccessorMixin):
+    """A noodle preconfigured on a puzzle, held in the PuzzleCatalogue."""
+
+    __slots__ = ('noodle_id', 'designation', 'position', 'part1', 'part2', 'part3', 'part4')
+
+    def __init__(self, noodle_id, designation, position, parts):
+        self.noodle_id = noodle_id
+        self.designation = designation
+        self.position = position
+        self.part1, self.part2, self.part3, self.part4 = parts
+
+
+_PUZZLE_CATALOGUE = PuzzleCatalogue()
+
+
 class DuplicatePlayerNameException(Exception):
     """Indicates that an attempt was made to create a new player with the same name
     as an existing player.
@@ -509,3 +1189,7 @@ class PositionUnavailableException(Exception):
     """Indicates that a position on the board is occupied (in use by another noodle)
     or the position itself is not on the board.
     """
+
+
+class UnsolvableBoardException(Exception):
+    """Indicates that the noodles on a board cannot be completed to form a solution."""
@@ -0,0 +1,78 @@
+"""The stack of moves made on a board, for undoing and redoing them.
+
+The noodles on a board are held in the order they were placed. Undoing a
+move takes the noodle placed last off the top of the stack and puts it on a
+second stack of undone moves, from which redoing it puts it back. Both are
+constant time: the noodles preconfigured by the puzzle are always placed
+first, so the noodle on top is the only one that needs checking.
+
+Making a new move discards the undone moves, as they may no longer fit
+around it. The undone moves are held in memory only - it is for the board to
+write each move, undo and redo to the database.
+"""
+
+
+class MoveStack:
+    """The noodles placed on a board and the moves undone that can be redone."""
+
+    def __init__(self, board_noodles=(), fixed=()):
+        """Initialise a new MoveStack.
+
+        Args:
+            board_noodles: The BoardNoodle instances on the board, in the order they were placed.
+            fixed: The ids of the noodles that can't be undone - those preconfigured by the puzzle.
+        """
+        self._placed = list(board_noodles)
+        self._undone = []
+        self._fixed = frozenset(fixed)
+
+    def push(self, board_noodle):
+        """Record a noodle placed on the board, discarding any moves undone.
+
+        Args:
+            board_noodle: The BoardNoodle instance.
+        """
+        self._placed.append(board_noodle)
+        self._undone.clear()
+
+    def undo(self):
+        """Take the noodle placed last off the board.
+
+        Returns:
+            The BoardNoodle instance, or None if there is no move to undo.
+        """
+        if not self.can_undo:
+            return None
+
+        board_noodle = self._placed.pop()
+        self._undone.append(board_noodle)
+        return board_noodle
+
+    def redo(self):
+        """Put the noodle undone last back on the board.
+
+        Returns:
+            The BoardNoodle instance, or None if there is no move to redo.
+        """
+        if not self._undone:
+            return None
+
+        board_noodle = self._undone.pop()
+        self._placed.append(board_noodle)
+        return board_noodle
+
+    @property
+    def can_undo(self):
+        """Whether there is a move to undo."""
+        return bool(self._placed) and self._placed[-1].noodle_id not in self._fixed
+
+    @property
+    def can_redo(self):
+        """Whether there is a move to redo."""
+        return bool(self._undone)
+
+    def __iter__(self):
+        return iter(self._placed)
+
+    def __len__(self):
+        return len(self._placed)
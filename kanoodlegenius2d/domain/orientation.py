@@ -1,5 +1,4 @@
-import collections
-
+import functools
 
 E = 'E'
 SE = 'SE'
@@ -8,6 +7,37 @@ W = 'W'
 NW = 'NW'
 NE = 'NE'
 
+# The orientations in clockwise order. The index of an orientation in this
+# tuple is its integer code.
+NAMES = (E, SE, SW, W, NW, NE)
+
+# The integer code of each orientation.
+CODES = {name: code for code, name in enumerate(NAMES)}
+
+# The number of ways a noodle can be transformed - each of the 6 rotations, flipped and not flipped.
+TRANSFORMS = 12
+
+# The step each orientation takes across the board in axial hex coordinates
+# (column, row), indexed by orientation code.
+OFFSETS = ((1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1))
+
+# Lookup tables, indexed by orientation code.
+_ROTATE = tuple((code + 1) % 6 for code in range(6))
+_OPPOSITE = tuple((code + 3) % 6 for code in range(6))
+_FLIP = tuple((3 - code) % 6 for code in range(6))  # E <-> W, SE <-> SW, NE <-> NW
+
+# For each transform, the code each orientation code becomes. Transforms 0 - 5
+# rotate clockwise by that number of increments. Transforms 6 - 11 flip and then
+# rotate by the transform less 6 increments.
+_TRANSFORM = tuple(tuple(((_FLIP[code] if t >= 6 else code) + t) % 6 for code in range(6))
+                   for t in range(TRANSFORMS))
+
+# The same lookup tables keyed by orientation name.
+_ROTATE_NAMES = {name: NAMES[_ROTATE[code]] for name, code in CODES.items()}
+_OPPOSITE_NAMES = {name: NAMES[_OPPOSITE[code]] for name, code in CODES.items()}
+_FLIP_NAMES = {name: NAMES[_FLIP[code]] for name, code in CODES.items()}
+_TRANSFORM_NAMES = tuple({name: NAMES[table[code]] for name, code in CODES.items()} for table in _TRANSFORM)
+
 
 def rotate(start):
     """Rotate the orientation clockwise one increment from the starting
@@ -18,18 +48,11 @@ def rotate(start):
     Returns:
         The orientation one increment clockwise from the start.
     """
-    orientations = collections.deque([NE, NW, W, SW, SE, E])
-
-    if start not in orientations:
+    try:
+        return _ROTATE_NAMES[start]
+    except KeyError:
         raise ValueError('Invalid orientation {}'.format(start))
 
-    while True:
-        orientations.rotate()
-        if orientations[1] == start:
-            break
-
-    return orientations[0]
-
 
 def opposite(orientation):
     """Return the orientation opposite from the one supplied, e.g. E --> W
@@ -39,13 +62,78 @@ def opposite(orientation):
     Returns:
         The opposite orientation.
     """
-    opposites = {
-        E: W,
-        SE: NW,
-        NE: SW
-    }
+    return _OPPOSITE_NAMES[orientation]
 
-    try:
-        return opposites[orientation]
-    except KeyError:
-        return dict(zip(opposites.values(), opposites.keys()))[orientation]
+
+def flip(orientation):
+    """Return the orientation mirrored on the Y axis, e.g. NE --> NW
+
+    Args:
+        orientation: The orientation to flip.
+    Returns:
+        The flipped orientation.
+    """
+    return _FLIP_NAMES[orientation]
+
+
+def transform(parts, transform):
+    """Apply a transform to the orientations of a noodle's parts.
+
+    Transforms 0 - 5 rotate the noodle clockwise by that number of increments.
+    Transforms 6 - 11 flip the noodle first and then rotate it by the transform
+    less 6 increments.
+
+    Args:
+        parts: A sequence of orientations - either names or integer codes.
+        transform: The transform to apply (0 - 11).
+    Returns:
+        A tuple of the transformed orientations, of the same kind as supplied.
+    """
+    if transform not in range(TRANSFORMS):
+        raise ValueError('Invalid transform {}'.format(transform))
+
+    table = _TRANSFORM_NAMES[transform]
+
+    if parts and isinstance(parts[0], int):
+        table = _TRANSFORM[transform]
+
+    return tuple(table[part] for part in parts)
+
+
+def shape(parts):
+    """Get the shape that a noodle's parts make, independent of where the
+    noodle is on the board.
+
+    Two noodles look identical when their shapes are equal, even if their
+    parts are orientated differently (for example when one noodle's parts
+    run in the reverse order to the other's).
+
+    Args:
+        parts: A sequence of orientation names.
+    Returns:
+        A frozenset of the axial (column, row) coordinates of each part,
+        translated so that the smallest column and row are 0.
+    """
+    # To avoid circular dependency
+    from kanoodlegenius2d.domain import pieces
+
+    return pieces.shape(pieces.path(parts))
+
+
+@functools.lru_cache(maxsize=None)
+def unique_transforms(parts):
+    """Get the transforms of a noodle that produce distinct shapes.
+
+    A symmetric noodle looks the same under more than one transform. Only
+    the lowest numbered transform of each distinct shape is included. The
+    result is cached.
+
+    Args:
+        parts: A tuple of orientation names.
+    Returns:
+        A tuple of transforms (0 - 11) in ascending order.
+    """
+    # To avoid circular dependency
+    from kanoodlegenius2d.domain import pieces
+
+    return pieces.unique_transforms(pieces.path(parts))
@@ -0,0 +1,156 @@
+"""A compact binary encoding of puzzles.
+
+Each noodle placement is packed into 2 bytes - the index of the noodle in
+data.NOODLES (3 bits), the transform applied to it (4 bits) and the hole its
+root part sits in (6 bits). Every puzzle places all 7 noodles between its
+preconfigured noodles and its solution, so a puzzle packs into a fixed size
+record of 15 bytes: the number of preconfigured noodles, followed by the
+preconfigured placements and then the solution placements.
+
+Records unpack straight into Placement instances from the placement table,
+with no string parsing or database access.
+"""
+
+from collections import namedtuple
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import holes
+from kanoodlegenius2d.domain import orientation
+from kanoodlegenius2d.domain import placements
+
+# The size in bytes of a packed placement and of a packed puzzle.
+PLACEMENT_SIZE = 2
+RECORD_SIZE = 1 + len(data.NOODLES) * PLACEMENT_SIZE
+
+# An unpacked puzzle. Occupied is the bitmask of the holes occupied by the
+# preconfigured noodles, designations the designations of the noodles that
+# remain to be placed and solution a tuple of their Placement instances.
+PackedPuzzle = namedtuple('PackedPuzzle', 'occupied designations solution')
+
+
+def pack_placement(placement):
+    """Pack a single placement into an integer code.
+
+    Args:
+        placement: The Placement instance.
+    Returns:
+        An integer code that fits into 13 bits.
+    """
+    return (_NOODLE_INDEX[placement.designation] << 10) | (placement.transform << 6) | placement.position
+
+
+def unpack_placement(code):
+    """Unpack an integer code into a placement.
+
+    Args:
+        code: The integer code of the placement.
+    Returns:
+        The Placement instance.
+    Raises:
+        ValueError: If the code is not that of a placement on the board.
+    """
+    try:
+        return _PLACEMENTS[code]
+    except KeyError:
+        raise ValueError('Invalid placement code {}'.format(code))
+
+
+def pack(noodles, solution):
+    """Pack a puzzle into a record.
+
+    Args:
+        noodles: A sequence of the Placement instances of the noodles preconfigured on the puzzle.
+        solution: A sequence of the Placement instances of the remaining noodles.
+    Returns:
+        The record, as bytes.
+    Raises:
+        ValueError: If the puzzle does not place every noodle exactly once.
+    """
+    placed = [placement.designation for placement in noodles] + [placement.designation for placement in solution]
+
+    if sorted(placed) != sorted(_NOODLE_INDEX):
+        raise ValueError('A puzzle must place every noodle exactly once')
+
+    record = bytearray([len(noodles)])
+
+    for placement in list(noodles) + list(solution):
+        record += pack_placement(placement).to_bytes(PLACEMENT_SIZE, 'big')
+
+    return bytes(record)
+
+
+def unpack(record):
+    """Unpack a record into the placements of a puzzle.
+
+    Args:
+        record: The record, as bytes.
+    Returns:
+        A 2-tuple of a tuple of the Placement instances of the noodles
+        preconfigured on the puzzle and a tuple of those of the solution.
+    Raises:
+        ValueError: If the record is malformed.
+    """
+    if len(record) != RECORD_SIZE or record[0] > len(data.NOODLES):
+        raise ValueError('Malformed puzzle record')
+
+    placements_ = tuple(unpack_placement(int.from_bytes(record[i:i+PLACEMENT_SIZE], 'big'))
+                        for i in range(1, RECORD_SIZE, PLACEMENT_SIZE))
+
+    return placements_[:record[0]], placements_[record[0]:]
+
+
+def load(record):
+    """Load a record into the bitmasks a solver works with.
+
+    Args:
+        record: The record, as bytes.
+    Returns:
+        A PackedPuzzle instance.
+    Raises:
+        ValueError: If the record is malformed.
+    """
+    noodles, solution = unpack(record)
+    occupied = bitboard.EMPTY
+
+    for placement in noodles:
+        occupied |= placement.mask
+
+    return PackedPuzzle(occupied=occupied, designations=tuple(placement.designation for placement in solution),
+                        solution=solution)
+
+
+def iter_records(packed):
+    """Iterate over the records in a pack of puzzles.
+
+    Args:
+        packed: The bytes of a number of records, one after the other.
+    Returns:
+        An iterator of records.
+    Raises:
+        ValueError: If the pack does not hold a whole number of records.
+    """
+    if len(packed) % RECORD_SIZE:
+        raise ValueError('Pack size {} is not a multiple of {}'.format(len(packed), RECORD_SIZE))
+
+    return (packed[i:i+RECORD_SIZE] for i in range(0, len(packed), RECORD_SIZE))
+
+
+def _index_placements():
+    """Index every placement of every transform of each noodle by its code."""
+    codes = {}
+
+    for designation, _, _, parts in data.NOODLES:
+        for t in range(orientation.TRANSFORMS):
+            transformed = orientation.transform(parts, t)
+            for position in range(holes.COUNT):
+                placement = placements.find(designation, transformed, position)
+                if placement is not None:
+                    # A symmetric noodle's transforms can share their parts and so their Placement
+                    codes[(_NOODLE_INDEX[designation] << 10) | (t << 6) | position] = placement
+
+    return codes
+
+
+_NOODLE_INDEX = {designation: i for i, (designation, _, _, _) in enumerate(data.NOODLES)}
+_PLACEMENTS = _index_placements()
@@ -0,0 +1,300 @@
+"""A registry of the sets of pieces that boards can be filled with.
+
+A piece is any connected polyhex - a group of cells of the hex grid - of any
+size, with the colour and image it is drawn with. Its cells are held as axial
+(column, row) offsets from its root cell, root first. A noodle is a piece
+whose cells run in a path from one end to the other, and so can also be
+described by the orientation of each part relative to the one before it.
+
+The seven noodles of the game are registered as the default piece set. Other
+sets can be registered in code or loaded from a JSON file, and the placement
+table and solver built for them on any board geometry:
+
+    {
+        "name": "triples",
+        "pieces": [
+            {"designation": "I", "colour": "#e60000", "image": "red_sphere.png", "parts": ["E", "E"]},
+            {"designation": "V", "colour": "#ffff00", "image": "yellow_sphere.png", "picture": " .\\n. ."}
+        ]
+    }
+"""
+
+from collections import namedtuple
+import json
+
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import geometry
+from kanoodlegenius2d.domain import orientation
+
+# The name of the piece set the game is played with.
+DEFAULT = 'kanoodle'
+
+# A single piece. Cells is a tuple of the axial (column, row) offsets of each
+# of its cells from its root cell, beginning with the root at (0, 0). Parts is
+# the tuple of part orientations of a noodle, or None when the piece's cells
+# do not run in a path.
+Piece = namedtuple('Piece', 'designation colour image cells parts')
+
+# A named set of pieces.
+PieceSet = namedtuple('PieceSet', 'name pieces')
+
+
+def from_parts(designation, colour, image, parts):
+    """Create a piece from the orientations of its parts, as a noodle is defined.
+
+    Args:
+        designation: The designation of the piece.
+        colour: The colour of the piece.
+        image: The filename of the image the piece is drawn with.
+        parts: A sequence of the orientations of each part after the root, relative to the one before.
+    Returns:
+        The Piece instance.
+    Raises:
+        ValueError: If the path of parts crosses itself.
+    """
+    cells = path(parts)
+
+    if len(set(cells)) != len(cells):
+        raise ValueError('The parts of piece {} overlap'.format(designation))
+
+    return Piece(designation, colour, image, cells, tuple(parts))
+
+
+def from_cells(designation, colour, image, cells):
+    """Create a piece from the axial coordinates of its cells.
+
+    Args:
+        designation: The designation of the piece.
+        colour: The colour of the piece.
+        image: The filename of the image the piece is drawn with.
+        cells: A sequence of the axial (column, row) coordinates of each cell.
+            The first cell is the piece's root.
+    Returns:
+        The Piece instance.
+    Raises:
+        ValueError: If there are no cells, a cell appears twice or the cells are not connected.
+    """
+    cells = [tuple(cell) for cell in cells]
+
+    if not cells or len(set(cells)) != len(cells):
+        raise ValueError('Piece {} must have at least one cell and no cell twice'.format(designation))
+
+    root_column, root_row = cells[0]
+    cells = tuple((column - root_column, row - root_row) for column, row in cells)
+
+    if len(_connected(cells)) != len(cells):
+        raise ValueError('The cells of piece {} are not connected'.format(designation))
+
+    return Piece(designation, colour, image, cells, None)
+
+
+def from_picture(designation, colour, image, picture):
+    """Create a piece from a picture of its shape, drawn as a board is
+    drawn for geometry.Geometry.from_picture. The root is the first cell
+    of the top row.
+
+    Args:
+        designation: The designation of the piece.
+        colour: The colour of the piece.
+        image: The filename of the image the piece is drawn with.
+        picture: The picture string.
+    Returns:
+        The Piece instance.
+    Raises:
+        ValueError: If the picture is not of a connected shape on a hex grid.
+    """
+    return from_cells(designation, colour, image, geometry.Geometry.from_picture(picture).cells)
+
+
+def path(parts):
+    """Get the cells that a noodle's parts run through.
+
+    Args:
+        parts: A sequence of the orientations of each part after the root, relative to the one before.
+    Returns:
+        A tuple of the axial (column, row) offsets of each cell from the root
+        cell, beginning with the root at (0, 0).
+    """
+    column, row = 0, 0
+    cells = [(column, row)]
+
+    for part in parts:
+        d_column, d_row = orientation.OFFSETS[orientation.CODES[part]]
+        column, row = column + d_column, row + d_row
+        cells.append((column, row))
+
+    return tuple(cells)
+
+
+def shape(cells):
+    """Get the shape that a piece's cells make, independent of where the
+    piece is on the board.
+
+    Args:
+        cells: A sequence of axial (column, row) offsets from the root cell.
+    Returns:
+        A frozenset of the axial (column, row) coordinates of each cell,
+        translated so that the smallest column and row are 0.
+    """
+    return frozenset(_normalise(cells))
+
+
+def transform(cells, transform):
+    """Apply one of the 12 rotate/flip transforms to the cells of a piece.
+
+    The transforms match those of orientation.transform, so transforming a
+    noodle's cells gives the cells of its transformed parts.
+
+    Args:
+        cells: A sequence of axial (column, row) offsets from the root cell.
+        transform: The transform to apply (0 - 11).
+    Returns:
+        A tuple of the transformed offsets, in the same order.
+    """
+    if transform not in range(orientation.TRANSFORMS):
+        raise ValueError('Invalid transform {}'.format(transform))
+
+    transformed = []
+
+    for column, row in cells:
+        if transform >= 6:
+            column = -column - row
+        for _ in range(transform % 6):
+            column, row = -row, column + row
+        transformed.append((column, row))
+
+    return tuple(transformed)
+
+
+def unique_transforms(cells):
+    """Get the transforms of a piece that produce distinct shapes.
+
+    Args:
+        cells: A sequence of axial (column, row) offsets from the root cell.
+    Returns:
+        A tuple of transforms (0 - 11) in ascending order, the lowest of
+        each that produce the same shape.
+    """
+    shapes = set()
+    transforms = []
+
+    for t in range(orientation.TRANSFORMS):
+        transformed = shape(transform(cells, t))
+        if transformed not in shapes:
+            shapes.add(transformed)
+            transforms.append(t)
+
+    return tuple(transforms)
+
+
+def canonical(cells):
+    """Get a key for the shape of a piece that is the same for any piece
+    that can be transformed and moved to cover the same cells.
+
+    Args:
+        cells: A sequence of axial (column, row) offsets from the root cell.
+    Returns:
+        A tuple of axial (column, row) coordinates.
+    """
+    return min(_normalise(transform(cells, t)) for t in range(orientation.TRANSFORMS))
+
+
+def register(piece_set):
+    """Register a piece set, replacing any registered under the same name.
+
+    Args:
+        piece_set: The PieceSet instance.
+    Raises:
+        ValueError: If two pieces in the set share a designation.
+    """
+    designations = [piece.designation for piece in piece_set.pieces]
+
+    if len(set(designations)) != len(designations):
+        raise ValueError('The pieces of set {} must have distinct designations'.format(piece_set.name))
+
+    _REGISTRY[piece_set.name] = piece_set
+
+
+def get(name=DEFAULT):
+    """Get a registered piece set.
+
+    Args:
+        name: The name of the piece set (default: the game's noodles).
+    Returns:
+        The PieceSet instance.
+    Raises:
+        KeyError: If no piece set is registered under the name.
+    """
+    return _REGISTRY[name]
+
+
+def names():
+    """Get the names of every registered piece set.
+
+    Returns:
+        A sorted list of names.
+    """
+    return sorted(_REGISTRY)
+
+
+def load(path):
+    """Load a piece set from a JSON file and register it.
+
+    Each piece in the file has a designation, colour and image, and its
+    shape as one of "parts" (a list of part orientations), "cells" (a list
+    of [column, row] pairs) or "picture" (a picture string).
+
+    Args:
+        path: The path to the JSON file.
+    Returns:
+        The PieceSet instance.
+    Raises:
+        ValueError: If a piece is malformed.
+    """
+    with open(path) as f:
+        definition = json.load(f)
+
+    pieces = []
+
+    for entry in definition['pieces']:
+        args = entry['designation'], entry['colour'], entry['image']
+        if 'parts' in entry:
+            pieces.append(from_parts(*args, entry['parts']))
+        elif 'cells' in entry:
+            pieces.append(from_cells(*args, entry['cells']))
+        elif 'picture' in entry:
+            pieces.append(from_picture(*args, entry['picture']))
+        else:
+            raise ValueError('Piece {} has no parts, cells or picture'.format(entry['designation']))
+
+    piece_set = PieceSet(definition['name'], tuple(pieces))
+    register(piece_set)
+
+    return piece_set
+
+
+def _normalise(cells):
+    """Sort cells and translate them so that the smallest column and row are 0."""
+    min_column = min(column for column, _ in cells)
+    min_row = min(row for _, row in cells)
+    return tuple(sorted((column - min_column, row - min_row) for column, row in cells))
+
+
+def _connected(cells):
+    """Find the cells reachable from the first by stepping between neighbouring cells."""
+    remaining = set(cells)
+    reached, pending = set(), [cells[0]]
+
+    while pending:
+        column, row = pending.pop()
+        if (column, row) in remaining:
+            remaining.discard((column, row))
+            reached.add((column, row))
+            pending.extend((column + d_column, row + d_row) for d_column, d_row in orientation.OFFSETS)
+
+    return reached
+
+
+_REGISTRY = {}
+
+register(PieceSet(DEFAULT, tuple(from_parts(*noodle) for noodle in data.NOODLES)))
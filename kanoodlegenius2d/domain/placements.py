@@ -0,0 +1,206 @@
+"""A precomputed table of every legal placement of every noodle on the board.
+
+The table is built once when the module is first imported. Each placement
+records the transform applied to the noodle, the hole its root part sits in,
+the hole positions of each of its parts and those positions as a bitmask, so
+that callers can look placements up rather than walking the board hole by hole.
+
+Tables for other piece sets and board geometries are built with build().
+"""
+
+from collections import namedtuple
+import logging
+import sys
+import time
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import holes
+from kanoodlegenius2d.domain import orientation
+from kanoodlegenius2d.domain import pieces
+
+_LOG = logging.getLogger(__name__)
+
+# A single placement of a noodle on the board. Parts is None for a piece that is not a noodle.
+Placement = namedtuple('Placement', 'designation transform position parts positions mask')
+
+# Statistics about the building of the placement table.
+TableStats = namedtuple('TableStats', 'placements build_time size')
+
+# The number of transforms of a noodle, how many of them produce distinct shapes, and the ratio between the two.
+TransformStats = namedtuple('TransformStats', 'transforms unique reduction')
+
+
+def get(designation):
+    """Get every legal placement of a noodle.
+
+    Where a symmetric noodle produces the same shape under more than one
+    transform, only the placements of the lowest numbered transform are
+    included.
+
+    Args:
+        designation: The designation of the noodle.
+    Returns:
+        A tuple of Placement instances.
+    """
+    return _TABLE[designation]
+
+
+def build(piece_set, board):
+    """Build the table of every legal placement of a set of pieces on a board.
+
+    Args:
+        piece_set: The pieces.PieceSet instance.
+        board: The geometry.Geometry instance of the board.
+    Returns:
+        A dictionary keyed by piece designation of tuples of Placement
+        instances, leaving out the transforms that produce the same shape
+        as a lower numbered transform.
+    """
+    return _build(piece_set, board)[0]
+
+
+def find(designation, parts, position):
+    """Find the placement of a noodle with the specified part orientations
+    and root position.
+
+    Args:
+        designation: The designation of the noodle.
+        parts: A sequence of the orientations of the noodle's parts.
+        position: The hole position of the noodle's root part.
+    Returns:
+        The Placement instance, or None if the noodle would not fit
+        on the board in that position.
+    """
+    return _INDEX.get((designation, tuple(parts), position))
+
+
+def drops(designation, parts, part_pos, occupied):
+    """Find every hole that a part of a noodle can be dropped onto, such that
+    the whole noodle fits on the board without overlapping the occupied holes.
+
+    Args:
+        designation: The designation of the noodle.
+        parts: A sequence of the orientations of the noodle's parts.
+        part_pos: The part of the noodle being dropped (0 - 4).
+        occupied: A bitmask of the holes already occupied on the board.
+    Returns:
+        A bitmask of the holes the part can be dropped onto.
+    """
+    holes_ = bitboard.EMPTY
+
+    for placement in _BY_PARTS.get((designation, tuple(parts)), ()):
+        if not placement.mask & occupied:
+            holes_ |= 1 << placement.positions[part_pos]
+
+    return holes_
+
+
+def stats():
+    """Get statistics about the placement table.
+
+    Returns:
+        A TableStats instance holding the number of placements in the table,
+        the time in seconds taken to build it and its approximate size in bytes.
+    """
+    return TableStats(placements=sum(len(p) for p in _TABLE.values()), build_time=_BUILD_TIME,
+                      size=_sizeof((_TABLE, _INDEX)))
+
+
+def transform_stats():
+    """Get the number of transforms of each noodle that produce distinct
+    shapes, and so appear in the placement table.
+
+    Returns:
+        A dictionary of TransformStats instances keyed by noodle designation.
+    """
+    stats = {}
+
+    for piece in pieces.get().pieces:
+        unique = len(pieces.unique_transforms(piece.cells))
+        stats[piece.designation] = TransformStats(transforms=orientation.TRANSFORMS, unique=unique,
+                                                  reduction=orientation.TRANSFORMS / unique)
+
+    return stats
+
+
+def _build(piece_set, board):
+    """Build the table of placements of a set of pieces on a board, along with
+    an index of every noodle placement that includes the transforms left out of
+    the table because they produce the same shape as another.
+    """
+    table, index = {}, {}
+
+    for piece in piece_set.pieces:
+        unique = pieces.unique_transforms(piece.cells)
+        piece_placements = []
+
+        for t in range(orientation.TRANSFORMS):
+            cells = pieces.transform(piece.cells, t)
+            transformed = orientation.transform(piece.parts, t) if piece.parts is not None else None
+
+            for position in range(board.count):
+                column, row = board.coordinates(position)
+                positions = tuple(board.position(column + d_column, row + d_row) for d_column, d_row in cells)
+                if None not in positions:
+                    placement = Placement(piece.designation, t, position, transformed,
+                                          positions, bitboard.to_mask(positions))
+                    if transformed is not None:
+                        index[(piece.designation, transformed, position)] = placement
+                    if t in unique:
+                        piece_placements.append(placement)
+
+        table[piece.designation] = tuple(piece_placements)
+
+    return table, index
+
+
+def _index_by_parts(index):
+    """Group the placements of every transform of each noodle by the
+    designation and part orientations of the noodle.
+    """
+    by_parts = {}
+
+    for (designation, parts, _), placement in sorted(index.items()):
+        by_parts.setdefault((designation, parts), []).append(placement)
+
+    return {key: tuple(value) for key, value in by_parts.items()}
+
+
+def _sizeof(obj, seen=None):
+    """Approximate the memory footprint of an object and everything it contains."""
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(_sizeof(k, seen) + _sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (tuple, list)):
+        size += sum(_sizeof(item, seen) for item in obj)
+
+    return size
+
+
+_started = time.perf_counter()
+_TABLE, _INDEX = _build(pieces.get(), holes.BOARD)
+_BUILD_TIME = time.perf_counter() - _started
+_BY_PARTS = _index_by_parts(_INDEX)
+
+_LOG.debug('Built table of {} placements in {:.1f}ms'.format(sum(len(p) for p in _TABLE.values()),
+                                                             _BUILD_TIME * 1000))
+
+
+if __name__ == '__main__':
+    table_stats = stats()
+    noodle_transform_stats = transform_stats()
+    for noodle_designation in sorted(_TABLE):
+        noodle_stats = noodle_transform_stats[noodle_designation]
+        print('Noodle {}: {} placements, {} of {} transforms unique ({:.1f}x reduction)'.format(
+            noodle_designation, len(_TABLE[noodle_designation]), noodle_stats.unique, noodle_stats.transforms,
+            noodle_stats.reduction))
+    print('Total: {} placements, built in {:.1f}ms, {:.1f}KB'.format(
+        table_stats.placements, table_stats.build_time * 1000, table_stats.size / 1024))
@@ -0,0 +1,128 @@
+"""Enumerate and count every solution to a puzzle.
+
+The search is split into branches by the candidate placements for the first
+empty hole on the board, and the branches are shared out across a pool of
+worker processes. When counting, branches that are symmetric images of one
+another are only searched once.
+
+Run the module to audit every puzzle in the game:
+
+    python -m kanoodlegenius2d.domain.solutions
+"""
+
+import multiprocessing
+
+from kanoodlegenius2d.domain import solver
+from kanoodlegenius2d.domain import symmetry
+
+
+def iter_solutions(puzzle, processes=None):
+    """Iterate over every distinct solution to a puzzle.
+
+    Solutions are yielded as each branch of the search completes, so the
+    order in which they arrive is not fixed.
+
+    Args:
+        puzzle: The Puzzle instance.
+        processes: The number of worker processes to use (default: the
+            number of CPUs). When 1, the search runs in the calling process.
+    Returns:
+        An iterator of solutions, each a tuple of Placement instances for the
+        noodles that are not preconfigured as part of the puzzle.
+    """
+    occupied, designations = puzzle.template()
+    tasks = solver.branches(occupied, designations)
+
+    if processes == 1:
+        for task in tasks:
+            yield from _solve_branch(task)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        for solutions in pool.imap_unordered(_solve_branch, tasks):
+            yield from solutions
+
+
+def count_solutions(puzzle, processes=None):
+    """Count the number of distinct solutions to a puzzle.
+
+    Args:
+        puzzle: The Puzzle instance.
+        processes: The number of worker processes to use (default: the
+            number of CPUs). When 1, the search runs in the calling process.
+    Returns:
+        The number of solutions.
+    """
+    return count_all_solutions([puzzle], processes)[puzzle]
+
+
+def count_all_solutions(puzzles, processes=None):
+    """Count the number of distinct solutions to each of a number of puzzles.
+
+    The branches of every puzzle are shared out across a single pool of
+    worker processes.
+
+    Args:
+        puzzles: A sequence of Puzzle instances.
+        processes: The number of worker processes to use (default: the
+            number of CPUs). When 1, the search runs in the calling process.
+    Returns:
+        A dictionary of the number of solutions keyed by puzzle.
+    """
+    counts = {puzzle: 0 for puzzle in puzzles}
+    tasks = []
+
+    for i, puzzle in enumerate(puzzles):
+        occupied, designations = puzzle.template()
+        tasks.extend((i, branch) for branch in symmetry.branches(occupied, designations))
+
+    if processes == 1:
+        results = map(_count_branch, tasks)
+        for i, count in results:
+            counts[puzzles[i]] += count
+        return counts
+
+    with multiprocessing.Pool(processes) as pool:
+        for i, count in pool.imap_unordered(_count_branch, tasks):
+            counts[puzzles[i]] += count
+
+    return counts
+
+
+def _solve_branch(task):
+    placement, occupied, remaining = task
+    return [(placement,) + solution for solution in solver.iter_solutions(occupied, remaining)]
+
+
+def _count_branch(task):
+    i, (weight, occupied, remaining) = task
+    return i, weight * sum(1 for _ in solver.iter_solutions(occupied, remaining))
+
+
+def main():
+    from kanoodlegenius2d.domain import data
+    from kanoodlegenius2d.domain import models
+    from kanoodlegenius2d.domain.models import Level, Puzzle
+
+    models.database.init(':memory:')
+    data.setup()
+
+    puzzles = list(Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number, Puzzle.number))
+    counts = count_all_solutions(puzzles)
+    failures = 0
+
+    for puzzle in puzzles:
+        count = counts[puzzle]
+        if count != 1:
+            failures += 1
+        print('Level {} puzzle {}: {} solution{}{}'.format(puzzle.level.number, puzzle.number, count,
+                                                          '' if count == 1 else 's',
+                                                          '' if count == 1 else '  <-- not unique'))
+
+    print('{} of {} puzzles have a unique solution'.format(len(puzzles) - failures, len(puzzles)))
+
+    return failures
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if main() else 0)
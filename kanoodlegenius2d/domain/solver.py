@@ -0,0 +1,344 @@
+"""An exact cover solver for completing a board.
+
+This is Knuth's Algorithm X with each row (a noodle placement) held as a
+bitmask. The column chosen at each step is the lowest empty hole on the
+board. Every hole below it is already covered, so the only placements that
+can fill it are those whose lowest hole is that hole. Indexing placements by
+their lowest hole means each step only looks at a handful of candidates, and
+an overlap check is a single AND.
+
+The module functions solve the game's board with its noodles. A Solver
+instance solves any board geometry with any set of pieces.
+"""
+
+from collections import namedtuple
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import holes
+from kanoodlegenius2d.domain import pieces
+from kanoodlegenius2d.domain import placements
+
+# Measures of the effort of an exhaustive search. Nodes is the number of
+# board states visited, backtracks the number of those that were dead ends,
+# branching the mean number of candidate placements at the states that had
+# any and solutions the number of solutions found.
+SearchStats = namedtuple('SearchStats', 'nodes backtracks branching solutions')
+
+
+class Solver:
+    """Completes boards of a single geometry with pieces from a single set."""
+
+    def __init__(self, piece_set, board, table=None, prune=False):
+        """Initialise a new Solver.
+
+        Where a set holds more than one piece of the same shape, only one of
+        them is tried in each place, so solutions that differ only by which
+        of those pieces goes where are found once.
+
+        Args:
+            piece_set: The pieces.PieceSet instance.
+            board: The geometry.Geometry instance of the board.
+            table: Optional placement table of the pieces on the board, as
+                built by placements.build(). Built when not supplied.
+            prune: Whether to back out of a board state as soon as a region of
+                empty holes is left that the remaining pieces cannot fill (see
+                dead_regions()). This costs more at every state than it saves on
+                small boards, but cuts the search on large ones.
+        """
+        if table is None:
+            table = placements.build(piece_set, board)
+
+        self.full = (1 << board.count) - 1
+        self._candidates = _index_candidates(table, board.count)
+        self._sizes = {piece.designation: len(piece.cells) for piece in piece_set.pieces}
+        self._shapes = {piece.designation: pieces.canonical(piece.cells) for piece in piece_set.pieces}
+        self._duplicates = len(set(self._shapes.values())) < len(self._shapes)
+        self._masks = {designation: frozenset(placement.mask for placement in piece_placements)
+                       for designation, piece_placements in table.items()}
+        self._neighbours = bitboard.neighbours(board)
+        self._prune = prune
+
+    def solve(self, occupied, designations, rng=None, check=None):
+        """Find a way of placing the specified pieces that fills every empty
+        hole on the board.
+
+        Args:
+            occupied: A bitmask of the holes already occupied on the board.
+            designations: The designations of the pieces still to be placed.
+            rng: Optional random.Random instance used to shuffle the order in
+                which candidate placements are tried, so that a random solution
+                is found rather than the first.
+            check: Optional callable, called with no arguments at every board
+                state the search visits. It may raise an exception to abandon
+                the search.
+        Returns:
+            A tuple of Placement instances, one for each piece, or None if
+            the board cannot be completed.
+        """
+        for solution in self.iter_solutions(occupied, designations, rng, check):
+            return solution
+        return None
+
+    def iter_solutions(self, occupied, designations, rng=None, check=None):
+        """Iterate over every way of placing the specified pieces that fills
+        every empty hole on the board.
+
+        Args:
+            occupied: A bitmask of the holes already occupied on the board.
+            designations: The designations of the pieces still to be placed.
+            rng: Optional random.Random instance used to shuffle the order in
+                which candidate placements are tried.
+            check: Optional callable, called at every board state the search visits.
+        Returns:
+            An iterator of solutions, each a tuple of Placement instances.
+        """
+        return self._search(occupied, tuple(designations), [], rng, check)
+
+    def branches(self, occupied, designations):
+        """Split the search for solutions into independent branches, one for
+        each candidate placement that fills the lowest empty hole on the board.
+
+        Every solution belongs to exactly one branch, so the branches can be
+        searched separately (for example in different processes) and their
+        solutions combined.
+
+        Args:
+            occupied: A bitmask of the holes already occupied on the board.
+            designations: The designations of the pieces still to be placed.
+        Returns:
+            A list of 3-tuples of the placement that begins the branch, the
+            bitmask of the holes occupied once it is placed, and a tuple of the
+            designations of the pieces that remain to be placed.
+        """
+        designations = tuple(designations)
+        free = self.full & ~occupied
+
+        if not designations or not free:
+            return []
+
+        hole = (free & -free).bit_length() - 1
+        result = []
+        tried = set()
+
+        for i, designation in enumerate(designations):
+            if self._duplicates:
+                if self._shapes[designation] in tried:
+                    continue
+                tried.add(self._shapes[designation])
+            others = designations[:i] + designations[i+1:]
+            for placement in self._candidates[designation][hole]:
+                if not placement.mask & occupied:
+                    result.append((placement, occupied | placement.mask, others))
+
+        return result
+
+    def search_stats(self, occupied, designations):
+        """Search exhaustively for every solution, measuring the effort involved.
+
+        Args:
+            occupied: A bitmask of the holes already occupied on the board.
+            designations: The designations of the pieces still to be placed.
+        Returns:
+            A SearchStats instance.
+        """
+        counters = [0, 0, 0, 0, 0]  # nodes, backtracks, internal nodes, candidates, solutions
+        self._search_counted(occupied, tuple(designations), counters)
+        nodes, backtracks, internal, candidates, solutions = counters
+
+        return SearchStats(nodes=nodes, backtracks=backtracks, branching=candidates / internal if internal else 0,
+                           solutions=solutions)
+
+    def _search_counted(self, occupied, remaining, counters):
+        counters[0] += 1
+
+        if not remaining:
+            if occupied == self.full:
+                counters[4] += 1
+            else:
+                counters[1] += 1
+            return
+
+        candidates = self.branches(occupied, remaining)
+
+        if not candidates:
+            counters[1] += 1
+            return
+
+        counters[2] += 1
+        counters[3] += len(candidates)
+
+        for _, next_occupied, others in candidates:
+            self._search_counted(next_occupied, others, counters)
+
+    def _search(self, occupied, remaining, chosen, rng, check):
+        if check is not None:
+            check()
+
+        if not remaining:
+            if occupied == self.full:
+                yield tuple(chosen)
+            return
+
+        if self._prune and self._dead(occupied, remaining):
+            return
+
+        candidates = self.branches(occupied, remaining)
+
+        if rng is not None:
+            rng.shuffle(candidates)
+
+        for placement, next_occupied, others in candidates:
+            chosen.append(placement)
+            yield from self._search(next_occupied, others, chosen, rng, check)
+            chosen.pop()
+
+    def dead_regions(self, occupied, designations):
+        """Find the regions of empty holes on the board that the specified
+        pieces can never fill.
+
+        A connected region of empty holes is dead when no combination of the
+        pieces adds up to its size, or when it is too small to hold more than
+        one piece but none of the pieces fits it.
+
+        Args:
+            occupied: A bitmask of the holes already occupied on the board.
+            designations: The designations of the pieces still to be placed.
+        Returns:
+            A list of bitmasks, one for each dead region.
+        """
+        return list(self._dead_regions(occupied, designations))
+
+    def _dead(self, occupied, remaining):
+        """Whether a region of empty holes is left that the remaining pieces cannot fill."""
+        for _ in self._dead_regions(occupied, remaining):
+            return True
+        return False
+
+    def _dead_regions(self, occupied, designations):
+        """Iterate over the dead regions of the board, as dead_regions() finds them."""
+        sizes = {0}
+        for designation in designations:
+            sizes |= {size + self._sizes[designation] for size in sizes}
+
+        smallest = min((self._sizes[designation] for designation in designations), default=0)
+
+        for region in bitboard.regions(self.full & ~occupied, self._neighbours):
+            size = bitboard.count(region)
+            if size not in sizes:
+                yield region
+            elif size < 2 * smallest and not any(region in self._masks[d] for d in designations):
+                yield region
+
+
+def solve(occupied, designations, rng=None, check=None):
+    """Find a way of placing the specified noodles that fills every empty
+    hole on the board.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+        rng: Optional random.Random instance used to shuffle the order in
+            which candidate placements are tried, so that a random solution
+            is found rather than the first.
+        check: Optional callable, called with no arguments at every board
+            state the search visits. It may raise an exception to abandon
+            the search.
+    Returns:
+        A tuple of Placement instances, one for each noodle, or None if
+        the board cannot be completed.
+    """
+    return _SOLVER.solve(occupied, designations, rng, check)
+
+
+def hint(occupied, designations, check=None):
+    """Suggest a placement for one of the specified noodles that still
+    allows every empty hole on the board to be filled.
+
+    The placement suggested fills the lowest empty hole on the board.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+        check: Optional callable, called at every board state the search visits.
+    Returns:
+        A Placement instance, or None if the board cannot be completed
+        (or is already complete).
+    """
+    solution = solve(occupied, designations, check=check)
+    return solution[0] if solution else None
+
+
+def dead_regions(occupied, designations):
+    """Find the regions of empty holes on the board that the specified
+    noodles can never fill. See Solver.dead_regions().
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        A list of bitmasks, one for each dead region.
+    """
+    return _SOLVER.dead_regions(occupied, designations)
+
+
+def iter_solutions(occupied, designations, rng=None):
+    """Iterate over every way of placing the specified noodles that fills
+    every empty hole on the board.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+        rng: Optional random.Random instance used to shuffle the order in
+            which candidate placements are tried.
+    Returns:
+        An iterator of solutions, each a tuple of Placement instances.
+    """
+    return _SOLVER.iter_solutions(occupied, designations, rng)
+
+
+def branches(occupied, designations):
+    """Split the search for solutions into independent branches, one for
+    each candidate placement that fills the lowest empty hole on the board.
+    See Solver.branches().
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        A list of 3-tuples of the placement that begins the branch, the
+        bitmask of the holes occupied once it is placed, and a tuple of the
+        designations of the noodles that remain to be placed.
+    """
+    return _SOLVER.branches(occupied, designations)
+
+
+def search_stats(occupied, designations):
+    """Search exhaustively for every solution, measuring the effort involved.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        A SearchStats instance.
+    """
+    return _SOLVER.search_stats(occupied, designations)
+
+
+def _index_candidates(table, count):
+    """Index each piece's placements by the lowest hole they cover."""
+    candidates = {}
+
+    for designation, piece_placements in table.items():
+        by_hole = [[] for _ in range(count)]
+
+        for placement in piece_placements:
+            by_hole[min(placement.positions)].append(placement)
+
+        candidates[designation] = tuple(tuple(hole_placements) for hole_placements in by_hole)
+
+    return candidates
+
+
+_NOODLES = pieces.get()
+_SOLVER = Solver(_NOODLES, holes.BOARD,
+                 table={piece.designation: placements.get(piece.designation) for piece in _NOODLES.pieces})
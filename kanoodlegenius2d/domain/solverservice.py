@@ -0,0 +1,204 @@
+"""Run solver searches on a worker thread, away from the UI's event loop.
+
+A search is submitted as a callable that accepts a check callable, such as
+those prepared by Board.hint_search() and Board.solve_search(). The solver
+calls the check at every board state it visits, which is where the service
+counts progress and abandons searches that are cancelled or run out of time.
+
+Outcomes are queued by the worker and handed to the callbacks of each search
+when the thread that owns them calls poll(), so callbacks always run on that
+thread. A Tk widget polls with after():
+
+    def poll():
+        if service.poll():
+            widget.after(50, poll)
+
+Only the searches run on the worker. Anything that touches the database is
+left to the callbacks.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+_LOG = logging.getLogger(__name__)
+
+# The number of board states a search visits between each check on whether
+# it has been cancelled or run out of time, and each report of its progress.
+CHECK_INTERVAL = 256
+
+# The kinds of outcome queued by the worker.
+_PROGRESS, _RESULT, _ERROR, _CANCELLED = range(4)
+
+
+class SearchCancelledException(Exception):
+    """Raised within a search when its job has been cancelled."""
+
+
+class SearchTimeoutException(Exception):
+    """Raised within a search when it runs for longer than its timeout,
+    and passed to the job's onerror callback."""
+
+
+class Job:
+    """A search submitted to a SolverService."""
+
+    def __init__(self, search, onresult, onerror, onprogress, timeout):
+        self.nodes = 0
+        self._search = search
+        self._onresult = onresult
+        self._onerror = onerror
+        self._onprogress = onprogress
+        self._timeout = timeout
+        self._deadline = None
+        self._cancelled = False
+        self._done = False
+        self._outcomes = None
+
+    def cancel(self):
+        """Cancel the search. Its callbacks will not be called, and if it is
+        running it is abandoned at its next check."""
+        self._cancelled = True
+
+    @property
+    def cancelled(self):
+        """Whether the job has been cancelled."""
+        return self._cancelled
+
+    @property
+    def done(self):
+        """Whether the outcome of the job has been handed to its callbacks,
+        or the job was cancelled before it was."""
+        return self._done
+
+    def _run(self, outcomes):
+        """Run the search on the worker thread, queuing its outcome."""
+        self._outcomes = outcomes
+
+        if self._cancelled:
+            outcomes.put((self, _CANCELLED, None))
+            return
+
+        if self._timeout is not None:
+            self._deadline = time.monotonic() + self._timeout
+
+        try:
+            result = self._search(self._check)
+        except SearchCancelledException:
+            outcomes.put((self, _CANCELLED, None))
+        except Exception as e:
+            outcomes.put((self, _ERROR, e))
+        else:
+            outcomes.put((self, _RESULT, result))
+
+    def _check(self):
+        self.nodes += 1
+
+        if self.nodes % CHECK_INTERVAL:
+            return
+
+        if self._cancelled:
+            raise SearchCancelledException()
+
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise SearchTimeoutException('Search abandoned after {}s'.format(self._timeout))
+
+        if self._onprogress is not None:
+            self._outcomes.put((self, _PROGRESS, self.nodes))
+
+    def _deliver(self, kind, value):
+        """Hand an outcome to the job's callbacks, on the polling thread."""
+        if kind != _PROGRESS:
+            self._done = True
+
+        if self._cancelled:
+            self._done = True
+            return
+
+        if kind == _PROGRESS:
+            self._onprogress(value)
+        elif kind == _RESULT:
+            self._onresult(value)
+        elif kind == _ERROR:
+            if self._onerror is None:
+                _LOG.error('Unhandled error in search', exc_info=value)
+            else:
+                self._onerror(value)
+
+
+class SolverService:
+    """Runs searches one at a time on a worker thread."""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._outcomes = queue.Queue()
+        self._pending = []
+        self._thread = None
+
+    def submit(self, search, onresult, onerror=None, onprogress=None, timeout=None):
+        """Submit a search to run on the worker thread.
+
+        Args:
+            search: A callable that accepts a check callable, calls it at every
+                board state it visits and returns the result of the search.
+            onresult: Callback called with the result of the search.
+            onerror: Optional callback called with the exception raised by the
+                search, including a SearchTimeoutException when it runs out of
+                time. Errors are logged when not supplied.
+            onprogress: Optional callback called every so often while the search
+                runs, with the number of board states it has visited.
+            timeout: Optional number of seconds after which to abandon the search.
+        Returns:
+            The Job instance.
+        """
+        job = Job(search, onresult, onerror, onprogress, timeout)
+        self._pending.append(job)
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name='solver', daemon=True)
+            self._thread.start()
+
+        self._jobs.put(job)
+
+        return job
+
+    def poll(self):
+        """Hand the outcomes of searches queued since the last poll to their
+        callbacks. Must be called from the thread that submitted the searches.
+
+        Returns:
+            True if there are searches still to finish, False otherwise.
+        """
+        while True:
+            try:
+                job, kind, value = self._outcomes.get_nowait()
+            except queue.Empty:
+                break
+
+            job._deliver(kind, value)
+
+        self._pending = [job for job in self._pending if not job.done]
+
+        return bool(self._pending)
+
+    def cancel_all(self):
+        """Cancel every search that has yet to finish."""
+        for job in self._pending:
+            job.cancel()
+
+    def shutdown(self):
+        """Cancel every search and stop the worker thread, waiting for it to finish."""
+        self.cancel_all()
+
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            job._run(self._outcomes)
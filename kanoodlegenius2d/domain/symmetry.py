@@ -0,0 +1,252 @@
+"""The symmetries of the board.
+
+An automorphism of the board maps every hole onto another hole such that
+neighbouring holes stay neighbours in the correspondingly transformed
+orientation - one of the 12 rotations and reflections of the hex lattice.
+The automorphisms are found from the neighbour table when the module is
+first imported.
+
+Board states that an automorphism maps onto one another have the same
+solutions, mapped in the same way, so a solver or cache only has to deal with
+one of them: the canonical state.
+"""
+
+from collections import namedtuple
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import holes
+from kanoodlegenius2d.domain import orientation
+from kanoodlegenius2d.domain import packing
+from kanoodlegenius2d.domain import placements
+from kanoodlegenius2d.domain import solver
+from kanoodlegenius2d.domain import zobrist
+
+# A symmetry of the board. Transform is the orientation transform (0 - 11)
+# it applies to noodles and permutation a tuple of the hole each hole maps onto.
+Automorphism = namedtuple('Automorphism', 'transform permutation')
+
+
+def map_mask(automorphism, mask):
+    """Map a bitmask of holes through an automorphism.
+
+    Args:
+        automorphism: The Automorphism instance.
+        mask: The bitmask of holes.
+    Returns:
+        The bitmask of the holes they map onto.
+    """
+    tables = _MASK_TABLES[automorphism]
+    mapped = bitboard.EMPTY
+
+    for table in tables:
+        mapped |= table[mask & 0xff]
+        mask >>= 8
+
+    return mapped
+
+
+def map_placement(automorphism, placement):
+    """Map a noodle placement through an automorphism.
+
+    Args:
+        automorphism: The Automorphism instance.
+        placement: The Placement instance.
+    Returns:
+        The Placement instance it maps onto.
+    """
+    return placements.find(placement.designation, orientation.transform(placement.parts, automorphism.transform),
+                           automorphism.permutation[placement.position])
+
+
+def inverse(automorphism):
+    """Get the automorphism that undoes another.
+
+    Args:
+        automorphism: The Automorphism instance.
+    Returns:
+        The inverse Automorphism instance.
+    """
+    return _INVERSES[automorphism]
+
+
+def keys(placement):
+    """Get the Zobrist key of a placement as mapped through each automorphism.
+
+    XORing these into a tuple of hashes, one per automorphism, keeps the hash
+    of every symmetric image of a board up to date at once.
+
+    Args:
+        placement: The Placement instance.
+    Returns:
+        A tuple of 64-bit keys in the order of AUTOMORPHISMS.
+    """
+    return _KEYS[packing.pack_placement(placement)]
+
+
+def canonical(hashes):
+    """Choose the canonical image of a board from the hashes of its images.
+
+    Args:
+        hashes: The hashes of the board as mapped through each automorphism,
+            in the order of AUTOMORPHISMS.
+    Returns:
+        A 2-tuple of the canonical hash and the Automorphism instance that maps
+        the board onto its canonical image.
+    """
+    hash_, i = min((hash_, i) for i, hash_ in enumerate(hashes))
+    return hash_, AUTOMORPHISMS[i]
+
+
+def canonical_mask(mask):
+    """Choose the canonical image of a bitmask of holes.
+
+    Args:
+        mask: The bitmask of holes.
+    Returns:
+        A 2-tuple of the smallest bitmask the holes map onto and the
+        Automorphism instance that maps them onto it.
+    """
+    mapped, i = min((map_mask(automorphism, mask), i) for i, automorphism in enumerate(AUTOMORPHISMS))
+    return mapped, AUTOMORPHISMS[i]
+
+
+def stabilizer(mask):
+    """Get the automorphisms that map a bitmask of holes onto itself.
+
+    Args:
+        mask: The bitmask of holes.
+    Returns:
+        A tuple of Automorphism instances, always including the identity.
+    """
+    return tuple(automorphism for automorphism in AUTOMORPHISMS if map_mask(automorphism, mask) == mask)
+
+
+def branches(occupied, designations):
+    """Split the search for solutions into branches, one for each placement
+    of a noodle that is not a symmetric image of another.
+
+    The placements of the first noodle are grouped into orbits under the
+    automorphisms that leave the board unchanged. Every placement in an orbit
+    leads to the same number of solutions, so only one placement per orbit
+    is searched and its solutions are weighted by the size of the orbit.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        A list of 3-tuples of the weight of the branch, the bitmask of the
+        holes occupied once its placement is made and a tuple of the
+        designations of the noodles that remain to be placed.
+    """
+    designations = tuple(designations)
+    group = stabilizer(occupied)
+
+    if len(group) == 1 or not designations:
+        return [(1, next_occupied, others) for _, next_occupied, others in solver.branches(occupied, designations)]
+
+    orbits = {}
+
+    for placement in placements.get(designations[0]):
+        if not placement.mask & occupied:
+            orbit = frozenset(map_mask(automorphism, placement.mask) for automorphism in group)
+            orbits[orbit] = min(orbit)
+
+    return [(len(orbit), occupied | mask, designations[1:]) for orbit, mask in orbits.items()]
+
+
+def count_solutions(occupied, designations):
+    """Count the distinct solutions from a board state, searching only one
+    of each set of symmetric branches.
+
+    Args:
+        occupied: A bitmask of the holes already occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        The number of solutions.
+    """
+    if not designations:
+        return 1 if occupied == bitboard.FULL else 0
+
+    return sum(weight * sum(1 for _ in solver.iter_solutions(next_occupied, others))
+               for weight, next_occupied, others in branches(occupied, designations))
+
+
+def _find_automorphisms():
+    """Find every automorphism of the board from its neighbour table, with the identity first."""
+    automorphisms = []
+
+    for t in range(orientation.TRANSFORMS):
+        directions = {name: orientation.transform((name,), t)[0] for name in orientation.NAMES}
+
+        for image in range(holes.COUNT):
+            permutation = _extend({0: image}, directions)
+            if permutation is not None:
+                automorphisms.append(Automorphism(t, permutation))
+
+    return tuple(automorphisms)
+
+
+def _extend(mapping, directions):
+    """Extend a mapping of holes across the board by following each hole's
+    neighbours, returning the permutation it forms or None if neighbours
+    do not map onto neighbours.
+    """
+    pending = list(mapping)
+
+    while pending:
+        position = pending.pop()
+
+        for name, mapped_name in directions.items():
+            neighbour = holes.find_position(position, name)
+            mapped = holes.find_position(mapping[position], mapped_name)
+
+            if (neighbour is None) != (mapped is None):
+                return None
+
+            if neighbour is not None:
+                if neighbour not in mapping:
+                    mapping[neighbour] = mapped
+                    pending.append(neighbour)
+                elif mapping[neighbour] != mapped:
+                    return None
+
+    if len(set(mapping.values())) != holes.COUNT:
+        return None
+
+    return tuple(mapping[position] for position in range(holes.COUNT))
+
+
+def _build_mask_tables(automorphism):
+    """Build a lookup table for each byte of a bitmask, of the holes the bits in that byte map onto."""
+    return tuple(tuple(bitboard.to_mask(automorphism.permutation[offset + bit]
+                                        for bit in range(8) if value >> bit & 1 and offset + bit < holes.COUNT)
+                       for value in range(256))
+                 for offset in range(0, holes.COUNT, 8))
+
+
+def _build_keys():
+    """Build the Zobrist keys of every placement as mapped through each automorphism."""
+    keys_ = {}
+
+    for designation, _, _, parts in data.NOODLES:
+        for t in range(orientation.TRANSFORMS):
+            transformed = orientation.transform(parts, t)
+            for position in range(holes.COUNT):
+                placement = placements.find(designation, transformed, position)
+                if placement is not None:
+                    keys_[packing.pack_placement(placement)] = tuple(
+                        zobrist.key(map_placement(automorphism, placement)) for automorphism in AUTOMORPHISMS)
+
+    return keys_
+
+
+AUTOMORPHISMS = _find_automorphisms()
+IDENTITY = AUTOMORPHISMS[0]
+
+_MASK_TABLES = {automorphism: _build_mask_tables(automorphism) for automorphism in AUTOMORPHISMS}
+_INVERSES = {automorphism: next(other for other in AUTOMORPHISMS
+                                if all(other.permutation[automorphism.permutation[p]] == p
+                                       for p in range(holes.COUNT)))
+             for automorphism in AUTOMORPHISMS}
+_KEYS = _build_keys()
@@ -0,0 +1,189 @@
+"""A bounded cache of what is known about board states.
+
+Results are keyed by the Zobrist hash of a board state, so that states
+players commonly reach - most obviously the starting state of each puzzle -
+are answered from the cache rather than searched for again. The least
+recently used state is evicted once the cache is full.
+
+The cache is safe to use from more than one thread, so that searches can be
+run on a worker thread.
+"""
+
+from collections import OrderedDict, namedtuple
+import threading
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import solver
+from kanoodlegenius2d.domain import symmetry
+
+# What is known about a board state. Each field is None until it has been found.
+# Solvable is whether the board can be completed, move the Placement suggested
+# as the next move and count the number of distinct solutions.
+Entry = namedtuple('Entry', 'solvable move count')
+
+# Counters of the use of a cache.
+CacheStats = namedtuple('CacheStats', 'hits misses evictions size maxsize')
+
+
+class TranspositionCache:
+    """An LRU cache of Entry instances keyed by board hash."""
+
+    def __init__(self, maxsize=4096):
+        """Initialise a new TranspositionCache.
+
+        Args:
+            maxsize: The most board states to hold before evicting the least recently used.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key):
+        """Get the entry for a board state.
+
+        Args:
+            key: The hash of the board state.
+        Returns:
+            The Entry instance, or None if the state is not in the cache.
+        """
+        with self._lock:
+            try:
+                entry = self._entries[key]
+            except KeyError:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, **fields):
+        """Record what is known about a board state, merging it with anything
+        already recorded.
+
+        Args:
+            key: The hash of the board state.
+            **fields: The Entry fields to record.
+        Returns:
+            The updated Entry instance.
+        """
+        with self._lock:
+            entry = self._entries.get(key, Entry(None, None, None))._replace(**fields)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+            return entry
+
+    def hit(self):
+        """Record that a lookup was answered from the cache."""
+        with self._lock:
+            self._hits += 1
+
+    def miss(self):
+        """Record that a lookup had to be searched for."""
+        with self._lock:
+            self._misses += 1
+
+    def stats(self):
+        """Get counters of the use of the cache.
+
+        Returns:
+            A CacheStats instance.
+        """
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions,
+                              size=len(self._entries), maxsize=self.maxsize)
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def hint(key, occupied, designations, check=None):
+    """Suggest the next move from a board state.
+
+    Args:
+        key: The hash of the board state.
+        occupied: A bitmask of the holes occupied on the board.
+        designations: The designations of the noodles still to be placed.
+        check: Optional callable, called at every board state the search visits.
+    Returns:
+        A Placement instance, or None if the board cannot be completed
+        (or is already complete).
+    """
+    entry = _CACHE.get(key)
+
+    if entry is not None and (entry.move is not None or entry.solvable is False):
+        _CACHE.hit()
+        return entry.move
+
+    _CACHE.miss()
+    placement = solver.hint(occupied, designations, check)
+    _CACHE.put(key, solvable=placement is not None or occupied == bitboard.FULL, move=placement)
+
+    return placement
+
+
+def solvable(key, occupied, designations):
+    """Whether a board state can be completed.
+
+    Args:
+        key: The hash of the board state.
+        occupied: A bitmask of the holes occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        True if the board can be completed, False otherwise.
+    """
+    entry = _CACHE.get(key)
+
+    if entry is not None and entry.solvable is not None:
+        _CACHE.hit()
+        return entry.solvable
+
+    hint(key, occupied, designations)
+    return _CACHE.get(key).solvable
+
+
+def count(key, occupied, designations):
+    """Count the distinct solutions from a board state.
+
+    Args:
+        key: The hash of the board state.
+        occupied: A bitmask of the holes occupied on the board.
+        designations: The designations of the noodles still to be placed.
+    Returns:
+        The number of solutions.
+    """
+    entry = _CACHE.get(key)
+
+    if entry is not None and entry.count is not None:
+        _CACHE.hit()
+        return entry.count
+
+    _CACHE.miss()
+    count_ = symmetry.count_solutions(occupied, designations)
+    _CACHE.put(key, solvable=count_ > 0, count=count_)
+
+    return count_
+
+
+def stats():
+    """Get counters of the use of the shared cache.
+
+    Returns:
+        A CacheStats instance.
+    """
+    return _CACHE.stats()
+
+
+def clear():
+    """Empty the shared cache and reset its counters."""
+    _CACHE.clear()
+
+
+_CACHE = TranspositionCache()
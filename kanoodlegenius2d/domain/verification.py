@@ -0,0 +1,140 @@
+"""Verify the solutions recorded against puzzles.
+
+Each solution is replayed on a bitmask of the holes occupied by the puzzle's
+preconfigured noodles, checking that it places every remaining noodle exactly
+once, that every placement fits on the board without overlapping another
+noodle and that together they fill every empty hole.
+
+Run the module to verify every puzzle in the game:
+
+    python -m kanoodlegenius2d.domain.verification
+"""
+
+import time
+
+from kanoodlegenius2d.domain import bitboard
+from kanoodlegenius2d.domain import data
+from kanoodlegenius2d.domain import placements
+
+
+def parse_solution(solution):
+    """Parse a puzzle's solution string.
+
+    Args:
+        solution: The solution string, made up of a noodle id, root position
+            and four part orientations per noodle, e.g. '3,32,E,E,NE,NE;6,29,NE,NW,E,NE'
+    Returns:
+        A list of 3-tuples of the designation of the noodle, the position of
+        its root part and a tuple of the orientations of its parts.
+    Raises:
+        ValueError: If the solution string is malformed.
+    """
+    parsed = []
+
+    for entry in filter(None, solution.split(';')):
+        fields = entry.split(',')
+        if len(fields) != 6:
+            raise ValueError('Malformed solution entry {!r}'.format(entry))
+        noodle_id, position = int(fields[0]), int(fields[1])
+        if noodle_id not in range(1, len(data.NOODLES) + 1):
+            raise ValueError('Unknown noodle id {}'.format(noodle_id))
+        parsed.append((data.NOODLES[noodle_id - 1][0], position, tuple(fields[2:])))
+
+    return parsed
+
+
+def check(occupied, designations, solution):
+    """Check that a solution completes a board.
+
+    Args:
+        occupied: A bitmask of the holes occupied by the puzzle's preconfigured noodles.
+        designations: The designations of the noodles that remain to be placed.
+        solution: The solution string.
+    Returns:
+        A list of strings describing each problem found. An empty list
+        means that the solution is valid.
+    """
+    try:
+        parsed = parse_solution(solution)
+    except ValueError as e:
+        return [str(e)]
+
+    errors = []
+    remaining = set(designations)
+
+    for designation, position, parts in parsed:
+        if designation not in remaining:
+            errors.append('Noodle {} is already on the board'.format(designation))
+            continue
+
+        remaining.discard(designation)
+        placement = placements.find(designation, parts, position)
+
+        if placement is None:
+            errors.append('Noodle {} at position {} does not fit on the board'.format(designation, position))
+            continue
+
+        overlap = occupied & placement.mask
+        if overlap:
+            errors.append('Noodle {} at position {} overlaps position(s) {}'.format(
+                designation, position, ', '.join(str(o) for o in bitboard.to_positions(overlap))))
+
+        occupied |= placement.mask
+
+    if remaining:
+        errors.append('Noodle(s) {} are not placed'.format(', '.join(sorted(remaining))))
+
+    empty = bitboard.FULL & ~occupied
+    if empty:
+        errors.append('Position(s) {} are not filled'.format(', '.join(str(e) for e in bitboard.to_positions(empty))))
+
+    return errors
+
+
+def verify_all(puzzles):
+    """Verify the solutions of a number of puzzles.
+
+    The noodles preconfigured on every puzzle are loaded in a single query.
+
+    Args:
+        puzzles: A sequence of Puzzle instances.
+    Returns:
+        A dictionary of the lists of problems found with each puzzle's
+        solution, keyed by puzzle. Puzzles with a valid solution have an
+        empty list.
+    """
+    from kanoodlegenius2d.domain.models import Puzzle
+
+    templates = Puzzle.templates(puzzles)
+
+    return {puzzle: check(*templates[puzzle], puzzle.solution) for puzzle in puzzles}
+
+
+def main():
+    from kanoodlegenius2d.domain import models
+    from kanoodlegenius2d.domain.models import Level, Puzzle
+
+    models.database.init(':memory:')
+    data.setup()
+
+    started = time.perf_counter()
+    puzzles = list(Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number, Puzzle.number))
+    results = verify_all(puzzles)
+    elapsed = time.perf_counter() - started
+    failures = 0
+
+    for puzzle in puzzles:
+        errors = results[puzzle]
+        if errors:
+            failures += 1
+            for error in errors:
+                print('Level {} puzzle {}: {}'.format(puzzle.level.number, puzzle.number, error))
+
+    print('{} of {} puzzle solutions are valid ({:.1f}ms)'.format(len(puzzles) - failures, len(puzzles),
+                                                                   elapsed * 1000))
+
+    return failures
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if main() else 0)
@@ -0,0 +1,196 @@
+"""Write board moves to the database on a background thread, in batches.
+
+Placing or undoing a noodle updates the board in memory straight away. The
+writes that record the move are handed to a Writer, whose thread collects
+them for up to FLUSH_INTERVAL seconds, or until BATCH_SIZE have been
+collected, and then writes them all in a single transaction. Moves made in
+quick succession therefore cost one commit - one sync to the SD card - between
+them, and the player never waits for one.
+
+flush() writes whatever is still held and waits for it to be written. It is
+called when leaving the game screen, before the board is read back from the
+database, on shutdown and, failing that, when the interpreter exits.
+
+Crash safety: writes are made in the order they were submitted and each batch
+is a single transaction, so SQLite's journal ensures that a batch is either
+written in full or not at all. If the game crashes or loses power, the
+database holds every move up to some point and none after it - the board as
+the player had it at that point, never a mixture. The moves lost are at most
+those made in the FLUSH_INTERVAL before the crash, and none at all once a
+flush() has returned.
+
+A batch that fails to be written is rolled back and stays at the head of the
+queue, to be tried again after FLUSH_INTERVAL. Nothing submitted after it is
+written until it has been, so the database still never skips a move. flush()
+and shutdown() try it once more straight away, and raise a
+WriteFailedException if it fails again.
+
+An in-memory SQLite database can't be shared between threads, so writes to
+one are made immediately, on the thread that submits them.
+"""
+
+import logging
+import threading
+
+_LOG = logging.getLogger(__name__)
+
+# The longest time, in seconds, that a write is held before being written.
+FLUSH_INTERVAL = 1.0
+
+# The number of writes held that causes them to be written without waiting.
+BATCH_SIZE = 32
+
+
+class WriteFailedException(Exception):
+    """Raised by flush() and shutdown() when the writes held cannot be written."""
+
+
+class Writer:
+    """Writes to a database on a background thread, in batches."""
+
+    def __init__(self, database, interval=FLUSH_INTERVAL):
+        """Initialise a new Writer.
+
+        Args:
+            database: The peewee Database that the writes are made to.
+            interval: The longest time, in seconds, that a write is held before being written.
+        """
+        self._database = database
+        self._interval = interval
+        self._condition = threading.Condition()
+        self._pending = []
+        self._submitted = 0
+        self._written = 0
+        self._failures = 0
+        self._error = None
+        self._flushing = False
+        self._stopping = False
+        self._thread = None
+
+    def submit(self, write):
+        """Submit a write to be made on the background thread.
+
+        Args:
+            write: A callable that writes to the database, such as the execute
+                method of a peewee query.
+        """
+        if self._database.database == ':memory:':
+            write()
+            return
+
+        with self._condition:
+            self._pending.append(write)
+            self._submitted += 1
+
+            if self._thread is None:
+                self._start()
+
+            self._condition.notify_all()
+
+    def flush(self):
+        """Write everything submitted so far, waiting for it to be written.
+
+        Raises:
+            WriteFailedException: If a batch of writes fails to be written. The
+                writes are still held, and are tried again later.
+        """
+        with self._condition:
+            submitted = self._submitted
+            if self._written >= submitted:
+                return
+
+            failures = self._failures
+            if self._thread is None:
+                # Stopped by a failure on shutdown, with writes still held
+                self._start()
+
+            self._flushing = True
+            self._condition.notify_all()
+
+            while self._written < submitted and self._failures == failures and self._thread is not None:
+                self._condition.wait()
+
+            if self._written < submitted:
+                raise WriteFailedException('{} writes could not be written'.format(
+                    self._submitted - self._written)) from self._error
+
+    def shutdown(self):
+        """Write everything submitted so far and stop the background thread,
+        waiting for it to finish.
+
+        Raises:
+            WriteFailedException: If a batch of writes fails to be written. The
+                writes are still held, and are tried again if the writer is used again.
+        """
+        with self._condition:
+            thread = self._thread
+            self._stopping = True
+            self._condition.notify_all()
+
+        if thread is not None:
+            thread.join()
+
+        with self._condition:
+            if self._written < self._submitted:
+                raise WriteFailedException('{} writes could not be written'.format(
+                    self._submitted - self._written)) from self._error
+
+    @property
+    def pending(self):
+        """The number of writes submitted that have yet to be written."""
+        with self._condition:
+            return self._submitted - self._written
+
+    def _start(self):
+        self._stopping = False
+        self._thread = threading.Thread(target=self._work, name='writer', daemon=True)
+        self._thread.start()
+
+    def _work(self):
+        try:
+            while True:
+                with self._condition:
+                    # Wait for the first write of the batch, and then for the rest of it
+                    self._condition.wait_for(lambda: self._pending or self._stopping)
+                    self._condition.wait_for(lambda: (self._flushing or self._stopping or
+                                                      len(self._pending) >= BATCH_SIZE), self._interval)
+                    batch = list(self._pending)
+                    self._flushing = False
+
+                    if not batch:
+                        self._thread = None
+                        self._condition.notify_all()
+                        break
+
+                error = self._write(batch)
+
+                with self._condition:
+                    if error is None:
+                        # Only now that the batch is written can it leave the queue
+                        del self._pending[:len(batch)]
+                        self._written += len(batch)
+                    else:
+                        self._failures += 1
+                        self._error = error
+                        if self._stopping:
+                            self._thread = None
+                            self._condition.notify_all()
+                            break
+                    self._condition.notify_all()
+        finally:
+            # The connection belongs to this thread
+            if not self._database.is_closed():
+                self._database.close()
+
+    def _write(self, batch):
+        """Write a batch in a single transaction, returning the exception
+        that rolled it back, if any."""
+        try:
+            with self._database.atomic():
+                for write in batch:
+                    write()
+        except Exception as e:
+            _LOG.exception('Failed to write a batch of %d board moves', len(batch))
+            return e
+
+        return None
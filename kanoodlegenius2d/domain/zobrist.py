@@ -0,0 +1,49 @@
+"""Zobrist hashing of board states.
+
+Every placement of every noodle - its designation, transform and root hole -
+is given a random 64-bit key. The hash of a board is the XOR of the keys of
+the placements on it, so it can be updated as noodles are placed and removed
+by XORing a single key in or out.
+"""
+
+import random
+
+from kanoodlegenius2d.domain import packing
+
+# The hash of an empty board.
+EMPTY = 0
+
+# Seeded so that hashes are the same from one run to the next.
+_SEED = 0x4b616e6f6f646c65
+
+
+def key(placement):
+    """Get the key of a placement.
+
+    Args:
+        placement: The Placement instance.
+    Returns:
+        The 64-bit key.
+    """
+    return _KEYS[packing.pack_placement(placement)]
+
+
+def hash_placements(placements):
+    """Hash a board from the placements on it.
+
+    Args:
+        placements: A sequence of Placement instances.
+    Returns:
+        The 64-bit hash.
+    """
+    hash_ = EMPTY
+
+    for placement in placements:
+        hash_ ^= key(placement)
+
+    return hash_
+
+
+_rng = random.Random(_SEED)
+_KEYS = tuple(_rng.getrandbits(64) for _ in range(1 << 13))
+del _rng
@@ -1,3 +1,4 @@
+import logging
 import os
 import tkinter as tk
 from collections import deque
@@ -6,15 +7,28 @@ from PIL import Image, ImageTk
 
 from kanoodlegenius2d.domain import (holes,
                                      orientation)
-from kanoodlegenius2d.domain.models import (Noodle,
-                                            PositionUnavailableException)
+from kanoodlegenius2d.domain.models import (flush,
+                                            Noodle,
+                                            PositionUnavailableException,
+                                            UnsolvableBoardException)
+from kanoodlegenius2d.domain.solverservice import (SearchTimeoutException,
+                                                   SolverService)
 from kanoodlegenius2d.ui.components import (CanvasButton,
                                             Dialog,
                                             Fade)
 from kanoodlegenius2d.ui import settings
 
+_LOG = logging.getLogger(__name__)
+
 HIGHLIGHT_COLOUR = '#ffffff'
 REJECT_COLOUR = '#ff0000'
+# How often to collect the outcome of searches running in the background (ms).
+POLL_INTERVAL = 50
+# How long to search for a hint, and for a solution, before giving up (seconds).
+HINT_TIMEOUT = 10
+SOLVE_TIMEOUT = 30
+# Searches for hints and solutions run on a worker thread, so that the screen stays responsive.
+SOLVER_SERVICE = SolverService()
 # Hold these globally to prevent images disappearing
 # from a canvas due to garbage collection.
 NOODLE_IMAGES = {}
@@ -36,18 +50,29 @@ class GameScreen(tk.Frame):
         """
         super().__init__(master, width=800, height=480, bg='#000000', highlightthickness=1, **kwargs)
 
+        # Write the moves in the background, so that placing a noodle never waits on the SD card
+        board.defer_writes()
+
+        def complete(completed_board):
+            flush()
+            oncomplete(completed_board)
+
+        def cancel():
+            flush()
+            oncancel()
+
         board_and_noodle = tk.Frame(master=self, width=800, height=420, bg='#000000', highlightthickness=1)
         board_and_noodle.pack(side='top', fill='x')
         noodle_selection_frame = NoodleSelectionFrame(board, master=board_and_noodle)
-        board_frame = BoardFrame(board, oncomplete, noodle_selection_frame, master=board_and_noodle)
+        board_frame = BoardFrame(board, complete, noodle_selection_frame, master=board_and_noodle)
         board_frame.pack(side='left')
         noodle_selection_frame.pack()
-        status_frame = InfoFrame(board, oncancel, master=self)
+        status_frame = InfoFrame(board, cancel, master=self)
         status_frame.pack()
 
         # Initialise the cache of noodle images.
         if not NOODLE_IMAGES:
-            for noodle in Noodle.select():
+            for noodle in Noodle.all():
                 image = Image.open(os.path.join(os.path.dirname(__file__), 'images', noodle.image)).convert('RGBA')
                 NOODLE_IMAGES[noodle.designation] = ImageTk.PhotoImage(self._flatten_alpha(image))
 
@@ -105,9 +130,19 @@ class BoardFrame(tk.Frame):
         self._fade = Fade(self._canvas)
         self._hole_pressed = False
         self._holes = []
+        self._valid_holes = []
+        self._noodle_frame.onselect = self._show_valid_holes
+        self._jobs = []
+        self._hint_job = None
+        self._polling = False
+        self._progress = self._canvas.create_text(220, 405, text='', font=settings.fonts['dialog_message'],
+                                                  fill='#4d4d4d')
+        self.bind('<Destroy>', lambda _: self._cancel_searches())
 
         self._undo = CanvasButton(self._canvas, 'UNDO', (400, 380), onpress=self._undo_place_noodle,
                                   disabled=True)
+        self._redo = CanvasButton(self._canvas, 'REDO', (50, 40), onpress=self._redo_place_noodle,
+                                  disabled=True)
         self._solve = CanvasButton(
             self._canvas, 'SOLVE', (50, 380),
             onpress=lambda _: Dialog(self.master,
@@ -117,6 +152,7 @@ class BoardFrame(tk.Frame):
                                      onsubmit=self._solve_puzzle,
                                      show_cancel=True),
             disabled=True)
+        self._hint = CanvasButton(self._canvas, 'HINT', (400, 40), onpress=self._show_hint, disabled=True)
 
         level_text = self._canvas.create_text(220, 130, text='Level {}'.format(board.puzzle.level.number),
                                               font=settings.fonts['gamescreen_intro'], fill='#FFFFFF')
@@ -131,30 +167,19 @@ class BoardFrame(tk.Frame):
         self.after(2000, draw)
 
     def _draw_board(self):
-        x, y = 115, 38
-        x_incr, y_incr = 29, 49
+        x, y = 57, 38
+        x_incr, y_incr = 56, 49
         hole_ids = []
-        hole_ids.extend(self._draw_row(x, y, 4))
-        x -= x_incr
-        y += y_incr
-        hole_ids.extend(self._draw_row(x, y, 5))
-        x -= x_incr
-        y += y_incr
-        hole_ids.extend(self._draw_row(x, y, 6))
-        x += x_incr
-        y += y_incr
-        hole_ids.extend(self._draw_row(x, y, 5))
-        x -= x_incr
-        y += y_incr
-        hole_ids.extend(self._draw_row(x, y, 6))
-        x += x_incr
-        y += y_incr
-        hole_ids.extend(self._draw_row(x, y, 5))
-        x += x_incr
-        y += y_incr
-        hole_ids.extend(self._draw_row(x, y, 4))
-
-        for index, hole_id in enumerate(hole_ids):
+
+        for index in range(holes.COUNT):
+            # The board's geometry places each hole, offsetting alternate rows by half a hole
+            column, row = holes.BOARD.layout(index)
+            tl_x, tl_y = x + round(column * x_incr), y + row * y_incr
+            hole_id = self._canvas.create_oval(tl_x, tl_y, tl_x + 55, tl_y + 55,
+                                               outline='#000000', fill='#000000', width=2)
+            self._fade.fadein(hole_id, '#4d4d4d', elements=['outline'], duration=1000)
+            hole_ids.append(hole_id)
+
             if settings.show_board_numbers:
                 x1, y1, x2, y2 = self._canvas.bbox(hole_id)
                 centre = x1 + ((x2 - x1) // 2), y1 + ((y2 - y1) // 2)
@@ -163,20 +188,10 @@ class BoardFrame(tk.Frame):
 
         return hole_ids
 
-    def _draw_row(self, tl_x, tl_y, num):
-        holes_ = []
-        for i in range(num):
-            hole_id = self._canvas.create_oval(tl_x, tl_y, tl_x + 55, tl_y + 55,
-                                               outline='#000000', fill='#000000', width=2)
-            self._fade.fadein(hole_id, '#4d4d4d', elements=['outline'], duration=1000)
-            holes_.append(hole_id)
-            tl_x += 56
-        return holes_
-
     def _draw_noodles_on_board(self, fade_duration=0, oncomplete=None):
         self._clear_board()
 
-        for i, board_noodle in enumerate(self._board.noodles, start=3):
+        for i, board_noodle in enumerate(self._board.placed_noodles, start=3):
 
             def draw(i, n):
                 if fade_duration == 0:
@@ -184,12 +199,12 @@ class BoardFrame(tk.Frame):
 
                 self.after(i*600, lambda: self._draw_noodle(n, n.position, fade_duration))
 
-                if i == len(self._board.noodles) + 2:
+                if i == len(self._board.placed_noodles) + 2:
 
                     def draw_complete():
                         self._noodle_frame.board_initialised()
-                        self._undo.disable(len(self._board.noodles) <= len(self._board.puzzle.noodles) or
-                                           self._board.auto_completed)
+                        self._update_undo_redo()
+                        self._hint.disable(self._board.completed)
                         if oncomplete:
                             oncomplete()
 
@@ -199,14 +214,13 @@ class BoardFrame(tk.Frame):
 
     def _clear_board(self):
         for hole_id in self._holes:
-            self._canvas.itemconfig(hole_id, fill='#000000')
+            self._canvas.itemconfig(hole_id, fill='#000000', outline='#4d4d4d', width=2)
 
         for item in self._canvas.find_all():
             if self._canvas.type(item) == 'image':
                 self._canvas.delete(item)
 
     def _draw_noodle(self, noodle, position, fade_duration=0):
-        last_position = position
         try:
             colour = noodle.colour
         except AttributeError:
@@ -226,15 +240,10 @@ class BoardFrame(tk.Frame):
 
             return show
 
-        self._fade.fadein(self._holes[last_position], colour, duration=fade_duration,
-                          onfaded=show_image(self._holes[last_position]))
-        self._canvas.itemconfig(self._holes[last_position], outline='#4d4d4d', width=2)
-
-        for part in noodle.parts:
-            last_position = holes.find_position(last_position, part)
-            self._fade.fadein(self._holes[last_position], colour, duration=fade_duration,
-                              onfaded=show_image(self._holes[last_position]))
-            self._canvas.itemconfig(self._holes[last_position], outline='#4d4d4d', width=2)
+        for part_position in holes.find_positions(position, noodle.parts):
+            self._fade.fadein(self._holes[part_position], colour, duration=fade_duration,
+                              onfaded=show_image(self._holes[part_position]))
+            self._canvas.itemconfig(self._holes[part_position], outline='#4d4d4d', width=2)
 
     def _create_on_hole_press(self, hole_index, hole_id):
         def _on_hole_press(_):
@@ -247,6 +256,7 @@ class BoardFrame(tk.Frame):
                     return
 
                 self._hole_pressed = True
+                self._cancel_hint()
 
                 try:
                     root_index = self._board.place(noodle, position=hole_index, part_pos=selected_part)
@@ -260,6 +270,20 @@ class BoardFrame(tk.Frame):
 
         return _on_hole_press
 
+    def _show_valid_holes(self, noodle, part_pos):
+        # Outline the holes that the selected part of the noodle can be placed onto
+        for hole_id in self._valid_holes:
+            self._canvas.itemconfig(hole_id, outline='#4d4d4d', width=2)
+
+        self._valid_holes = []
+
+        if noodle is None or part_pos is None or not self._holes:
+            return
+
+        for position in self._board.valid_drops(noodle, part_pos):
+            self._canvas.itemconfig(self._holes[position], outline=noodle.colour, width=2)
+            self._valid_holes.append(self._holes[position])
+
     def _reject_place_noodle(self, noodle, hole_id):
         self._noodle_frame.reject(noodle)
         self._canvas.itemconfig(hole_id, outline=REJECT_COLOUR, width=4)
@@ -278,42 +302,157 @@ class BoardFrame(tk.Frame):
         def commit():
             self._draw_noodle(noodle, root_index, fade_duration=40)
             self._hole_pressed = False
-            self._undo.disable(len(self._board.noodles) <= len(self._board.puzzle.noodles) or
-                               self._board.auto_completed)
+            self._update_undo_redo()
+            if not self._board.completed:
+                self._show_dead_regions()
 
         self.after(500, commit)
 
-    def _undo_place_noodle(self, _):
-        num_board_noodles = len(self._board.noodles)
-        num_puzzle_noodles = len(self._board.puzzle.noodles)
+    def _show_dead_regions(self):
+        dead_regions = self._board.dead_regions()
 
-        if num_puzzle_noodles < num_board_noodles < 7:
+        if not dead_regions:
+            return
+
+        for region in dead_regions:
+            for position in region:
+                self._canvas.itemconfig(self._holes[position], outline=REJECT_COLOUR, width=4)
+                self._canvas.tag_raise(self._holes[position])
+
+        Dialog(self.master,
+               message='The holes outlined in red cannot be filled by any of the remaining noodles. '
+                       'Try undoing your last move.',
+               title='Dead end',
+               timeout=5)
+
+    def _undo_place_noodle(self, _):
+        if self._board.can_undo and not self._board.completed:
+            self._cancel_hint()
             noodle = self._board.undo()
-            self._undo.disable(len(self._board.noodles) <= len(self._board.puzzle.noodles))
+            self._update_undo_redo()
             self._solve.disable(False)
 
             if noodle:
                 self._noodle_frame.reject(noodle)
                 self._draw_noodles_on_board()
 
+    def _redo_place_noodle(self, _):
+        if self._board.can_redo and not self._hole_pressed:
+            self._cancel_hint()
+            noodle = self._board.redo()
+            self._update_undo_redo()
+
+            if noodle:
+                self._noodle_frame.withdraw(noodle)
+                self._draw_noodles_on_board()
+
+                if self._board.completed:
+                    self._oncomplete(self._board)
+
+    def _update_undo_redo(self):
+        self._undo.disable(not self._board.can_undo or self._board.auto_completed)
+        self._redo.disable(not self._board.can_redo or self._board.auto_completed)
+
+    def _show_hint(self, _):
+        self._hint.disable(True)
+        self._hint_job = self._search(self._board.hint_search(), onresult=self._draw_hint,
+                                      onerror=self._hint_failed, timeout=HINT_TIMEOUT)
+
+    def _draw_hint(self, placement):
+        self._hint_job = None
+        self._hint.disable(self._board.completed)
+
+        if placement is None:
+            return
+
+        colour = Noodle.of(placement.designation).colour
+        hole_ids = [self._holes[position] for position in placement.positions]
+
+        for hole_id in hole_ids:
+            self._canvas.itemconfig(hole_id, outline=colour, width=4)
+            self._canvas.tag_raise(hole_id)
+
+        def revert():
+            for hole_id in hole_ids:
+                # Only revert holes that have not since been filled by a noodle
+                if self._canvas.itemcget(hole_id, 'outline') == colour:
+                    self._canvas.itemconfig(hole_id, outline='#4d4d4d', width=2)
+
+        self.after(1500, revert)
+
+    def _hint_failed(self, error):
+        self._hint_job = None
+        self._hint.disable(self._board.completed)
+
+        if isinstance(error, UnsolvableBoardException):
+            Dialog(self.master,
+                   message='The noodles on the board cannot be arranged to solve the puzzle. '
+                           'Try undoing your last move.',
+                   title='No solution')
+        elif isinstance(error, SearchTimeoutException):
+            Dialog(self.master, message='A hint could not be found in time. Please try again.', title='No hint')
+        else:
+            # Raising here would only reach Tk's error reporting, leaving the player without a reply
+            _LOG.error('Failed to find a hint', exc_info=error)
+            Dialog(self.master, message='Something went wrong finding a hint. Please try again.', title='No hint')
+
+    def _cancel_hint(self):
+        # A hint found for the board before a move is no use after it
+        if self._hint_job is not None:
+            self._hint_job.cancel()
+            self._hint_job = None
+            self._hint.disable(False)
+
     def _solve_puzzle(self):
-        self._board.solve()
+        # Keep the player's noodles where they lead to a solution
+        board_noodles_before = [(noodle.noodle, noodle.position, noodle.parts) for noodle in self._board.placed_noodles]
+        self._cancel_searches()
         self._solve.disable(True)
+        self._hint.disable(True)
+        self._undo.disable(True)
+        self._redo.disable(True)
+        # Ignore presses on the board while the solution is searched for
+        self._hole_pressed = True
 
+        def solved(result):
+            self._board.complete(*result)
+            self._draw_solution(board_noodles_before)
+
+        def failed(error):
+            self._hole_pressed = False
+            self._solve.disable(False)
+            self._hint.disable(False)
+            self._update_undo_redo()
+
+            if isinstance(error, SearchTimeoutException):
+                Dialog(self.master, message='A solution could not be found in time. Please try again.',
+                       title='No solution')
+            elif isinstance(error, UnsolvableBoardException):
+                Dialog(self.master, message='The puzzle has no solution.', title='No solution')
+            else:
+                _LOG.error('Failed to find a solution', exc_info=error)
+                Dialog(self.master, message='Something went wrong finding a solution. Please try again.',
+                       title='No solution')
+
+        self._search(self._board.solve_search(keep_placements=True), onresult=solved, onerror=failed,
+                     timeout=SOLVE_TIMEOUT)
+
+    def _draw_solution(self, board_noodles_before):
         for hole_id in self._holes:
             self._canvas.itemconfig(hole_id, fill='#000000')
 
-        puzzle_noodles = [noodle.noodle for noodle in self._board.puzzle.noodles]
+        kept = [(noodle.noodle, noodle.position, noodle.parts) for noodle in self._board.placed_noodles
+                if (noodle.noodle, noodle.position, noodle.parts) in board_noodles_before]
 
         self._clear_board()
 
-        for noodle in self._board.noodles:
-            if noodle.noodle in puzzle_noodles:
+        for noodle in self._board.placed_noodles:
+            if (noodle.noodle, noodle.position, noodle.parts) in kept:
                 self._draw_noodle(noodle, noodle.position)
 
         def draw_remaining():
-            for noodle in self._board.noodles:
-                if noodle.noodle not in puzzle_noodles:
+            for noodle in self._board.placed_noodles:
+                if (noodle.noodle, noodle.position, noodle.parts) not in kept:
                     self._draw_noodle(noodle, noodle.position, fade_duration=100)
             self.after(4000, lambda: self._oncomplete(self._board))
 
@@ -325,6 +464,37 @@ class BoardFrame(tk.Frame):
             except IndexError:
                 break
 
+    def _search(self, search, onresult, onerror, timeout):
+        # Run a search on the worker thread, polling for its outcome from the event loop
+        job = SOLVER_SERVICE.submit(search, onresult, onerror=onerror, onprogress=self._show_progress,
+                                    timeout=timeout)
+        self._jobs.append(job)
+
+        if not self._polling:
+            self._polling = True
+            self.after(POLL_INTERVAL, self._poll_searches)
+
+        return job
+
+    def _poll_searches(self):
+        pending = SOLVER_SERVICE.poll()
+        self._jobs = [job for job in self._jobs if not job.done]
+
+        if not self._jobs and self.winfo_exists():
+            self._canvas.itemconfig(self._progress, text='')
+
+        if pending:
+            self.after(POLL_INTERVAL, self._poll_searches)
+        else:
+            self._polling = False
+
+    def _show_progress(self, nodes):
+        self._canvas.itemconfig(self._progress, text='Searching... {:,} positions'.format(nodes))
+
+    def _cancel_searches(self):
+        for job in self._jobs:
+            job.cancel()
+
 
 class NoodleSelectionFrame(tk.Frame):
     """The frame of the GameScreen that allows a noodle to be selected."""
@@ -342,7 +512,8 @@ class NoodleSelectionFrame(tk.Frame):
         super().__init__(master, width=360, height=420, bg='#000000', **kwargs)
 
         self._board = board
-        self._selectable_noodles = deque(set(Noodle.select()) - set([noodle.noodle for noodle in self._board.noodles]))
+        self._selectable_noodles = deque(set(Noodle.all()) -
+                                         set([noodle.noodle for noodle in self._board.placed_noodles]))
 
         noodle_frame = tk.Frame(self, width=360, height=290, bg='#000000')
         noodle_frame.pack(side='top')
@@ -357,6 +528,8 @@ class NoodleSelectionFrame(tk.Frame):
         # The part of the noodle that a user has pressed (0 - 4)
         self._selected_part = None
         self._images = []
+        # Callback called with the current noodle and selected part whenever either changes
+        self.onselect = None
 
     def board_initialised(self):
         """Called by the BoardFrame to indicate that it has finished initialising."""
@@ -443,8 +616,15 @@ class NoodleSelectionFrame(tk.Frame):
                 self._noodle_canvas.tag_raise(image_ids[index])
                 self._selected_part = index
 
+            self._notify_select()
+
         return _on_part_press
 
+    def _notify_select(self):
+        if self.onselect:
+            noodle = self._selectable_noodles[0] if self._selectable_noodles else None
+            self.onselect(noodle, self._selected_part)
+
     def _init_buttons(self, control_frame):
         canvas = tk.Canvas(control_frame, width=300, height=125, bg='#000000', highlightthickness=0)
         canvas.pack()
@@ -466,12 +646,16 @@ class NoodleSelectionFrame(tk.Frame):
         self._selectable_noodles.rotate()
         self._draw_noodle()
         self._clear_items(items)
+        self._toggle_disable_buttons()
+        self._notify_select()
 
     def _prev_noodle(self, _):
         items = self._noodle_canvas.find_all()
         self._selectable_noodles.rotate(-1)
         self._draw_noodle()
         self._clear_items(items)
+        self._toggle_disable_buttons()
+        self._notify_select()
 
     def _rotate_noodle(self, _):
         if self._selectable_noodles:
@@ -479,6 +663,8 @@ class NoodleSelectionFrame(tk.Frame):
             self._selectable_noodles[0].rotate()
             self._draw_noodle()
             self._clear_items(items)
+            self._toggle_disable_buttons()
+            self._notify_select()
 
     def _flip_noodle(self, _):
         if self._selectable_noodles:
@@ -486,6 +672,7 @@ class NoodleSelectionFrame(tk.Frame):
             self._selectable_noodles[0].flip()
             self._draw_noodle()
             self._clear_items(items)
+            self._notify_select()
 
     def _clear_items(self, items):
         for item in items:
@@ -498,9 +685,14 @@ class NoodleSelectionFrame(tk.Frame):
     def _toggle_disable_buttons(self):
         self._next.disable(len(self._selectable_noodles) <= 1)
         self._prev.disable(len(self._selectable_noodles) <= 1)
-        self._flip.disable(len(self._selectable_noodles) == 0)
+        self._flip.disable(len(self._selectable_noodles) == 0 or self._flip_looks_identical())
         self._rotate.disable(len(self._selectable_noodles) == 0)
 
+    def _flip_looks_identical(self):
+        # A symmetric noodle can look the same once flipped, in which case there is no point flipping it
+        parts = self._selectable_noodles[0].parts
+        return orientation.shape(parts) == orientation.shape(orientation.transform(parts, 6))
+
     def accept(self):
         """Accept the currently selected noodle and part and remove them
         from the current list of selectable noodles.
@@ -512,6 +704,7 @@ class NoodleSelectionFrame(tk.Frame):
         """
         noodle, part = self._selectable_noodles.popleft(), self._selected_part
         self._selected_part = None
+        self._notify_select()
 
         def redraw():
             self._noodle_canvas.delete('all')
@@ -523,6 +716,22 @@ class NoodleSelectionFrame(tk.Frame):
 
         return noodle, part
 
+    def withdraw(self, noodle):
+        """Remove a noodle from the list of selectable noodles, such as when
+        it is put back on the board by a redo.
+
+        Args:
+            noodle: The noodle being withdrawn.
+        """
+        if self._selectable_noodles and self._selectable_noodles[0] == noodle:
+            self._selected_part = None
+            self._notify_select()
+
+        self._selectable_noodles.remove(noodle)
+        self._noodle_canvas.delete('all')
+        self._draw_noodle()
+        self._toggle_disable_buttons()
+
     def reject(self, noodle):
         """Reject accepting a noodle and place it back into the list of
         selectable noodles.
@@ -560,9 +769,9 @@ class InfoFrame(tk.Frame):
         canvas.pack()
 
         canvas.create_text(120, 26, text='PLAYER: {}'.format(board.player.name),
-                           font=settings.fonts['gamescreen_player'], fill=Noodle.get(Noodle.designation == 'B').colour)
+                           font=settings.fonts['gamescreen_player'], fill=Noodle.of('B').colour)
         canvas.create_text(300, 26, text='LEVEL: {}'.format(board.puzzle.level.number),
-                           font=settings.fonts['gamescreen_status'], fill=Noodle.get(Noodle.designation == 'F').colour)
+                           font=settings.fonts['gamescreen_status'], fill=Noodle.of('F').colour)
         canvas.create_text(380, 26, text='PUZZLE: {}'.format(board.puzzle.number),
-                           font=settings.fonts['gamescreen_status'], fill=Noodle.get(Noodle.designation == 'F').colour)
+                           font=settings.fonts['gamescreen_status'], fill=Noodle.of('F').colour)
         CanvasButton(canvas, 'EXIT', pos=(715, 26), width=140, height=40, onpress=lambda _: oncancel())
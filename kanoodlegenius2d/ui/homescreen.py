@@ -34,12 +34,12 @@ class HomeScreen(tk.Frame):
                            justify='center', fill='#FFFFFF')
 
         colour_map = OrderedDict()
-        colour_map['G'] = Noodle.get(Noodle.designation == 'A').colour
-        colour_map['E'] = Noodle.get(Noodle.designation == 'E').colour
-        colour_map['N'] = Noodle.get(Noodle.designation == 'C').colour
-        colour_map['I'] = Noodle.get(Noodle.designation == 'B').colour
-        colour_map['U'] = Noodle.get(Noodle.designation == 'D').colour
-        colour_map['S'] = Noodle.get(Noodle.designation == 'F').colour
+        colour_map['G'] = Noodle.of('A').colour
+        colour_map['E'] = Noodle.of('E').colour
+        colour_map['N'] = Noodle.of('C').colour
+        colour_map['I'] = Noodle.of('B').colour
+        colour_map['U'] = Noodle.of('D').colour
+        colour_map['S'] = Noodle.of('F').colour
 
         x, x_offset = 250, 60
         for char in colour_map:
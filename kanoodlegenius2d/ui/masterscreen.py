@@ -1,5 +1,6 @@
 import tkinter as tk
 
+from kanoodlegenius2d.domain import models
 from kanoodlegenius2d.domain.models import Board, Puzzle
 from kanoodlegenius2d.ui import settings
 from kanoodlegenius2d.ui.components import Dialog
@@ -34,7 +35,11 @@ class MasterScreen(tk.Tk):
                                        onhighscores=self._onhighscores, master=self))
 
     def main_loop(self):
-        self.mainloop()
+        try:
+            self.mainloop()
+        finally:
+            # Writes any moves still held in memory
+            models.shutdown()
 
     def _onnewplayer(self):
         self._switch_screen(NewPlayerScreen(oncreate=self._oncreatenewplayer, onexit=self._onexit, master=self))
@@ -72,7 +77,7 @@ class MasterScreen(tk.Tk):
                 message = 'You have completed every puzzle.\n\nYou are a genius!'
             else:
                 message = 'You completed {} puzzles out of {}'.format(puzzles_completed.player_completed,
-                                                                      Puzzle.select().count())
+                                                                      Puzzle.total())
 
             def ok():
                 self._onexit()
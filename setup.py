@@ -26,7 +26,7 @@ setup(
     license='MIT license',
     packages=find_packages(
         exclude=[
-            'docs', 'tests',
+            'docs', 'tests', 'benchmarks',
             'windows', 'macOS', 'linux',
             'iOS', 'android',
             'django'
@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard
+
+
+class BitboardTest(TestCase):
+
+    def test_to_mask(self):
+        self.assertEqual(bitboard.to_mask([0, 2, 34]), 0b101 | (1 << 34))
+
+    def test_to_positions(self):
+        self.assertEqual(bitboard.to_positions(0b101 | (1 << 34)), [0, 2, 34])
+
+    def test_empty(self):
+        self.assertEqual(bitboard.to_positions(bitboard.EMPTY), [])
+
+    def test_full(self):
+        self.assertEqual(bitboard.to_positions(bitboard.FULL), list(range(35)))
+
+    def test_count(self):
+        self.assertEqual(bitboard.count(bitboard.to_mask([5, 6, 7, 3, 8])), 5)
+
+    def test_regions(self):
+        regions = bitboard.regions(bitboard.to_mask([34, 0, 1, 4, 20]))
+
+        self.assertEqual([bitboard.to_positions(r) for r in regions], [[0, 1, 4], [20], [34]])
+
+    def test_regions_empty(self):
+        self.assertEqual(bitboard.regions(bitboard.EMPTY), [])
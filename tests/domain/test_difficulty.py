@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, data, difficulty
+from kanoodlegenius2d.domain.models import Level, Noodle, Puzzle, PuzzleNoodle, PuzzleRating
+from tests.domain.common import ModelTestCase
+
+
+class RateTest(TestCase):
+
+    def test_rate(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        rating = difficulty.rate(occupied, 'D')
+
+        self.assertEqual(rating.nodes, 2)
+        self.assertEqual(rating.backtracks, 0)
+        self.assertEqual(rating.branching, 1)
+        self.assertEqual(rating.score, 1)
+
+    def test_rate_harder(self):
+        easy = difficulty.rate(bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8]), 'D')
+        hard = difficulty.rate(bitboard.EMPTY, 'ABCDEFG')
+
+        self.assertGreater(hard.score, easy.score)
+        self.assertGreater(hard.backtracks, 0)
+
+    def test_score(self):
+        self.assertEqual(difficulty.score(1, 0), 0)
+        self.assertEqual(difficulty.score(8, 3), 5)
+
+
+class RateAllTest(ModelTestCase):
+
+    requires = (Level, Puzzle, PuzzleNoodle, Noodle, PuzzleRating)
+
+    def test_rate_all(self):
+        puzzles = self._create_puzzles()
+
+        ratings = difficulty.rate_all(puzzles, processes=1)
+
+        self.assertEqual(ratings[puzzles[0]].nodes, difficulty.rate(*puzzles[0].template()).nodes)
+        self.assertGreater(ratings[puzzles[1]].score, ratings[puzzles[0]].score)
+
+    def test_rate_all_multiple_processes(self):
+        puzzles = self._create_puzzles()
+
+        self.assertEqual({p: r.nodes for p, r in difficulty.rate_all(puzzles, processes=2).items()},
+                         {p: r.nodes for p, r in difficulty.rate_all(puzzles, processes=1).items()})
+
+    def test_save(self):
+        puzzles = self._create_puzzles()
+        ratings = difficulty.rate_all(puzzles, processes=1)
+
+        difficulty.save(ratings)
+        difficulty.save(ratings)
+
+        self.assertEqual(PuzzleRating.select().count(), 2)
+        self.assertEqual(puzzles[0].difficulty, ratings[puzzles[0]].score)
+
+    def test_unrated_puzzle(self):
+        puzzles = self._create_puzzles()
+
+        self.assertIsNone(puzzles[0].difficulty)
+
+    def test_progression(self):
+        puzzles = self._create_puzzles()
+        ratings = difficulty.rate_all(puzzles, processes=1)
+
+        self.assertEqual(difficulty.progression(puzzles[0], ratings), [])
+        self.assertEqual(difficulty.ranked(list(reversed(puzzles)), ratings), puzzles)
+
+        ratings[puzzles[0]] = ratings[puzzles[1]]._replace(score=100)
+
+        self.assertEqual(difficulty.progression(puzzles[0], ratings), [(puzzles[0], puzzles[1])])
+
+    def _create_puzzles(self):
+        level = Level.create(number=1, name='test level')
+        easy = Puzzle.create(level=level, number=1, solution='')
+        hard = Puzzle.create(level=level, number=2, solution='')
+
+        light_blue = Noodle.light_blue()
+        light_blue.rotate(increment=3)
+        easy.place(light_blue, position=3)
+        easy.place(Noodle.dark_green(), position=9)
+        light_green = Noodle.light_green()
+        light_green.flip()
+        light_green.rotate(increment=3)
+        easy.place(light_green, position=15)
+        red = Noodle.red()
+        red.rotate()
+        easy.place(red, position=20)
+
+        return [easy, hard]
+
+    def setUp(self):
+        super().setUp()
+        for designation, colour, image, parts in data.NOODLES:
+            Noodle.create(designation=designation, colour=colour, image=image,
+                          part1=parts[0], part2=parts[1], part3=parts[2], part4=parts[3])
@@ -0,0 +1,46 @@
+import io
+import json
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from kanoodlegenius2d.domain import bitboard, holes, solver
+from kanoodlegenius2d.domain.generator import generate, generate_many, main
+
+
+class GenerateTest(TestCase):
+
+    def test_generate(self):
+        puzzle = generate(random.Random(0))
+
+        occupied = bitboard.EMPTY
+        for designation, position, *parts in puzzle.noodles:
+            occupied |= bitboard.to_mask(holes.find_positions(position, parts))
+        designations = [fields[0] for fields in puzzle.solution]
+
+        solutions = list(solver.iter_solutions(occupied, designations))
+
+        self.assertEqual(len(solutions), 1)
+        self.assertEqual(sorted((p.designation, p.position) + p.parts for p in solutions[0]),
+                         sorted(puzzle.solution))
+
+    def test_generate_number_of_noodles(self):
+        puzzle = generate(random.Random(0), min_noodles=3, max_noodles=3)
+
+        self.assertEqual(len(puzzle.noodles), 3)
+        self.assertEqual(len(puzzle.solution), 4)
+
+    def test_generate_many(self):
+        puzzles = list(generate_many(3, processes=1, seed=1))
+
+        self.assertEqual(len(puzzles), 3)
+
+    def test_generate_many_repeatable(self):
+        self.assertEqual(list(generate_many(3, processes=1, seed=1)), list(generate_many(3, processes=1, seed=1)))
+
+    def test_main_leaves_stdout_open(self):
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout, patch('sys.stderr', new_callable=io.StringIO):
+            main(['--count', '2', '--processes', '1', '--seed', '1', '--output', '-'])
+
+            self.assertFalse(stdout.closed)
+            self.assertEqual(len([json.loads(line) for line in stdout.getvalue().splitlines()]), 2)
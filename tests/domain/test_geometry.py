@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import geometry, orientation
+from kanoodlegenius2d.domain.geometry import OFF, Geometry
+
+
+class GeometryTest(TestCase):
+
+    def test_kanoodle_board(self):
+        board = geometry.KANOODLE
+
+        self.assertEqual(board.count, 35)
+        self.assertEqual(board.neighbours[0], (1, 5, 4, OFF, OFF, OFF))
+        self.assertEqual(board.neighbours[17], (18, 23, 22, 16, 11, 12))
+        self.assertEqual(board.neighbours[34], (OFF, OFF, OFF, 33, 29, 30))
+
+    def test_neighbours_are_symmetric(self):
+        board = geometry.KANOODLE
+
+        for position in range(board.count):
+            for code, neighbour in enumerate(board.neighbours[position]):
+                if neighbour != OFF:
+                    self.assertEqual(board.neighbours[neighbour][(code + 3) % 6], position)
+
+    def test_from_picture(self):
+        board = Geometry.from_picture('''
+ . .
+. . .
+''')
+
+        self.assertEqual(board.count, 5)
+        self.assertEqual(board.cells, ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)))
+        self.assertEqual(board.neighbours[0], (1, 3, 2, OFF, OFF, OFF))
+
+    def test_from_picture_off_grid(self):
+        with self.assertRaises(ValueError):
+            Geometry.from_picture('''
+. .
+. .
+''')
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            Geometry([])
+
+    def test_position_and_coordinates(self):
+        board = geometry.KANOODLE
+
+        self.assertEqual(board.coordinates(0), (1, 0))
+        self.assertEqual(board.position(1, 0), 0)
+        self.assertIsNone(board.position(0, 0))
+
+    def test_layout(self):
+        board = geometry.KANOODLE
+
+        self.assertEqual(board.layout(9), (0, 2))
+        self.assertEqual(board.layout(4), (0.5, 1))
+        self.assertEqual(board.layout(0), (1, 0))
+
+    def test_find_positions(self):
+        board = Geometry((column, row) for column in range(10) for row in range(10))
+
+        self.assertEqual(board.count, 100)
+        self.assertEqual(board.find_positions(0, (orientation.E, orientation.SE, orientation.SW)), [0, 1, 11, 20])
+        self.assertEqual(board.find_positions(0, (orientation.W,)), [0])
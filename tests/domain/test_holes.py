@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from kanoodlegenius2d.domain import orientation
-from kanoodlegenius2d.domain.holes import find_position
+from kanoodlegenius2d.domain.holes import find_position, find_positions
 
 
 class FindPositionTest(TestCase):
@@ -14,3 +14,19 @@ class FindPositionTest(TestCase):
 
     def test_no_neighbour(self):
         self.assertIsNone(find_position(0, orientation.W))
+
+
+class FindPositionsTest(TestCase):
+
+    def test_find_positions(self):
+        positions = find_positions(5, (orientation.E, orientation.E, orientation.NE, orientation.SE))
+
+        self.assertEqual(positions, [5, 6, 7, 3, 8])
+
+    def test_find_positions_stops_when_off_board(self):
+        positions = find_positions(1, (orientation.E, orientation.NE, orientation.SE))
+
+        self.assertEqual(positions, [1, 2])
+
+    def test_find_positions_invalid_position(self):
+        self.assertEqual(find_positions(100, (orientation.E,)), [])
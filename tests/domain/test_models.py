@@ -1,13 +1,15 @@
 import os
 import sqlite3
-from unittest import TestCase
+import threading
+from unittest import TestCase, mock
 
 from peewee import IntegrityError
 
-from kanoodlegenius2d.domain import orientation
+from kanoodlegenius2d.domain import bitboard, models, orientation, packing
 from kanoodlegenius2d.domain.models import (Board,
                                             BoardNoodle,
                                             DuplicatePlayerNameException,
+                                            flush,
                                             Game,
                                             initialise,
                                             Level,
@@ -16,8 +18,9 @@ from kanoodlegenius2d.domain.models import (Board,
                                             Puzzle,
                                             PuzzleNoodle,
                                             PositionUnavailableException,
-                                            shutdown)
-from tests.domain.common import ModelTestCase
+                                            shutdown,
+                                            UnsolvableBoardException)
+from tests.domain.common import ModelTestCase, test_db
 
 
 class InitialiseTest(TestCase):
@@ -103,6 +106,161 @@ class GameIntegrationTest(TestCase):
 
         self.assertTrue(board.completed)
 
+    def test_hint(self):
+        """Test that a hint suggests a placement that leads to a solution."""
+        board = Game.start('test_player')
+
+        placement = board.hint()
+
+        self.assertEqual(placement.designation, 'B')
+        self.assertEqual(placement.position, 17)
+
+    def test_hint_completed_board(self):
+        """Test that no hint is given once the board is complete."""
+        board = Game.start('test_player')
+        board.solve()
+
+        self.assertIsNone(board.hint())
+
+    def test_hint_raises_exception_when_unsolvable(self):
+        """Test that an exception is raised when a hint is requested for a board
+        that cannot be completed.
+        """
+        board = Game.start('test_player')
+        dark_blue = Noodle.dark_blue()
+        dark_blue.rotate(increment=2)
+        board.place(dark_blue, position=8)
+
+        with self.assertRaises(UnsolvableBoardException):
+            board.hint()
+
+    def test_valid_drops(self):
+        """Test that a noodle can be placed on each of its valid drops, and nowhere else."""
+        board = Game.start('test_player')
+        dark_blue = Noodle.dark_blue()
+
+        drops = board.valid_drops(dark_blue, part_pos=2)
+
+        for position in range(35):
+            if position not in drops:
+                with self.assertRaises(PositionUnavailableException):
+                    board.place(dark_blue, position=position, part_pos=2)
+
+        board.place(dark_blue, position=drops[0], part_pos=2)
+
+    def test_pack_puzzle(self):
+        """Test that a puzzle and its solution pack into a record that completes the board."""
+        board = Game.start('test_player')
+
+        puzzle = packing.load(board.puzzle.pack())
+
+        self.assertEqual(puzzle.occupied, board.occupied)
+        occupied = puzzle.occupied
+        for placement in puzzle.solution:
+            occupied |= placement.mask
+        self.assertEqual(occupied, bitboard.FULL)
+
+    def test_solve_keeping_placements(self):
+        """Test that solving keeps the player's noodles when they lead to a solution."""
+        board = Game.start('test_player')
+        placement = board.hint()
+        noodle = Noodle.get(Noodle.designation == placement.designation)
+        noodle.part1, noodle.part2, noodle.part3, noodle.part4 = placement.parts
+        board.place(noodle, position=placement.position)
+        placed = board.noodles.order_by(BoardNoodle.id.desc()).get()
+
+        board.solve(keep_placements=True)
+
+        self.assertTrue(board.completed)
+        self.assertTrue(board.auto_completed)
+        self.assertEqual(board.noodles.where(BoardNoodle.noodle == noodle).get().id, placed.id)
+        self.assertEqual(len(board.noodles), 7)
+        self.assertEqual(Board.get(Board.id == board.id).occupied, board.occupied)
+        self.assertEqual(Board.get(Board.id == board.id).state_hash, board.state_hash)
+
+    def test_solve_keeping_placements_unsolvable(self):
+        """Test that solving starts from the puzzle when the player's noodles do not lead to a solution."""
+        board = Game.start('test_player')
+        dark_blue = Noodle.dark_blue()
+        dark_blue.rotate(increment=2)
+        board.place(dark_blue, position=8)
+
+        board.solve(keep_placements=True)
+
+        self.assertTrue(board.completed)
+        self.assertEqual(len(board.noodles), 7)
+        self.assertNotEqual(board.noodles.where(BoardNoodle.noodle == dark_blue).get().position, 8)
+
+    def test_solve_search_on_worker_thread(self):
+        """Test that the search for a solution can run on another thread and complete the board afterwards."""
+        board = Game.start('test_player')
+        search = board.solve_search(keep_placements=True)
+        checks, results = [], []
+
+        worker = threading.Thread(target=lambda: results.append(search(check=lambda: checks.append(1))))
+        worker.start()
+        worker.join()
+        board.complete(*results[0])
+
+        self.assertGreater(len(checks), 0)
+        self.assertTrue(board.completed)
+        self.assertTrue(board.auto_completed)
+        self.assertEqual(len(board.noodles), 7)
+
+    def test_hint_search(self):
+        """Test that the search for a hint gives the same hint as hint()."""
+        board = Game.start('test_player')
+
+        self.assertEqual(board.hint_search()(), board.hint())
+
+    def test_state_hash(self):
+        """Test that the board's hash is updated as noodles are placed and undone."""
+        board = Game.start('test_player')
+        start = board.state_hash
+        dark_blue = Noodle.dark_blue()
+
+        board.place(dark_blue, position=board.valid_drops(dark_blue)[0])
+
+        self.assertNotEqual(board.state_hash, start)
+        placed = board.state_hash
+        self.assertEqual(Board.get(Board.id == board.id).state_hash, placed)
+
+        board.undo()
+
+        self.assertEqual(board.state_hash, start)
+
+        board.redo()
+
+        self.assertEqual(board.state_hash, placed)
+
+    def test_state_hash_unchanged_by_reading_occupancy(self):
+        """Test that finding the holes a noodle occupies leaves the board's hash alone."""
+        board = Game.start('test_player')
+        start = board.state_hash
+
+        for board_noodle in board.placed_noodles:
+            board._mask(board_noodle)
+
+        self.assertEqual(board.state_hash, start)
+
+    def test_count_solutions(self):
+        """Test that the solutions remaining from the board's state are counted."""
+        board = Game.start('test_player')
+
+        self.assertEqual(board.count_solutions(), 1)
+
+    def test_dead_regions(self):
+        """Test that the regions of the board the remaining noodles cannot fill are found."""
+        board = Game.start('test_player')
+
+        self.assertEqual(board.dead_regions(), [])
+
+        dark_blue = Noodle.dark_blue()
+        dark_blue.rotate(increment=2)
+        board.place(dark_blue, position=8)
+
+        self.assertEqual(board.dead_regions(), [[7, 12, 17], [14, 19, 25], [29, 32, 33, 34]])
+
     def test_complete_game(self):
         """Test that the game indicates that it is fully complete."""
         self.fail('Implement')
@@ -143,6 +301,250 @@ class GameIntegrationTest(TestCase):
         player1 = Player.get(Player.name == 'player1')
         self.assertEqual(Game.resume(player1), board1)
 
+    def test_redo(self):
+        """Test that an undone noodle can be put back on the board, until another is placed."""
+        board = Game.start('test_player')
+        dark_blue = Noodle.dark_blue()
+        board.place(dark_blue, position=32)
+        occupied = board.occupied
+
+        self.assertTrue(board.can_undo)
+        self.assertFalse(board.can_redo)
+
+        self.assertEqual(board.undo(), dark_blue)
+        self.assertFalse(board.can_undo)
+        self.assertEqual(board.redo(), dark_blue)
+
+        self.assertEqual(board.occupied, occupied)
+        self.assertIsNone(board.redo())
+        resumed = Game.resume(Player.get(Player.name == 'test_player'))
+        self.assertEqual(len(resumed.noodles), 5)
+        self.assertEqual(resumed.occupied, occupied)
+
+        board.undo()
+        board.place(dark_blue, position=32)
+
+        self.assertFalse(board.can_redo)
+
+    def test_redo_completes_board(self):
+        board = Game.start('test_player')
+        yellow = Noodle.yellow()
+        yellow.flip()
+        yellow.rotate(increment=2)
+        board.place(Noodle.dark_blue(), position=32)
+        pink = Noodle.pink()
+        pink.rotate(5)
+        board.place(pink, position=29)
+        board.place(yellow, position=17)
+
+        board.undo()
+        self.assertFalse(board.completed)
+        board.redo()
+
+        self.assertTrue(board.completed)
+        self.assertEqual(board.state_hash, Game.resume(Player.get(Player.name == 'test_player')).state_hash)
+
+    def test_deferred_writes(self):
+        """Test that the moves made on a board that defers its writes are applied
+        in memory straight away and written to the database when flushed.
+        """
+        board = Game.start('test_player')
+        board.defer_writes()
+
+        board.place(Noodle.dark_blue(), position=32)
+        pink = Noodle.pink()
+        pink.rotate(5)
+        board.place(pink, position=29)
+        board.undo()
+
+        self.assertEqual([noodle.noodle.designation for noodle in board.placed_noodles], list('DGAEC'))
+
+        flush()
+
+        resumed = Game.resume(Player.get(Player.name == 'test_player'))
+        self.assertEqual([noodle.noodle.designation for noodle in resumed.placed_noodles], list('DGAEC'))
+        self.assertEqual(resumed.occupied, board.occupied)
+        self.assertEqual(resumed.player.game.last_played, board.player.game.last_played)
+
+    def test_deferred_writes_written_on_shutdown(self):
+        board = Game.start('test_player')
+        board.defer_writes()
+        board.place(Noodle.dark_blue(), position=32)
+
+        shutdown()
+        initialise()
+
+        self.assertEqual(len(BoardNoodle.select().where(BoardNoodle.board == board.id)), 5)
+
+    def test_deferred_writes_solve(self):
+        """Test that moves held in memory are written before the board is solved."""
+        board = Game.start('test_player')
+        board.defer_writes()
+        board.place(Noodle.dark_blue(), position=32)
+
+        board.solve(keep_placements=True)
+
+        self.assertTrue(board.completed)
+        self.assertEqual(len(board.placed_noodles), 7)
+        self.assertEqual(len(board.noodles), 7)
+
+    def setUp(self):
+        self._datafile_path = os.path.join(os.path.expanduser('~'), '.kanoodlegenius2d.db')
+        initialise()
+
+    def tearDown(self):
+        shutdown()
+        try:
+            os.remove(self._datafile_path)
+        except OSError:
+            pass
+
+
+class NoodleCatalogueTest(TestCase):
+
+    def test_of(self):
+        """Test that a noodle is handed out from the catalogue without querying the database."""
+        with mock.patch.object(models.database, 'execute_sql', wraps=models.database.execute_sql) as execute_sql:
+            light_blue = Noodle.of('D')
+            dark_green = Noodle.dark_green()
+
+        self.assertEqual(execute_sql.call_count, 0)
+        self.assertEqual(light_blue, Noodle.get(Noodle.designation == 'D'))
+        self.assertEqual(light_blue.colour, '#00ccff')
+        self.assertEqual(dark_green.designation, 'G')
+
+    def test_of_returns_copy(self):
+        """Test that rotating a noodle from the catalogue does not affect the catalogue."""
+        noodle = Noodle.of('D')
+        noodle.rotate(increment=2)
+
+        self.assertNotEqual(noodle.parts, Noodle.of('D').parts)
+        self.assertIs(noodle.colour, Noodle.of('D').colour)
+
+    def test_of_unknown(self):
+        with self.assertRaises(Noodle.DoesNotExist):
+            Noodle.of('Z')
+
+    def test_all(self):
+        noodles = Noodle.all()
+
+        self.assertEqual([noodle.designation for noodle in noodles], list('ABCDEFG'))
+        self.assertEqual(set(noodles), set(Noodle.select()))
+
+    def test_cleared_on_shutdown(self):
+        """Test that the catalogue is reloaded once the database has been shut down."""
+        Noodle.update(colour='#123456').where(Noodle.designation == 'A').execute()
+        shutdown()
+
+        self.assertEqual(Noodle.of('A').colour, '#123456')
+
+    def test_reloaded_when_noodle_saved(self):
+        noodle = Noodle.get(Noodle.designation == 'A')
+        noodle.colour = '#123456'
+        noodle.save()
+
+        self.assertEqual(Noodle.of('A').colour, '#123456')
+
+    def test_not_shared_between_databases(self):
+        """Test that the noodles read from one database are not handed out for another."""
+        Noodle.of('A')
+        original = Noodle._meta.database
+        Noodle._meta.database = test_db
+        test_db.create_tables([Noodle], True)
+
+        try:
+            with self.assertRaises(Noodle.DoesNotExist):
+                Noodle.of('A')
+        finally:
+            test_db.drop_tables([Noodle], True)
+            Noodle._meta.database = original
+
+        self.assertEqual(Noodle.of('A').designation, 'A')
+
+    def setUp(self):
+        self._datafile_path = os.path.join(os.path.expanduser('~'), '.kanoodlegenius2d.db')
+        initialise()
+
+    def tearDown(self):
+        shutdown()
+        try:
+            os.remove(self._datafile_path)
+        except OSError:
+            pass
+
+
+class PuzzleCatalogueTest(TestCase):
+
+    def test_next_puzzle(self):
+        """Test that every puzzle's next puzzle and its level are found without querying the database."""
+        puzzles = list(Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number, Puzzle.number))
+
+        with mock.patch.object(models.database, 'execute_sql', wraps=models.database.execute_sql) as execute_sql:
+            following = [puzzle.next_puzzle() for puzzle in puzzles]
+            levels = [puzzle.level.number for puzzle in following[:-1]]
+
+        self.assertEqual(execute_sql.call_count, 0)
+        self.assertEqual(following, puzzles[1:] + [None])
+        self.assertEqual(levels, [puzzle.level.number for puzzle in puzzles[1:]])
+
+    def test_first(self):
+        self.assertEqual(Puzzle.first(), Puzzle.get(Puzzle.level == Level.get(Level.number == 1), Puzzle.number == 1))
+
+    def test_total(self):
+        self.assertEqual(Puzzle.total(), Puzzle.select().count())
+
+    def test_noodle_count(self):
+        for puzzle in Puzzle.select():
+            self.assertEqual(puzzle.noodle_count, len(puzzle.noodles))
+
+    def test_template(self):
+        puzzles = list(Puzzle.select())
+
+        self.assertEqual({puzzle: puzzle.template() for puzzle in puzzles}, Puzzle.templates(puzzles))
+
+    def test_setup_and_resume(self):
+        """Test that setting up a board and looking up its level on resume need not read the puzzle."""
+        Game.start('test_player')
+        player = Player.get(Player.name == 'test_player')
+
+        with mock.patch.object(models.database, 'execute_sql', wraps=models.database.execute_sql) as execute_sql:
+            board = Game.resume(player)
+            level = board.puzzle.level.number
+
+        self.assertEqual(execute_sql.call_count, 1)
+        self.assertEqual(level, 1)
+        self.assertEqual(len(board.noodles), board.puzzle.noodle_count)
+
+    def test_reloaded_when_puzzle_saved(self):
+        last = Puzzle.select(Puzzle, Level).join(Level).order_by(Level.number.desc(), Puzzle.number.desc()).get()
+        self.assertIsNone(last.next_puzzle())
+
+        level = Level.create(number=last.level.number + 1, name='Extra')
+        extra = Puzzle.create(level=level, number=1, solution='')
+
+        self.assertEqual(last.next_puzzle(), extra)
+        self.assertEqual(last.next_puzzle().level.name, 'Extra')
+        self.assertEqual(Puzzle.total(), Puzzle.select().count())
+
+    def test_not_shared_between_databases(self):
+        """Test that the puzzles read from one database are not handed out for another."""
+        total = Puzzle.total()
+        tables = (Level, Puzzle, PuzzleNoodle, Noodle)
+        originals = [table._meta.database for table in tables]
+        for table in tables:
+            table._meta.database = test_db
+        test_db.create_tables(tables, True)
+
+        try:
+            self.assertEqual(Puzzle.total(), 0)
+            self.assertIsNone(Puzzle.first())
+        finally:
+            test_db.drop_tables(tables, True)
+            for table, original in zip(tables, originals):
+                table._meta.database = original
+
+        self.assertEqual(Puzzle.total(), total)
+
     def setUp(self):
         self._datafile_path = os.path.join(os.path.expanduser('~'), '.kanoodlegenius2d.db')
         initialise()
@@ -214,6 +616,20 @@ class NoodleTest(ModelTestCase):
         self.assertEqual(noodle.part3, orientation.NW)
         self.assertEqual(noodle.part4, orientation.SW)
 
+    def test_transform(self):
+        noodle = Noodle(designation='D', code='light_blue',
+                        part1=orientation.E,
+                        part2=orientation.E,
+                        part3=orientation.NE,
+                        part4=orientation.SE)
+
+        noodle.transform(8)
+
+        self.assertEqual(noodle.part1, orientation.NE)
+        self.assertEqual(noodle.part2, orientation.NE)
+        self.assertEqual(noodle.part3, orientation.E)
+        self.assertEqual(noodle.part4, orientation.NW)
+
 
 class BoardTest(ModelTestCase):
 
@@ -276,6 +692,27 @@ class BoardTest(ModelTestCase):
             board.place(light_blue, position=0, part_pos=3)
         self.assertEqual(str(ctx.exception), 'Part 1 of the noodle is not on the board')
 
+    def test_place_raises_exception_when_position_not_on_board(self):
+        board = self._create_board()
+        light_blue = Noodle.get(Noodle.designation == 'D')
+
+        with self.assertRaises(PositionUnavailableException) as ctx:
+            board.place(light_blue, position=35)
+        self.assertEqual(str(ctx.exception), 'Position 35 is not on the board')
+
+    def test_place_noodle_of_another_shape(self):
+        """Test that a noodle whose parts are not a transform of its own shape
+        is placed wherever its parts fit on the board.
+        """
+        board = self._create_board()
+        light_blue = Noodle.get(Noodle.designation == 'D')
+        light_blue.part1, light_blue.part2, light_blue.part3, light_blue.part4 = 'E', 'E', 'E', 'SE'
+
+        board.place(light_blue, position=0)
+
+        self.assertEqual(board.occupied, bitboard.to_mask([0, 1, 2, 3, 8]))
+        self.assertEqual(BoardNoodle.get(BoardNoodle.position == 0).part4, orientation.SE)
+
     def test_place_raises_exception_when_root_position_occupied(self):
         board = self._create_board()
         light_blue = Noodle.get(Noodle.designation == 'D')
@@ -523,22 +960,27 @@ class PlayerTest(ModelTestCase):
         game = Game.create()
         player = Player.create(game=game, name='Test')
         level = Level.create(number=1, name='Level 1')
-        Noodle.create(designation='A', colour='yellow', part1='NE', part2='SE', part3='E', part4='W')
+        noodle = Noodle.create(designation='A', colour='yellow', image='yellow_sphere.png',
+                               part1='NE', part2='SE', part3='E', part4='W')
+        # Noodle positions that fill every hole on the board
+        placements = [(3, 'W', 'W', 'SW', 'NW'), (9, 'NE', 'SE', 'E', 'NE'), (15, 'E', 'SE', 'SE', 'NE'),
+                      (20, 'E', 'SW', 'E', 'SW'), (32, 'E', 'E', 'NE', 'NE'), (29, 'NE', 'NW', 'E', 'NE'),
+                      (17, 'NE', 'E', 'NW', 'E')]
 
         # Configure 2 complete boards
         for n in range(2):
-            puzzle = Puzzle.create(level=level, number=n)
+            puzzle = Puzzle.create(level=level, number=n, solution='')
             board = Board.create(player=player, puzzle=puzzle)
-            for p in range(7):
-                BoardNoodle.create(board=board, noodle=Noodle.get(designation='A'), position=p,
-                                   part1='NE', part2='SE', part3='E', part4='W')
+            for p, part1, part2, part3, part4 in placements:
+                BoardNoodle.create(board=board, noodle=noodle, position=p,
+                                   part1=part1, part2=part2, part3=part3, part4=part4)
 
         # Configure 1 incomplete board
-        puzzle = Puzzle.create(level=level, number=2)
+        puzzle = Puzzle.create(level=level, number=2, solution='')
         board = Board.create(player=player, puzzle=puzzle)
-        for p in range(6):
-            BoardNoodle.create(board=board, noodle=Noodle.get(designation='A'), position=p,
-                               part1='NE', part2='SE', part3='E', part4='W')
+        for p, part1, part2, part3, part4 in placements[:6]:
+            BoardNoodle.create(board=board, noodle=noodle, position=p,
+                               part1=part1, part2=part2, part3=part3, part4=part4)
 
         completed = player.puzzles_completed
 
@@ -548,7 +990,7 @@ class PlayerTest(ModelTestCase):
 
 class PuzzleTest(ModelTestCase):
 
-    requires = (Level, Puzzle)
+    requires = (Level, Puzzle, PuzzleNoodle, Noodle)
 
     def test_next_puzzle(self):
         level = Level.create(number=1, name='Super Pro')
@@ -0,0 +1,45 @@
+from collections import namedtuple
+from unittest import TestCase
+
+from kanoodlegenius2d.domain.moves import MoveStack
+
+BoardNoodle = namedtuple('BoardNoodle', 'noodle_id')
+
+
+class MoveStackTest(TestCase):
+
+    def setUp(self):
+        self.puzzle_noodle = BoardNoodle(1)
+        self.first, self.second = BoardNoodle(2), BoardNoodle(3)
+        self.moves = MoveStack([self.puzzle_noodle, self.first], fixed=[1])
+
+    def test_undo(self):
+        self.assertIs(self.moves.undo(), self.first)
+        self.assertEqual(list(self.moves), [self.puzzle_noodle])
+
+    def test_undo_does_not_undo_fixed(self):
+        self.moves.undo()
+
+        self.assertFalse(self.moves.can_undo)
+        self.assertIsNone(self.moves.undo())
+        self.assertEqual(len(self.moves), 1)
+
+    def test_redo(self):
+        self.moves.push(self.second)
+        self.moves.undo()
+        self.moves.undo()
+
+        self.assertIs(self.moves.redo(), self.first)
+        self.assertIs(self.moves.redo(), self.second)
+        self.assertFalse(self.moves.can_redo)
+        self.assertIsNone(self.moves.redo())
+        self.assertEqual(list(self.moves), [self.puzzle_noodle, self.first, self.second])
+
+    def test_push_discards_undone(self):
+        self.moves.undo()
+        self.assertTrue(self.moves.can_redo)
+
+        self.moves.push(self.second)
+
+        self.assertFalse(self.moves.can_redo)
+        self.assertEqual(list(self.moves), [self.puzzle_noodle, self.second])
@@ -32,3 +32,74 @@ class OppositeTest(TestCase):
         o = orientation.opposite(orientation.W)
 
         self.assertEqual(o, orientation.E)
+
+
+class FlipTest(TestCase):
+
+    def test_flip_north_east(self):
+        o = orientation.flip(orientation.NE)
+
+        self.assertEqual(o, orientation.NW)
+
+    def test_flip_east(self):
+        o = orientation.flip(orientation.E)
+
+        self.assertEqual(o, orientation.W)
+
+
+class TransformTest(TestCase):
+
+    def test_rotate(self):
+        parts = orientation.transform((orientation.E, orientation.E, orientation.NE, orientation.SE), 3)
+
+        self.assertEqual(parts, (orientation.W, orientation.W, orientation.SW, orientation.NW))
+
+    def test_flip(self):
+        parts = orientation.transform((orientation.E, orientation.E, orientation.NE, orientation.SE), 6)
+
+        self.assertEqual(parts, (orientation.W, orientation.W, orientation.NW, orientation.SW))
+
+    def test_flip_and_rotate(self):
+        parts = orientation.transform((orientation.E, orientation.E, orientation.NE, orientation.SE), 7)
+
+        self.assertEqual(parts, (orientation.NW, orientation.NW, orientation.NE, orientation.W))
+
+    def test_integer_codes(self):
+        codes = tuple(orientation.CODES[o] for o in (orientation.E, orientation.E, orientation.NE, orientation.SE))
+
+        parts = orientation.transform(codes, 3)
+
+        self.assertEqual(tuple(orientation.NAMES[c] for c in parts),
+                         (orientation.W, orientation.W, orientation.SW, orientation.NW))
+
+    def test_invalid_transform(self):
+        with self.assertRaises(ValueError):
+            orientation.transform((orientation.E, orientation.E, orientation.NE, orientation.SE), 12)
+
+
+class ShapeTest(TestCase):
+
+    def test_same_shape_reversed_parts(self):
+        shape = orientation.shape((orientation.NE, orientation.SE, orientation.NE, orientation.SE))
+        reversed_shape = orientation.shape((orientation.NW, orientation.SW, orientation.NW, orientation.SW))
+
+        self.assertEqual(shape, reversed_shape)
+
+    def test_different_shape(self):
+        shape = orientation.shape((orientation.E, orientation.E, orientation.NE, orientation.SE))
+        flipped_shape = orientation.shape((orientation.W, orientation.W, orientation.NW, orientation.SW))
+
+        self.assertNotEqual(shape, flipped_shape)
+
+
+class UniqueTransformsTest(TestCase):
+
+    def test_asymmetric_noodle(self):
+        transforms = orientation.unique_transforms((orientation.E, orientation.E, orientation.NE, orientation.SE))
+
+        self.assertEqual(transforms, tuple(range(12)))
+
+    def test_symmetric_noodle(self):
+        transforms = orientation.unique_transforms((orientation.NE, orientation.SE, orientation.NE, orientation.SE))
+
+        self.assertEqual(transforms, (0, 1, 2, 3, 4, 5))
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, packing, placements, solver
+
+
+class PackingTest(TestCase):
+
+    def test_pack_placement(self):
+        placement = placements.find('D', ('E', 'E', 'NE', 'SE'), 5)
+
+        code = packing.pack_placement(placement)
+
+        self.assertLess(code, 1 << 13)
+        self.assertIs(packing.unpack_placement(code), placement)
+
+    def test_unpack_invalid_placement(self):
+        with self.assertRaises(ValueError):
+            packing.unpack_placement(0)  # Noodle A, transform 0 does not fit at position 0
+
+    def test_pack_and_unpack(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+        noodles, remaining = solution[:3], solution[3:]
+
+        record = packing.pack(noodles, remaining)
+
+        self.assertEqual(len(record), packing.RECORD_SIZE)
+        self.assertEqual(packing.unpack(record), (noodles, remaining))
+
+    def test_pack_requires_every_noodle(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+
+        with self.assertRaises(ValueError):
+            packing.pack(solution[:3], solution[4:])
+
+    def test_unpack_malformed_record(self):
+        with self.assertRaises(ValueError):
+            packing.unpack(b'\x01\x00')
+
+    def test_load(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+        noodles, remaining = solution[:3], solution[3:]
+
+        puzzle = packing.load(packing.pack(noodles, remaining))
+
+        self.assertEqual(puzzle.occupied, noodles[0].mask | noodles[1].mask | noodles[2].mask)
+        self.assertEqual(puzzle.designations, tuple(p.designation for p in remaining))
+        self.assertEqual(puzzle.solution, remaining)
+
+    def test_iter_records(self):
+        record = packing.pack((), solver.solve(bitboard.EMPTY, 'ABCDEFG'))
+
+        self.assertEqual(list(packing.iter_records(record * 3)), [record] * 3)
+
+    def test_iter_records_partial(self):
+        with self.assertRaises(ValueError):
+            list(packing.iter_records(b'\x00' * (packing.RECORD_SIZE + 1)))
@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import data, orientation, pieces
+
+
+class PieceTest(TestCase):
+
+    def test_from_parts(self):
+        piece = pieces.from_parts('D', '#00ccff', 'light_blue_sphere.png',
+                                  (orientation.E, orientation.E, orientation.NE, orientation.SE))
+
+        self.assertEqual(piece.cells, ((0, 0), (1, 0), (2, 0), (3, -1), (3, 0)))
+        self.assertEqual(piece.parts, ('E', 'E', 'NE', 'SE'))
+
+    def test_from_parts_overlapping(self):
+        with self.assertRaises(ValueError):
+            pieces.from_parts('X', '#ffffff', 'x.png', (orientation.E, orientation.W))
+
+    def test_from_cells(self):
+        piece = pieces.from_cells('V', '#ffffff', 'x.png', [(2, 3), (3, 3), (2, 4)])
+
+        self.assertEqual(piece.cells, ((0, 0), (1, 0), (0, 1)))
+        self.assertIsNone(piece.parts)
+
+    def test_from_cells_not_connected(self):
+        with self.assertRaises(ValueError):
+            pieces.from_cells('X', '#ffffff', 'x.png', [(0, 0), (2, 0)])
+
+    def test_from_picture(self):
+        piece = pieces.from_picture('V', '#ffffff', 'x.png', '''
+ .
+. .
+''')
+
+        self.assertEqual(piece.cells, ((0, 0), (-1, 1), (0, 1)))
+
+    def test_transform_matches_orientation(self):
+        for designation, colour, image, parts in data.NOODLES:
+            for t in range(orientation.TRANSFORMS):
+                self.assertEqual(pieces.transform(pieces.from_parts(designation, colour, image, parts).cells, t),
+                                 pieces.from_parts(designation, colour, image, orientation.transform(parts, t)).cells)
+
+    def test_path(self):
+        self.assertEqual(pieces.path((orientation.E, orientation.E, orientation.NE, orientation.SE)),
+                         ((0, 0), (1, 0), (2, 0), (3, -1), (3, 0)))
+        self.assertEqual(pieces.path(()), ((0, 0),))
+
+    def test_shape(self):
+        self.assertEqual(pieces.shape(((0, 0), (1, 0), (2, 0), (3, -1), (3, 0))),
+                         frozenset({(0, 1), (1, 1), (2, 1), (3, 0), (3, 1)}))
+
+    def test_unique_transforms(self):
+        self.assertEqual(pieces.unique_transforms(((0, 0), (1, 0), (2, 0))), (0, 1, 2))
+        self.assertEqual(len(pieces.unique_transforms(((0, 0), (1, 0), (2, 0), (3, -1), (3, 0)))), 12)
+
+    def test_canonical(self):
+        piece = pieces.from_parts('D', '#00ccff', 'light_blue_sphere.png',
+                                  (orientation.E, orientation.E, orientation.NE, orientation.SE))
+
+        for t in range(orientation.TRANSFORMS):
+            self.assertEqual(pieces.canonical(pieces.transform(piece.cells, t)), pieces.canonical(piece.cells))
+        self.assertNotEqual(pieces.canonical(piece.cells), pieces.canonical(pieces.get().pieces[0].cells))
+
+
+class RegistryTest(TestCase):
+
+    def test_default(self):
+        piece_set = pieces.get()
+
+        self.assertEqual(piece_set.name, pieces.DEFAULT)
+        self.assertEqual([(p.designation, p.colour, p.image, p.parts) for p in piece_set.pieces], list(data.NOODLES))
+
+    def test_register(self):
+        piece_set = pieces.PieceSet('test_register', (pieces.from_parts('I', '#ffffff', 'x.png', ('E', 'E')),))
+
+        pieces.register(piece_set)
+
+        self.assertIs(pieces.get('test_register'), piece_set)
+        self.assertIn('test_register', pieces.names())
+
+    def test_register_duplicate_designations(self):
+        piece = pieces.from_parts('I', '#ffffff', 'x.png', ('E', 'E'))
+
+        with self.assertRaises(ValueError):
+            pieces.register(pieces.PieceSet('test_duplicates', (piece, piece)))
+
+    def test_get_unknown(self):
+        with self.assertRaises(KeyError):
+            pieces.get('unknown')
+
+    def test_load(self):
+        definition = {
+            'name': 'test_load',
+            'pieces': [
+                {'designation': 'I', 'colour': '#e60000', 'image': 'red_sphere.png', 'parts': ['E', 'E']},
+                {'designation': 'V', 'colour': '#ffff00', 'image': 'yellow_sphere.png', 'cells': [[0, 0], [1, 0],
+                                                                                                  [0, 1]]},
+                {'designation': 'C', 'colour': '#000099', 'image': 'dark_blue_sphere.png', 'picture': '. . .'},
+            ]
+        }
+        fd, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(definition, f)
+
+        try:
+            piece_set = pieces.load(path)
+        finally:
+            os.remove(path)
+
+        self.assertIs(pieces.get('test_load'), piece_set)
+        self.assertEqual([p.designation for p in piece_set.pieces], ['I', 'V', 'C'])
+        self.assertEqual(piece_set.pieces[0].cells, piece_set.pieces[2].cells)
+        self.assertEqual(piece_set.pieces[1].cells, ((0, 0), (1, 0), (0, 1)))
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, geometry, orientation, pieces, placements
+
+
+class PlacementTableTest(TestCase):
+
+    def test_placements_are_on_board(self):
+        for placement in placements.get('D'):
+            self.assertEqual(len(placement.positions), 5)
+            self.assertEqual(placement.mask, bitboard.to_mask(placement.positions))
+
+    def test_find(self):
+        placement = placements.find('D', (orientation.E, orientation.E, orientation.NE, orientation.SE), 5)
+
+        self.assertEqual(placement.positions, (5, 6, 7, 3, 8))
+        self.assertEqual(placement.transform, 0)
+
+    def test_find_off_board(self):
+        self.assertIsNone(placements.find('D', (orientation.E, orientation.E, orientation.NE, orientation.SE), 0))
+
+    def test_stats(self):
+        stats = placements.stats()
+
+        self.assertEqual(stats.placements, sum(len(placements.get(d)) for d in 'ABCDEFG'))
+        self.assertGreater(stats.size, 0)
+
+    def test_symmetric_transforms_excluded(self):
+        transforms = {placement.transform for placement in placements.get('E')}
+
+        self.assertEqual(transforms, {0, 1, 2, 3, 4, 5})
+
+    def test_find_excluded_transform(self):
+        placement = placements.find('E', (orientation.NW, orientation.SW, orientation.NW, orientation.SW), 8)
+
+        self.assertEqual(placement.positions, (8, 3, 7, 2, 6))
+
+    def test_transform_stats(self):
+        stats = placements.transform_stats()
+
+        self.assertEqual(stats['A'].unique, 12)
+        self.assertEqual(stats['E'].unique, 6)
+        self.assertEqual(stats['E'].reduction, 2)
+
+    def test_drops(self):
+        parts = (orientation.E, orientation.E, orientation.NE, orientation.SE)
+
+        self.assertEqual(placements.drops('D', parts, 0, bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])),
+                         bitboard.to_mask([5]))
+        self.assertEqual(placements.drops('D', parts, 3, bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])),
+                         bitboard.to_mask([3]))
+
+    def test_drops_match_placements(self):
+        parts = (orientation.E, orientation.E, orientation.NE, orientation.SE)
+
+        for part_pos in range(5):
+            expected = bitboard.to_mask({p.positions[part_pos] for p in placements.get('D') if p.parts == parts})
+            self.assertEqual(placements.drops('D', parts, part_pos, bitboard.EMPTY), expected)
+
+    def test_build_default_matches_table(self):
+        table = placements.build(pieces.get(), geometry.KANOODLE)
+
+        for designation in 'ABCDEFG':
+            self.assertEqual(table[designation], placements.get(designation))
+
+    def test_build_custom(self):
+        board = geometry.Geometry.from_picture('''
+. . .
+ . . .
+''')
+        piece_set = pieces.PieceSet('test', (pieces.from_picture('V', '#ffffff', 'x.png', '''
+ .
+. .
+'''),))
+
+        table = placements.build(piece_set, board)
+
+        self.assertEqual({frozenset(p.positions) for p in table['V']},
+                         {frozenset(positions) for positions in ((0, 1, 3), (1, 2, 4), (1, 3, 4), (2, 4, 5))})
+        self.assertTrue(all(p.parts is None for p in table['V']))
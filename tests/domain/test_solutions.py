@@ -0,0 +1,68 @@
+from kanoodlegenius2d.domain import bitboard, data
+from kanoodlegenius2d.domain.models import Level, Noodle, Puzzle, PuzzleNoodle
+from kanoodlegenius2d.domain.solutions import count_all_solutions, count_solutions, iter_solutions
+from tests.domain.common import ModelTestCase
+
+
+class SolutionsTest(ModelTestCase):
+
+    requires = (Level, Puzzle, PuzzleNoodle, Noodle)
+
+    def test_iter_solutions(self):
+        puzzle = self._create_puzzle()
+
+        solutions = list(iter_solutions(puzzle, processes=1))
+
+        self.assertEqual(len(solutions), 1)
+        occupied, _ = puzzle.template()
+        for placement in solutions[0]:
+            self.assertFalse(occupied & placement.mask)
+            occupied |= placement.mask
+        self.assertEqual(occupied, bitboard.FULL)
+
+    def test_count_solutions(self):
+        puzzle = self._create_puzzle()
+
+        self.assertEqual(count_solutions(puzzle, processes=1), 1)
+
+    def test_count_solutions_multiple_processes(self):
+        puzzle = self._create_puzzle()
+
+        self.assertEqual(count_solutions(puzzle, processes=2), 1)
+
+    def test_count_all_solutions(self):
+        puzzle = self._create_puzzle()
+        empty_puzzle = Puzzle.create(level=puzzle.level, number=2, solution='')
+
+        counts = count_all_solutions([puzzle, empty_puzzle], processes=1)
+
+        self.assertEqual(counts[puzzle], 1)
+        self.assertGreater(counts[empty_puzzle], 1)
+
+    def _create_puzzle(self):
+        level = Level.create(number=1, name='test level')
+        puzzle = Puzzle.create(level=level, number=1, solution='')
+
+        light_blue = Noodle.light_blue()
+        light_blue.rotate(increment=3)
+        puzzle.place(light_blue, position=3)
+
+        dark_green = Noodle.dark_green()
+        puzzle.place(dark_green, position=9)
+
+        light_green = Noodle.light_green()
+        light_green.flip()
+        light_green.rotate(increment=3)
+        puzzle.place(light_green, position=15)
+
+        red = Noodle.red()
+        red.rotate()
+        puzzle.place(red, position=20)
+
+        return puzzle
+
+    def setUp(self):
+        super().setUp()
+        for designation, colour, image, parts in data.NOODLES:
+            Noodle.create(designation=designation, colour=colour, image=image,
+                          part1=parts[0], part2=parts[1], part3=parts[2], part4=parts[3])
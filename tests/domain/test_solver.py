@@ -0,0 +1,125 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, pieces, solver
+from kanoodlegenius2d.domain.geometry import Geometry
+
+
+class SolveTest(TestCase):
+
+    def test_solve_empty_board(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+
+        self.assertEqual(sorted(p.designation for p in solution), list('ABCDEFG'))
+        mask = bitboard.EMPTY
+        for placement in solution:
+            self.assertFalse(mask & placement.mask)
+            mask |= placement.mask
+        self.assertEqual(mask, bitboard.FULL)
+
+    def test_solve_partial_board(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        solution = solver.solve(occupied, 'D')
+
+        self.assertEqual(len(solution), 1)
+        self.assertEqual(solution[0].positions, (5, 6, 7, 3, 8))
+
+    def test_solve_unsolvable_board(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([0, 1, 2, 3, 34])
+
+        self.assertIsNone(solver.solve(occupied, 'D'))
+
+    def test_iter_solutions(self):
+        solutions = list(solver.iter_solutions(bitboard.EMPTY, 'ABCDEFG'))
+
+        self.assertEqual(len(solutions), len(set(frozenset(solution) for solution in solutions)))
+        self.assertGreater(len(solutions), 1)
+
+
+class HintTest(TestCase):
+
+    def test_hint_fills_lowest_empty_hole(self):
+        placement = solver.hint(bitboard.to_mask([0, 1]), 'ABCDEFG')
+
+        self.assertIsNone(placement)  # 33 holes can't be filled by 7 noodles
+
+        placement = solver.hint(bitboard.EMPTY, 'ABCDEFG')
+
+        self.assertIn(0, placement.positions)
+
+    def test_hint(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        placement = solver.hint(occupied, 'D')
+
+        self.assertEqual(placement.positions, (5, 6, 7, 3, 8))
+
+    def test_hint_unsolvable(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([0, 1, 2, 3, 34])
+
+        self.assertIsNone(solver.hint(occupied, 'D'))
+
+
+class DeadRegionsTest(TestCase):
+
+    def test_no_dead_regions(self):
+        self.assertEqual(solver.dead_regions(bitboard.EMPTY, 'ABCDEFG'), [])
+
+    def test_region_too_small(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([0, 1, 2, 3, 34])
+
+        self.assertEqual(solver.dead_regions(occupied, 'D'), [bitboard.to_mask([0, 1, 2, 3]), 1 << 34])
+
+    def test_region_noodle_does_not_fit(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([0, 1, 2, 3, 8])
+
+        self.assertEqual(solver.dead_regions(occupied, 'D'), [bitboard.to_mask([0, 1, 2, 3, 8])])
+
+    def test_region_noodle_fits(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        self.assertEqual(solver.dead_regions(occupied, 'D'), [])
+
+
+class CustomSolverTest(TestCase):
+
+    def setUp(self):
+        self.board = Geometry.from_picture('''
+. . . .
+ . . . .
+''')
+        self.piece_set = pieces.PieceSet('test', (
+            pieces.from_picture('I1', '#ffffff', 'x.png', '. . .'),
+            pieces.from_picture('I2', '#ffffff', 'x.png', '. . .'),
+            pieces.from_cells('V', '#ffffff', 'x.png', [(0, 0), (1, 0)]),
+        ))
+
+    def test_solve(self):
+        for prune in (False, True):
+            solution = solver.Solver(self.piece_set, self.board, prune=prune).solve(bitboard.EMPTY, ['I1', 'I2', 'V'])
+
+            self.assertEqual(sorted(p.designation for p in solution), ['I1', 'I2', 'V'])
+            mask = bitboard.EMPTY
+            for placement in solution:
+                self.assertFalse(mask & placement.mask)
+                mask |= placement.mask
+            self.assertEqual(mask, (1 << self.board.count) - 1)
+
+    def test_identical_pieces_searched_once(self):
+        solutions = list(solver.Solver(self.piece_set, self.board).iter_solutions(bitboard.EMPTY,
+                                                                                  ['I1', 'I2', 'V']))
+
+        self.assertEqual(len(solutions), len({frozenset(p.mask for p in solution) for solution in solutions}))
+
+    def test_dead_regions(self):
+        custom = solver.Solver(self.piece_set, self.board)
+        occupied = custom.full & ~bitboard.to_mask([0, 1])
+
+        self.assertEqual(custom.dead_regions(occupied, ['I1']), [bitboard.to_mask([0, 1])])
+        self.assertEqual(custom.dead_regions(occupied, ['I1', 'V']), [])
+
+    def test_unsolvable(self):
+        occupied = bitboard.to_mask([1])
+
+        for prune in (False, True):
+            self.assertIsNone(solver.Solver(self.piece_set, self.board, prune=prune).solve(occupied, ['I1', 'I2']))
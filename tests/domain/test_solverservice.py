@@ -0,0 +1,99 @@
+import threading
+import time
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, solver
+from kanoodlegenius2d.domain.solverservice import (CHECK_INTERVAL,
+                                                   SearchTimeoutException,
+                                                   SolverService)
+
+
+class SolverServiceTest(TestCase):
+
+    def setUp(self):
+        self.service = SolverService()
+        self.results, self.errors, self.progress = [], [], []
+
+    def tearDown(self):
+        self.service.shutdown()
+
+    def wait(self):
+        deadline = time.monotonic() + 10
+        while self.service.poll():
+            self.assertLess(time.monotonic(), deadline, 'Search did not finish')
+            time.sleep(0.01)
+
+    def submit(self, search, **kwargs):
+        return self.service.submit(search, self.results.append, onerror=self.errors.append,
+                                   onprogress=self.progress.append, **kwargs)
+
+    def test_result(self):
+        job = self.submit(lambda check: solver.solve(bitboard.EMPTY, 'ABCDEFG', check=check))
+
+        self.wait()
+
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual(sorted(p.designation for p in self.results[0]), list('ABCDEFG'))
+        self.assertEqual(self.errors, [])
+        self.assertTrue(job.done)
+        self.assertGreater(job.nodes, 0)
+
+    def test_callbacks_run_on_polling_thread(self):
+        threads = []
+        self.service.submit(lambda check: None, lambda _: threads.append(threading.current_thread()))
+
+        self.wait()
+
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_error(self):
+        def search(check):
+            raise ValueError('Failed')
+
+        self.submit(search)
+        self.wait()
+
+        self.assertEqual(self.results, [])
+        self.assertIsInstance(self.errors[0], ValueError)
+
+    def test_timeout_and_progress(self):
+        def search(check):
+            while True:
+                check()
+
+        self.submit(search, timeout=0.05)
+        self.wait()
+
+        self.assertEqual(self.results, [])
+        self.assertIsInstance(self.errors[0], SearchTimeoutException)
+        self.assertGreater(len(self.progress), 0)
+        self.assertEqual(self.progress[0], CHECK_INTERVAL)
+
+    def test_cancel(self):
+        started = threading.Event()
+
+        def search(check):
+            started.set()
+            while True:
+                check()
+
+        job = self.submit(search)
+        started.wait(5)
+        job.cancel()
+        self.wait()
+
+        self.assertTrue(job.cancelled)
+        self.assertTrue(job.done)
+        self.assertEqual(self.results, [])
+        self.assertEqual(self.errors, [])
+
+    def test_cancel_before_start(self):
+        release = threading.Event()
+        self.submit(lambda check: release.wait(5))
+        job = self.submit(lambda check: 'never')
+
+        job.cancel()
+        release.set()
+        self.wait()
+
+        self.assertEqual(self.results, [True])
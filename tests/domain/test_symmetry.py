@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, holes, orientation, placements, solver, symmetry, zobrist
+
+
+class AutomorphismTest(TestCase):
+
+    def test_automorphisms(self):
+        self.assertEqual(len(symmetry.AUTOMORPHISMS), 4)
+        self.assertEqual(symmetry.IDENTITY.permutation, tuple(range(35)))
+
+    def test_automorphisms_preserve_neighbours(self):
+        for automorphism in symmetry.AUTOMORPHISMS:
+            for position in range(35):
+                for name in orientation.NAMES:
+                    neighbour = holes.find_position(position, name)
+                    mapped = holes.find_position(automorphism.permutation[position],
+                                                 orientation.transform((name,), automorphism.transform)[0])
+                    if neighbour is None:
+                        self.assertIsNone(mapped)
+                    else:
+                        self.assertEqual(mapped, automorphism.permutation[neighbour])
+
+    def test_inverse(self):
+        for automorphism in symmetry.AUTOMORPHISMS:
+            mask = bitboard.to_mask([0, 5, 17])
+            self.assertEqual(symmetry.map_mask(symmetry.inverse(automorphism), symmetry.map_mask(automorphism, mask)),
+                             mask)
+
+    def test_map_mask(self):
+        mirror = next(a for a in symmetry.AUTOMORPHISMS if a.permutation[0] == 3)
+
+        self.assertEqual(symmetry.map_mask(mirror, bitboard.to_mask([0, 1])), bitboard.to_mask([2, 3]))
+
+    def test_map_placement(self):
+        for automorphism in symmetry.AUTOMORPHISMS:
+            for placement in placements.get('D'):
+                mapped = symmetry.map_placement(automorphism, placement)
+                self.assertEqual(mapped.mask, symmetry.map_mask(automorphism, placement.mask))
+
+
+class CanonicalTest(TestCase):
+
+    def test_canonical_mask(self):
+        mask = bitboard.to_mask([34])
+
+        canonical, automorphism = symmetry.canonical_mask(mask)
+
+        self.assertEqual(canonical, bitboard.to_mask([0]))
+        self.assertEqual(symmetry.map_mask(automorphism, mask), canonical)
+
+    def test_symmetric_states_share_canonical_hash(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+        mirror = symmetry.AUTOMORPHISMS[1]
+        mirrored = [symmetry.map_placement(mirror, placement) for placement in solution[:3]]
+
+        def hashes(placements_):
+            result = [zobrist.EMPTY] * len(symmetry.AUTOMORPHISMS)
+            for placement in placements_:
+                result = [h ^ k for h, k in zip(result, symmetry.keys(placement))]
+            return result
+
+        self.assertEqual(symmetry.canonical(hashes(solution[:3]))[0], symmetry.canonical(hashes(mirrored))[0])
+        self.assertEqual(hashes(solution[:3])[0], zobrist.hash_placements(solution[:3]))
+
+    def test_stabilizer(self):
+        self.assertEqual(symmetry.stabilizer(bitboard.EMPTY), symmetry.AUTOMORPHISMS)
+        self.assertEqual(symmetry.stabilizer(bitboard.to_mask([0])), (symmetry.IDENTITY,))
+
+
+class CountSolutionsTest(TestCase):
+
+    def test_count_solutions_empty_board(self):
+        self.assertEqual(symmetry.count_solutions(bitboard.EMPTY, 'ABCDEFG'),
+                         sum(1 for _ in solver.iter_solutions(bitboard.EMPTY, 'ABCDEFG')))
+
+    def test_count_solutions_partial_board(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        self.assertEqual(symmetry.count_solutions(occupied, 'D'), 1)
+
+    def test_branches_weights(self):
+        self.assertEqual(sum(weight for weight, _, _ in symmetry.branches(bitboard.EMPTY, 'ABCDEFG')),
+                         len(placements.get('A')))
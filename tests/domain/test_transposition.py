@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, transposition
+from kanoodlegenius2d.domain.transposition import Entry, TranspositionCache
+
+
+class TranspositionCacheTest(TestCase):
+
+    def test_put_and_get(self):
+        cache = TranspositionCache(maxsize=2)
+
+        cache.put(1, solvable=True)
+        cache.put(1, count=3)
+
+        self.assertEqual(cache.get(1), Entry(solvable=True, move=None, count=3))
+        self.assertIsNone(cache.get(2))
+
+    def test_evicts_least_recently_used(self):
+        cache = TranspositionCache(maxsize=2)
+        cache.put(1, solvable=True)
+        cache.put(2, solvable=True)
+        cache.get(1)
+
+        cache.put(3, solvable=False)
+
+        self.assertIsNotNone(cache.get(1))
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.stats().evictions, 1)
+        self.assertEqual(cache.stats().size, 2)
+
+
+class TranspositionTest(TestCase):
+
+    def setUp(self):
+        transposition.clear()
+
+    def test_hint(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        first = transposition.hint(1, occupied, 'D')
+        second = transposition.hint(1, occupied, 'D')
+
+        self.assertEqual(first.positions, (5, 6, 7, 3, 8))
+        self.assertIs(first, second)
+        self.assertEqual(transposition.stats()[:2], (1, 1))
+
+    def test_hint_unsolvable(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([0, 1, 2, 3, 34])
+
+        self.assertIsNone(transposition.hint(1, occupied, 'D'))
+        self.assertIsNone(transposition.hint(1, occupied, 'D'))
+        self.assertFalse(transposition.solvable(1, occupied, 'D'))
+        self.assertEqual(transposition.stats().hits, 2)
+
+    def test_count(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        self.assertEqual(transposition.count(1, occupied, 'D'), 1)
+        self.assertEqual(transposition.count(1, occupied, 'D'), 1)
+        self.assertTrue(transposition.solvable(1, occupied, 'D'))
+        self.assertEqual(transposition.stats()[:2], (2, 1))
+
+    def test_hint_after_count(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+        transposition.count(1, occupied, 'D')
+
+        self.assertEqual(transposition.hint(1, occupied, 'D').positions, (5, 6, 7, 3, 8))
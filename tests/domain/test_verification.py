@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, data
+from kanoodlegenius2d.domain.models import Level, Noodle, Puzzle, PuzzleNoodle
+from kanoodlegenius2d.domain.verification import check, parse_solution, verify_all
+from tests.domain.common import ModelTestCase
+
+
+class ParseSolutionTest(TestCase):
+
+    def test_parse_solution(self):
+        self.assertEqual(parse_solution('3,32,E,E,NE,NE;6,29,NE,NW,E,NE'),
+                         [('C', 32, ('E', 'E', 'NE', 'NE')), ('F', 29, ('NE', 'NW', 'E', 'NE'))])
+
+    def test_parse_empty_solution(self):
+        self.assertEqual(parse_solution(''), [])
+
+    def test_parse_malformed_solution(self):
+        with self.assertRaises(ValueError):
+            parse_solution('3,32,E,E,NE')
+
+    def test_parse_unknown_noodle(self):
+        with self.assertRaises(ValueError):
+            parse_solution('8,32,E,E,NE,NE')
+
+
+class CheckTest(TestCase):
+
+    def test_valid(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        self.assertEqual(check(occupied, 'D', '4,5,E,E,NE,SE'), [])
+
+    def test_off_board(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        self.assertEqual(check(occupied, 'D', '4,0,E,E,NE,SE'),
+                         ['Noodle D at position 0 does not fit on the board',
+                          'Position(s) 3, 5, 6, 7, 8 are not filled'])
+
+    def test_overlap(self):
+        occupied = bitboard.FULL & ~bitboard.to_mask([5, 6, 7, 3, 8])
+
+        self.assertEqual(check(occupied, 'D', '4,4,E,E,NE,SE')[0], 'Noodle D at position 4 overlaps position(s) 2, 4')
+
+    def test_noodle_used_twice(self):
+        self.assertIn('Noodle D is already on the board',
+                      check(bitboard.EMPTY, 'D', '4,5,E,E,NE,SE;4,5,E,E,NE,SE'))
+
+    def test_noodle_not_placed(self):
+        self.assertIn('Noodle(s) A are not placed', check(bitboard.EMPTY, 'AD', '4,5,E,E,NE,SE'))
+
+
+class VerifyAllTest(ModelTestCase):
+
+    requires = (Level, Puzzle, PuzzleNoodle, Noodle)
+
+    def test_verify_all(self):
+        level = Level.create(number=1, name='test level')
+        valid = Puzzle.create(level=level, number=1, solution='3,32,E,E,NE,NE;6,29,NE,NW,E,NE;2,17,NE,E,NW,E')
+        invalid = Puzzle.create(level=level, number=2, solution='3,32,E,E,NE,NE;6,29,NE,NW,E,NE')
+
+        for puzzle in (valid, invalid):
+            light_blue = Noodle.light_blue()
+            light_blue.rotate(increment=3)
+            puzzle.place(light_blue, position=3)
+            puzzle.place(Noodle.dark_green(), position=9)
+            light_green = Noodle.light_green()
+            light_green.flip()
+            light_green.rotate(increment=3)
+            puzzle.place(light_green, position=15)
+            red = Noodle.red()
+            red.rotate()
+            puzzle.place(red, position=20)
+
+        results = verify_all([valid, invalid])
+
+        self.assertEqual(results[valid], [])
+        self.assertEqual(results[invalid], ['Noodle(s) B are not placed',
+                                            'Position(s) 7, 8, 12, 13, 17 are not filled'])
+
+    def setUp(self):
+        super().setUp()
+        for designation, colour, image, parts in data.NOODLES:
+            Noodle.create(designation=designation, colour=colour, image=image,
+                          part1=parts[0], part2=parts[1], part3=parts[2], part4=parts[3])
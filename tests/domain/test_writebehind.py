@@ -0,0 +1,135 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from peewee import SqliteDatabase
+
+from kanoodlegenius2d.domain.writebehind import BATCH_SIZE, WriteFailedException, Writer
+
+
+class WriterTest(TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.database = SqliteDatabase(self.path)
+        self.database.execute_sql('CREATE TABLE move (number INTEGER)')
+        self.writer = Writer(self.database, interval=60)
+
+    def tearDown(self):
+        self.writer.shutdown()
+        self.database.close()
+        os.remove(self.path)
+
+    def write(self, number):
+        return lambda: self.database.execute_sql('INSERT INTO move (number) VALUES (?)', (number,))
+
+    def moves(self):
+        return [row[0] for row in self.database.execute_sql('SELECT number FROM move ORDER BY rowid')]
+
+    def test_held_until_flushed(self):
+        for number in range(3):
+            self.writer.submit(self.write(number))
+
+        self.assertEqual(self.moves(), [])
+        self.assertEqual(self.writer.pending, 3)
+
+        self.writer.flush()
+
+        self.assertEqual(self.moves(), [0, 1, 2])
+        self.assertEqual(self.writer.pending, 0)
+
+    def test_written_after_interval(self):
+        self.writer = Writer(self.database, interval=0.01)
+        self.writer.submit(self.write(1))
+
+        deadline = time.monotonic() + 10
+        while self.writer.pending:
+            self.assertLess(time.monotonic(), deadline, 'Write was not made')
+            time.sleep(0.01)
+
+        self.assertEqual(self.moves(), [1])
+
+    def test_written_when_batch_full(self):
+        for number in range(BATCH_SIZE):
+            self.writer.submit(self.write(number))
+
+        deadline = time.monotonic() + 10
+        while self.writer.pending:
+            self.assertLess(time.monotonic(), deadline, 'Batch was not written')
+            time.sleep(0.01)
+
+        self.assertEqual(self.moves(), list(range(BATCH_SIZE)))
+
+    def test_failed_batch_held_until_written(self):
+        """Test that a batch that fails is tried again, and that nothing after it is written until it has been."""
+        broken = True
+
+        def write_unless_broken():
+            if broken:
+                raise ValueError('Failed')
+            self.write(2)()
+
+        self.writer.submit(self.write(1))
+        self.writer.submit(write_unless_broken)
+        with self.assertLogs('kanoodlegenius2d.domain.writebehind'), self.assertRaises(WriteFailedException):
+            self.writer.flush()
+
+        self.assertEqual(self.moves(), [])
+        self.assertEqual(self.writer.pending, 2)
+
+        self.writer.submit(self.write(3))
+        with self.assertLogs('kanoodlegenius2d.domain.writebehind'), self.assertRaises(WriteFailedException):
+            self.writer.flush()
+
+        self.assertEqual(self.moves(), [])
+        self.assertEqual(self.writer.pending, 3)
+
+        broken = False
+        self.writer.flush()
+
+        self.assertEqual(self.moves(), [1, 2, 3])
+        self.assertEqual(self.writer.pending, 0)
+
+    def test_shutdown_raises_when_batch_fails(self):
+        broken = True
+
+        def write_unless_broken():
+            if broken:
+                raise ValueError('Failed')
+            self.write(1)()
+
+        self.writer.submit(write_unless_broken)
+        with self.assertLogs('kanoodlegenius2d.domain.writebehind'), self.assertRaises(WriteFailedException):
+            self.writer.shutdown()
+
+        self.assertEqual(self.moves(), [])
+
+        broken = False
+        self.writer.flush()
+
+        self.assertEqual(self.moves(), [1])
+
+    def test_shutdown_writes_pending(self):
+        self.writer.submit(self.write(1))
+
+        self.writer.shutdown()
+
+        self.assertEqual(self.moves(), [1])
+
+        # Starts again when next used
+        self.writer.submit(self.write(2))
+        self.writer.flush()
+
+        self.assertEqual(self.moves(), [1, 2])
+
+    def test_in_memory_database_written_immediately(self):
+        database = SqliteDatabase(':memory:')
+        database.execute_sql('CREATE TABLE move (number INTEGER)')
+        writer = Writer(database)
+
+        writer.submit(lambda: database.execute_sql('INSERT INTO move (number) VALUES (1)'))
+
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(database.execute_sql('SELECT COUNT(*) FROM move').fetchone()[0], 1)
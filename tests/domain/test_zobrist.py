@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from kanoodlegenius2d.domain import bitboard, placements, solver, zobrist
+
+
+class ZobristTest(TestCase):
+
+    def test_keys_distinct(self):
+        keys = {zobrist.key(placement) for designation in 'ABCDEFG' for placement in placements.get(designation)}
+
+        self.assertEqual(len(keys), sum(len(placements.get(designation)) for designation in 'ABCDEFG'))
+
+    def test_hash_is_order_independent(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+
+        self.assertEqual(zobrist.hash_placements(solution), zobrist.hash_placements(reversed(solution)))
+
+    def test_hash_incremental(self):
+        solution = solver.solve(bitboard.EMPTY, 'ABCDEFG')
+
+        hash_ = zobrist.hash_placements(solution[:3]) ^ zobrist.key(solution[3])
+
+        self.assertEqual(hash_, zobrist.hash_placements(solution[:4]))
+        self.assertEqual(hash_ ^ zobrist.key(solution[3]), zobrist.hash_placements(solution[:3]))
+
+    def test_empty(self):
+        self.assertEqual(zobrist.hash_placements([]), zobrist.EMPTY)